@@ -136,6 +136,8 @@ class EmotionistantConsultancy(BaseModel):
     id: str = Field(default_factory=uuid.uuid4, alias="_id")
     chat: list[Message] = Field(default=list())
     consulted_on: str = Field(default_factory=DateTimeHelper.get_current_iso_datetime, alias="consultedOn")
+    summary: str | None = Field(default=None)
+    summarized_count: int = Field(default=0, alias="summarizedCount")
 
 
 class Subject(BaseModel):
@@ -232,3 +234,15 @@ class BasicRememberMe(BaseModel):
 class SubjectRememberMe(BaseModel):
     basic_remember_me: BasicRememberMe = Field(alias="basicRememberMe")
     sub_auth_key: str = Field(alias="subAuthKey")
+
+
+class SessionToken(BaseModel):
+    token: str
+    token_type: str = Field(default="bearer", alias="tokenType")
+    expires_in: int = Field(alias="expiresIn")
+
+
+class IngestReceipt(BaseModel):
+    accepted: int
+    buffered: int
+    committed: int | None = None
@@ -0,0 +1,102 @@
+import numpy as np
+
+from entity.emotion import EmotionExpression
+
+
+class EmotionFrame:
+    EXPRESSIONS = [emotion.value for emotion in EmotionExpression]
+    EXPRESSION_CODES = {expression: code for code, expression in enumerate(EXPRESSIONS)}
+
+    def __init__(self, recorded_on: np.ndarray, expressions: np.ndarray, accuracies: np.ndarray,
+                 arousals: np.ndarray, valences: np.ndarray, sentimental: np.ndarray) -> None:
+        self.__recorded_on = recorded_on
+        self.__expressions = expressions
+        self.__accuracies = accuracies
+        self.__arousals = arousals
+        self.__valences = valences
+        self.__sentimental = sentimental
+
+    @property
+    def recorded_on(self) -> np.ndarray:
+        return self.__recorded_on
+
+    @property
+    def expressions(self) -> np.ndarray:
+        return self.__expressions
+
+    @property
+    def accuracies(self) -> np.ndarray:
+        return self.__accuracies
+
+    @property
+    def arousals(self) -> np.ndarray:
+        return self.__arousals
+
+    @property
+    def valences(self) -> np.ndarray:
+        return self.__valences
+
+    @property
+    def sentimental(self) -> np.ndarray:
+        return self.__sentimental
+
+    def __len__(self) -> int:
+        return len(self.expressions)
+
+    @staticmethod
+    def from_columns(recorded_on: list, expressions: list, accuracies: list, arousals: list, valences: list,
+                     sentimental: list) -> "EmotionFrame":
+        return EmotionFrame(
+            np.array(recorded_on, dtype="datetime64[us]").astype(np.int64),
+            np.array([EmotionFrame.EXPRESSION_CODES[expression] for expression in expressions], dtype=np.uint8),
+            np.array(accuracies, dtype=np.float32),
+            np.array(arousals, dtype=np.float32),
+            np.array(valences, dtype=np.float32),
+            np.array(sentimental, dtype=bool)
+        )
+
+    @staticmethod
+    def from_documents(documents: list[dict]) -> "EmotionFrame":
+        return EmotionFrame.from_columns(
+            [document["recordedOn"] for document in documents],
+            [document["expression"] for document in documents],
+            [document.get("accuracy", 100) for document in documents],
+            [document["arousal"] for document in documents],
+            [document["valence"] for document in documents],
+            ["specialConsiderationMessage" in document for document in documents]
+        )
+
+    @staticmethod
+    def empty() -> "EmotionFrame":
+        return EmotionFrame.from_columns([], [], [], [], [], [])
+
+    def select(self, mask: np.ndarray) -> "EmotionFrame":
+        return EmotionFrame(
+            self.recorded_on[mask],
+            self.expressions[mask],
+            self.accuracies[mask],
+            self.arousals[mask],
+            self.valences[mask],
+            self.sentimental[mask]
+        )
+
+    def group_by(self, keys: list) -> dict:
+        group_keys, inverse = np.unique(np.asarray(keys, dtype=str), return_inverse=True)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.cumsum(np.bincount(inverse, minlength=len(group_keys)))[:-1]
+        return {str(key): self.select(indices) for key, indices in zip(group_keys, np.split(order, bounds))}
+
+    @staticmethod
+    def analyze_sums(sums: np.ndarray) -> tuple[dict, str]:
+        tally = np.rint(sums[0])
+        avg_arousals = np.divide(sums[1], tally, out=np.zeros(len(tally)), where=tally > 0)
+        avg_valences = np.divide(sums[2], tally, out=np.zeros(len(tally)), where=tally > 0)
+        emotion_engagement = {
+            expression: {
+                "tally": int(tally[code]),
+                "avg_aro": float(avg_arousals[code]),
+                "avg_val": float(avg_valences[code])
+            }
+            for code, expression in enumerate(EmotionFrame.EXPRESSIONS)
+        }
+        return emotion_engagement, EmotionFrame.EXPRESSIONS[int(np.argmax(tally))]
@@ -0,0 +1,61 @@
+import numpy as np
+
+from helper.analytics.numpy.emotion_frame import EmotionFrame
+
+
+class EmotionWindow:
+    def __init__(self, span: int, slot: int) -> None:
+        self.__span = span
+        self.__slot = slot
+        self.__slots = {}
+        self.__oldest = None
+        self.__totals = np.zeros((2, 3, len(EmotionFrame.EXPRESSIONS)))
+
+    @property
+    def span(self) -> int:
+        return self.__span
+
+    @property
+    def slot(self) -> int:
+        return self.__slot
+
+    def expire(self, now: int):
+        cutoff = now - self.span
+
+        if self.__oldest is None or self.__oldest + self.slot > cutoff:
+            return
+        for slot_start in [slot_start for slot_start in self.__slots if slot_start + self.slot <= cutoff]:
+            self.__totals -= self.__slots.pop(slot_start)
+        self.__oldest = min(self.__slots, default=None)
+
+    def add(self, frame: EmotionFrame, now: int):
+        self.expire(now)
+        latest = frame.recorded_on >= now - self.span
+        if not latest.any():
+            return
+
+        num_expressions = len(EmotionFrame.EXPRESSIONS)
+        slot_starts, slot_indices = np.unique(frame.recorded_on[latest] // self.slot * self.slot, return_inverse=True)
+        indices = (slot_indices * 2 + frame.sentimental[latest]) * num_expressions + frame.expressions[latest]
+        size = len(slot_starts) * 2 * num_expressions
+        sums = np.stack([
+            np.bincount(indices, minlength=size).astype(np.float64),
+            np.bincount(indices, weights=frame.arousals[latest], minlength=size),
+            np.bincount(indices, weights=frame.valences[latest], minlength=size)
+        ]).reshape(3, len(slot_starts), 2, num_expressions).transpose(1, 2, 0, 3)
+
+        for slot_start, slot_sums in zip(slot_starts.tolist(), sums):
+            if slot_start in self.__slots:
+                self.__slots[slot_start] += slot_sums
+            else:
+                self.__slots[slot_start] = slot_sums.copy()
+        self.__totals += sums.sum(axis=0)
+        self.__oldest = min(self.__slots)
+
+    def count(self, sentimental: bool, now: int) -> int:
+        self.expire(now)
+        return int(np.rint(self.__totals[int(sentimental)][0].sum()))
+
+    def analyze(self, sentimental: bool, now: int) -> tuple[dict, str]:
+        self.expire(now)
+        return EmotionFrame.analyze_sums(self.__totals[int(sentimental)])
@@ -0,0 +1,49 @@
+class QuantileSketch:
+    LOWER = -100
+    UPPER = 100
+    BIN_WIDTH = 1
+    NUM_BINS = (UPPER - LOWER) // BIN_WIDTH
+
+    def __init__(self, bins: dict[int, int] = None) -> None:
+        self.__bins = bins or {}
+
+    @staticmethod
+    def from_bins(bins: dict) -> "QuantileSketch":
+        return QuantileSketch({int(index): count for index, count in bins.items() if count})
+
+    @staticmethod
+    def get_bin(value: float) -> int:
+        index = int((value - QuantileSketch.LOWER) // QuantileSketch.BIN_WIDTH)
+        return min(max(index, 0), QuantileSketch.NUM_BINS - 1)
+
+    @property
+    def bins(self) -> dict[int, int]:
+        return self.__bins
+
+    @property
+    def count(self) -> int:
+        return sum(self.__bins.values())
+
+    def add(self, value: float):
+        index = QuantileSketch.get_bin(value)
+        self.__bins[index] = self.__bins.get(index, 0) + 1
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        for index, count in other.bins.items():
+            self.__bins[index] = self.__bins.get(index, 0) + count
+        return self
+
+    def quantile(self, percentile: float) -> float | None:
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"invalid percentile: {percentile}")
+        if not (count := self.count):
+            return None
+        rank = percentile / 100 * count
+        cumulative = 0
+
+        for index in sorted(self.__bins):
+            if cumulative + self.__bins[index] >= rank:
+                fraction = (rank - cumulative) / self.__bins[index]
+                return QuantileSketch.LOWER + (index + fraction) * QuantileSketch.BIN_WIDTH
+            cumulative += self.__bins[index]
+        return QuantileSketch.UPPER
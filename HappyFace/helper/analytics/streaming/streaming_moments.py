@@ -0,0 +1,49 @@
+import math
+
+
+class StreamingMoments:
+    def __init__(self, count: int = 0, mean: float = 0, m2: float = 0) -> None:
+        self.__count = count
+        self.__mean = mean
+        self.__m2 = m2
+
+    @staticmethod
+    def from_sums(count: int, total: float, total_sq: float) -> "StreamingMoments":
+        if not count:
+            return StreamingMoments()
+        return StreamingMoments(count, total / count, max(total_sq - total * total / count, 0))
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    @property
+    def mean(self) -> float:
+        return self.__mean
+
+    @property
+    def m2(self) -> float:
+        return self.__m2
+
+    @property
+    def variance(self) -> float:
+        return self.__m2 / self.__count if self.__count else 0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def add(self, value: float):
+        self.__count += 1
+        delta = value - self.__mean
+        self.__mean += delta / self.__count
+        self.__m2 += delta * (value - self.__mean)
+
+    def merge(self, other: "StreamingMoments") -> "StreamingMoments":
+        if other.count:
+            count = self.__count + other.count
+            delta = other.mean - self.__mean
+            self.__mean += delta * other.count / count
+            self.__m2 += other.m2 + delta * delta * self.__count * other.count / count
+            self.__count = count
+        return self
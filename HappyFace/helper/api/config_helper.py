@@ -6,4 +6,19 @@ class ConfigHelper:
     SUBJECT_PROFILES_TO_RECOMMENDATION = f"{EMOTIONISTANT_BASE_URL}/recommendation"
     SUBJECT_INIT_CONSULTANCY = f"{EMOTIONISTANT_BASE_URL}/init-consultancy"
     SUBJECT_QUERY_CONSULTANCY = f"{EMOTIONISTANT_BASE_URL}/query-consultancy"
+    SUBJECT_STREAM_QUERY_CONSULTANCY = f"{EMOTIONISTANT_BASE_URL}/query-consultancy/stream"
     SUBJECT_SPECIAL_CONSIDERATION_INQUIRY = f"{SCEI_BASE_URL}/inquiry"
+    BASE_URLS = [SCEI_BASE_URL, EMOTIONISTANT_BASE_URL]
+    NON_IDEMPOTENT_URLS = {
+        SUBJECT_INIT_CONSULTANCY,
+        SUBJECT_QUERY_CONSULTANCY,
+        SUBJECT_STREAM_QUERY_CONSULTANCY,
+        SUBJECT_SPECIAL_CONSIDERATION_INQUIRY
+    }
+    READ_TIMEOUTS = {
+        SUBJECT_PROFILE_SUMMARIZE_ENDPOINT: 60,
+        SUBJECT_PROFILES_TO_RECOMMENDATION: 60,
+        SUBJECT_INIT_CONSULTANCY: 60,
+        SUBJECT_QUERY_CONSULTANCY: 60,
+        SUBJECT_STREAM_QUERY_CONSULTANCY: 60
+    }
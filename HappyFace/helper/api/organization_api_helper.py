@@ -10,7 +10,7 @@ class OrganizationApiHelper:
             "orgKey": org_key
         }
 
-        if emotions := RequestHelper.perform_request(HttpRequest.POST, url, data):
+        if emotions := RequestHelper.perform_request(HttpRequest.POST, url, data, strict=True):
             return emotions
 
     @staticmethod
@@ -20,5 +20,5 @@ class OrganizationApiHelper:
             "orgKey": org_key
         }
 
-        if deletion := RequestHelper.perform_request(HttpRequest.DELETE, url, data):
+        if deletion := RequestHelper.perform_request(HttpRequest.DELETE, url, data, strict=True):
             return deletion
@@ -1,7 +1,10 @@
+import random
+import time
 from enum import Enum
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class HttpRequest(Enum):
@@ -12,18 +15,93 @@ class HttpRequest(Enum):
 
 
 class RequestHelper:
+    METHODS = {
+        HttpRequest.GET: "GET",
+        HttpRequest.POST: "POST",
+        HttpRequest.PUT: "PUT",
+        HttpRequest.DELETE: "DELETE"
+    }
+    RETRY_STATUSES = {502, 503, 504}
+    __sessions = {}
+    __read_timeouts = {}
+    __non_idempotent_urls = set()
+    __connect_timeout = None
+    __read_timeout = None
+    __max_retries = 0
+    __retry_backoff = 0
+
+    @staticmethod
+    def open(base_urls: list[str], pool_size: int, connect_timeout: float, read_timeout: float,
+             read_timeouts: dict[str, float], non_idempotent_urls: set[str], max_retries: int,
+             retry_backoff: float):
+        for base_url in base_urls:
+            session = requests.Session()
+            session.mount(base_url, HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+            RequestHelper.__sessions[base_url] = session
+        RequestHelper.__connect_timeout = connect_timeout
+        RequestHelper.__read_timeout = read_timeout
+        RequestHelper.__read_timeouts = read_timeouts
+        RequestHelper.__non_idempotent_urls = non_idempotent_urls
+        RequestHelper.__max_retries = max_retries
+        RequestHelper.__retry_backoff = retry_backoff
+
+    @staticmethod
+    def close():
+        for session in RequestHelper.__sessions.values():
+            session.close()
+        RequestHelper.__sessions = {}
+
+    @staticmethod
+    def get_session(url: str) -> requests.Session | None:
+        for base_url, session in RequestHelper.__sessions.items():
+            if url.startswith(base_url):
+                return session
+
+    @staticmethod
+    def is_idempotent(request: HttpRequest, url: str) -> bool:
+        return request != HttpRequest.POST or url not in RequestHelper.__non_idempotent_urls
+
+    @staticmethod
+    def send(request: HttpRequest, url: str, data: dict = None, params: dict = None) -> requests.Response:
+        session = RequestHelper.get_session(url) or requests
+        read_timeout = RequestHelper.__read_timeouts.get(url, RequestHelper.__read_timeout)
+        timeout = (RequestHelper.__connect_timeout, read_timeout)
+        idempotent = RequestHelper.is_idempotent(request, url)
+        retry_errors = (requests.ConnectionError, requests.ConnectTimeout) if idempotent else requests.ConnectTimeout
+
+        for attempt in range(RequestHelper.__max_retries + 1):
+            try:
+                response = session.request(RequestHelper.METHODS[request], url, params=params, json=data,
+                                           timeout=timeout)
+                retryable = idempotent and response.status_code in RequestHelper.RETRY_STATUSES
+                if not retryable or attempt == RequestHelper.__max_retries:
+                    return response
+            except retry_errors:
+                if attempt == RequestHelper.__max_retries:
+                    raise
+            time.sleep(random.uniform(0, RequestHelper.__retry_backoff * 2 ** attempt))
+
+    @staticmethod
+    def open_stream(request: HttpRequest, url: str, data: dict = None, params: dict = None) -> requests.Response:
+        session = RequestHelper.get_session(url) or requests
+        read_timeout = RequestHelper.__read_timeouts.get(url, RequestHelper.__read_timeout)
+        response = session.request(RequestHelper.METHODS[request], url, params=params, json=data, stream=True,
+                                   timeout=(RequestHelper.__connect_timeout, read_timeout))
+
+        if response.status_code != 200:
+            response.close()
+            response.raise_for_status()
+        response.encoding = response.encoding or "utf-8"
+        return response
+
     @staticmethod
-    def perform_request(request: HttpRequest, url: str, data: dict = None, params: dict = None) -> Any | None:
-        if request == HttpRequest.GET:
-            response = requests.get(url, params=params)
-        elif request == HttpRequest.POST:
-            response = requests.post(url, params=params, json=data)
-        elif request == HttpRequest.PUT:
-            response = requests.put(url, params=params, json=data)
-        else:
-            response = requests.delete(url, params=params, json=data)
+    def perform_request(request: HttpRequest, url: str, data: dict = None, params: dict = None,
+                        strict: bool = False) -> Any | None:
+        response = RequestHelper.send(request, url, data, params)
 
         if response.status_code == 200:
             response = response.json()
 
             return response
+        if strict and response.status_code != 404:
+            response.raise_for_status()
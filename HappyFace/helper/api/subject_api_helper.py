@@ -1,3 +1,5 @@
+from requests import Response
+
 from helper.api.config_helper import ConfigHelper
 from helper.api.request_helper import RequestHelper, HttpRequest
 
@@ -50,6 +52,20 @@ class SubjectApiHelper:
         if consultation := RequestHelper.perform_request(HttpRequest.POST, url, data):
             return consultation
 
+    @staticmethod
+    def stream_query_consultancy(query: str, organization_name: str, employee_id: str, profile_recommendation: str,
+                                 chat_history: list) -> Response:
+        url = ConfigHelper.SUBJECT_STREAM_QUERY_CONSULTANCY
+        data = {
+            "query": query,
+            "organizationName": organization_name,
+            "employeeId": employee_id,
+            "profileRecommendation": profile_recommendation,
+            "chatHistory": chat_history
+        }
+
+        return RequestHelper.open_stream(HttpRequest.POST, url, data)
+
     @staticmethod
     def request_for_special_consideration_inquiry(request_message: str, org_key: str, subject_id: str) -> dict | None:
         url = ConfigHelper.SUBJECT_SPECIAL_CONSIDERATION_INQUIRY
@@ -0,0 +1,90 @@
+import struct
+from datetime import datetime
+
+import numpy as np
+
+from entity.emotion import EmotionExpression
+from helper.datetime.date_time_helper import DateTimeHelper
+
+
+class PackedEmotionCodec:
+    CONTENT_TYPE = "application/vnd.happyface.emotions"
+    MAGIC = b"HFE1"
+    EXPRESSIONS = [emotion.value for emotion in EmotionExpression]
+    MIN_EPOCH = DateTimeHelper.to_epoch(datetime.min)
+    MAX_EPOCH = DateTimeHelper.to_epoch(datetime.max)
+    READING = np.dtype([
+        ("uri", "<u2"),
+        ("recordedOn", "<i8"),
+        ("expression", "u1"),
+        ("accuracy", "<f4"),
+        ("arousal", "<f4"),
+        ("valence", "<f4")
+    ])
+
+    @staticmethod
+    def is_packed(content_type: str | None) -> bool:
+        return (content_type or "").split(";")[0].strip().lower() == PackedEmotionCodec.CONTENT_TYPE
+
+    @staticmethod
+    def encode(face_snap_dir_uris: list[str], readings: list[tuple]) -> bytes:
+        header = [PackedEmotionCodec.MAGIC, struct.pack("<H", len(face_snap_dir_uris))]
+        for face_snap_dir_uri in face_snap_dir_uris:
+            encoded_uri = face_snap_dir_uri.encode()
+            header.append(struct.pack("<H", len(encoded_uri)) + encoded_uri)
+        header.append(struct.pack("<I", len(readings)))
+        return b"".join(header) + np.array(readings, dtype=PackedEmotionCodec.READING).tobytes()
+
+    @staticmethod
+    def decode(data: bytes) -> list[tuple[str, dict]]:
+        try:
+            if data[:4] != PackedEmotionCodec.MAGIC:
+                raise ValueError("invalid packed emotion header")
+            (num_uris,), offset = struct.unpack_from("<H", data, 4), 6
+            face_snap_dir_uris = []
+
+            for _ in range(num_uris):
+                (uri_size,), offset = struct.unpack_from("<H", data, offset), offset + 2
+                face_snap_dir_uris.append(data[offset:offset + uri_size].decode())
+                offset += uri_size
+            (num_readings,), offset = struct.unpack_from("<I", data, offset), offset + 4
+        except (struct.error, UnicodeDecodeError) as e:
+            raise ValueError("invalid packed emotion header") from e
+
+        if len(data) - offset != num_readings * PackedEmotionCodec.READING.itemsize:
+            raise ValueError("invalid packed emotion size")
+        readings = np.frombuffer(data, dtype=PackedEmotionCodec.READING, count=num_readings, offset=offset)
+
+        if (readings["uri"] >= num_uris).any():
+            raise ValueError("invalid packed emotion uri")
+        if (readings["expression"] >= len(PackedEmotionCodec.EXPRESSIONS)).any():
+            raise ValueError("invalid packed emotion expression")
+        for field in ("arousal", "valence"):
+            if not ((readings[field] >= -100) & (readings[field] <= 100)).all():
+                raise ValueError(f"invalid packed emotion {field}")
+        if not ((readings["recordedOn"] >= PackedEmotionCodec.MIN_EPOCH) &
+                (readings["recordedOn"] <= PackedEmotionCodec.MAX_EPOCH)).all():
+            raise ValueError("invalid packed emotion recordedOn")
+        if not np.isfinite(readings["accuracy"]).all():
+            raise ValueError("invalid packed emotion accuracy")
+
+        return [
+            (
+                face_snap_dir_uris[uri],
+                {
+                    "expression": PackedEmotionCodec.EXPRESSIONS[expression],
+                    "accuracy": accuracy,
+                    "arousal": arousal,
+                    "valence": valence,
+                    "recordedOn": DateTimeHelper.from_epoch(recorded_on)
+                }
+            )
+            for uri, recorded_on, expression, accuracy, arousal, valence in zip(
+                readings["uri"].tolist(),
+                readings["recordedOn"].tolist(),
+                readings["expression"].tolist(),
+                readings["accuracy"].tolist(),
+                readings["arousal"].tolist(),
+                readings["valence"].tolist()
+            )
+        ]
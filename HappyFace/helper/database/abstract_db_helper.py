@@ -9,3 +9,23 @@ class AbstractDbHelper(ABC):
     @abstractmethod
     def get_disconnected(self, log_helper):
         pass
+
+    @abstractmethod
+    def find_one(self, condition, project_vals, collection):
+        pass
+
+    @abstractmethod
+    def find_all(self, condition, project_vals, sort, collection):
+        pass
+
+    @abstractmethod
+    def insert_one(self, model, collection):
+        pass
+
+    @abstractmethod
+    def update_one(self, condition, new_model, collection):
+        pass
+
+    @abstractmethod
+    def delete_one(self, condition, collection):
+        pass
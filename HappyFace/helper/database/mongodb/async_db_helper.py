@@ -0,0 +1,146 @@
+from typing import Any
+
+import pymongo
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCursor
+from pymongo import UpdateOne, IndexModel
+from pymongo.results import UpdateResult, BulkWriteResult, InsertManyResult, DeleteResult
+
+from helper.database.abstract_db_helper import AbstractDbHelper
+from helper.log.default.log_helper import LogHelper
+
+
+class AsyncDbHelper(AbstractDbHelper):
+    def __init__(self) -> None:
+        self.__mongo_client = None
+        self.__database = None
+
+    @property
+    def mongo_client(self) -> AsyncIOMotorClient:
+        return self.__mongo_client
+
+    @mongo_client.setter
+    def mongo_client(self, mongo_client: AsyncIOMotorClient):
+        self.__mongo_client = mongo_client
+
+    @property
+    def database(self):
+        return self.__database
+
+    @database.setter
+    def database(self, database):
+        self.__database = database
+
+    def get_connected(self, db_uri: str, db: str, log_helper: LogHelper):
+        self.mongo_client = AsyncIOMotorClient(db_uri)
+        self.database = self.mongo_client[db]
+
+        log_helper.log_info_message(f"[AsyncDbHelper] Connected with the MongoDB: {self.database.name} successfully")
+        return self
+
+    def get_disconnected(self, log_helper: LogHelper):
+        self.mongo_client.close()
+
+        log_helper.log_info_message(f"[AsyncDbHelper] Disconnected with the MongoDB: {self.database.name} successfully")
+
+    async def find_one(self, condition: dict, project_vals: dict, collection: str = "admins") -> dict:
+        return await self.database[collection].find_one(condition, projection=project_vals)
+
+    def find_all(self, condition: dict, project_vals: dict, sort: list = None,
+                 collection: str = "admins") -> AsyncIOMotorCursor:
+        if sort is None:
+            sort = [("_id", pymongo.ASCENDING)]
+        return (
+            self.database[collection]
+            .find(condition, projection=project_vals)
+            .sort(sort)
+        )
+
+    async def insert_one(self, model: dict, collection: str = "admins") -> Any:
+        return await self.database[collection].insert_one(model)
+
+    async def insert_all(self, models: list[dict], collection: str = "admins") -> InsertManyResult | None:
+        if not models:
+            return None
+        return await self.database[collection].insert_many(models, ordered=False)
+
+    async def update_one(self, condition: dict, new_model: dict, collection: str = "admins") -> dict:
+        if model := await self.database[collection].find_one_and_update(condition, {"$set": new_model}):
+            return await self.find_one({"_id": model["_id"]}, {}, collection=collection)
+
+    async def delete_one(self, condition: dict, collection: str = "admins") -> Any:
+        return await self.database[collection].delete_one(condition)
+
+    async def delete_all(self, condition: dict, collection: str = "admins") -> DeleteResult:
+        return await self.database[collection].delete_many(condition)
+
+    async def count(self, condition: dict, collection: str = "admins") -> int:
+        return await self.database[collection].count_documents(condition)
+
+    async def ensure_time_series_collection(self, collection: str, time_field: str, meta_field: str,
+                                            granularity: str, log_helper: LogHelper):
+        if collection not in await self.database.list_collection_names(filter={"name": collection}):
+            await self.database.create_collection(
+                collection,
+                timeseries={"timeField": time_field, "metaField": meta_field, "granularity": granularity}
+            )
+
+            log_helper.log_info_message(f"[AsyncDbHelper] Created time series collection: {collection} successfully")
+
+    async def push_all(self, condition: dict, array_values: dict, array_filters: list = None,
+                       collection: str = "admins") -> UpdateResult:
+        update = {"$push": {field: {"$each": values} for field, values in array_values.items()}}
+        return await self.database[collection].update_one(condition, update, array_filters=array_filters)
+
+    async def pull(self, condition: dict, array_conditions: dict, array_filters: list = None,
+                   collection: str = "admins") -> UpdateResult:
+        return await self.database[collection].update_one(condition, {"$pull": array_conditions},
+                                                          array_filters=array_filters)
+
+    async def set_fields(self, condition: dict, fields: dict, array_filters: list = None,
+                         collection: str = "admins") -> UpdateResult:
+        return await self.database[collection].update_one(condition, {"$set": fields}, array_filters=array_filters)
+
+    async def bulk_update(self, updates: list[tuple[dict, dict, list | None]], upsert: bool = False,
+                          collection: str = "admins") -> BulkWriteResult | None:
+        if not updates:
+            return None
+        operations = [
+            UpdateOne(condition, update, upsert=upsert, array_filters=array_filters)
+            for condition, update, array_filters in updates
+        ]
+        return await self.database[collection].bulk_write(operations, ordered=False)
+
+    async def ensure_indexes(self, indexes: dict[str, list[IndexModel]], log_helper: LogHelper):
+        for collection, index_models in indexes.items():
+            index_names = await self.database[collection].create_indexes(index_models)
+
+            log_helper.log_info_message(f"[AsyncDbHelper] Ensured indexes: {index_names} on {collection} successfully")
+
+    async def check_indexes(self, queries: list[tuple[str, dict]], log_helper: LogHelper):
+        collection_scans = []
+
+        for collection, condition in queries:
+            explanation = await self.database[collection].find(condition).explain()
+
+            if AsyncDbHelper.has_collection_scan(explanation):
+                collection_scans.append(f"{collection}: {condition}")
+
+        if collection_scans:
+            log_helper.log_critical_message(f"[AsyncDbHelper] COLLSCAN detected for queries: {collection_scans}")
+            raise RuntimeError(f"COLLSCAN detected for queries: {collection_scans}")
+
+        log_helper.log_info_message(f"[AsyncDbHelper] Checked {len(queries)} queries for index usage successfully")
+
+    @staticmethod
+    def has_collection_scan(plan: Any) -> bool:
+        if isinstance(plan, dict):
+            if plan.get("stage") == "COLLSCAN":
+                return True
+            return any(
+                AsyncDbHelper.has_collection_scan(value)
+                for key, value in plan.items()
+                if key not in ("rejectedPlans", "allPlansExecution")
+            )
+        if isinstance(plan, list):
+            return any(AsyncDbHelper.has_collection_scan(value) for value in plan)
+        return False
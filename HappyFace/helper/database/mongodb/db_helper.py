@@ -1,7 +1,7 @@
 from typing import Any
 
 import pymongo
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 
 from helper.database.abstract_db_helper import AbstractDbHelper
 from helper.log.default.log_helper import LogHelper
@@ -55,9 +55,37 @@ class DbHelper(AbstractDbHelper):
     def insert_one(self, model: dict, collection: str = "admins") -> Any:
         return self.database[collection].insert_one(model)
 
+    def insert_all(self, models: list[dict], collection: str = "admins") -> Any:
+        if not models:
+            return None
+        return self.database[collection].insert_many(models, ordered=False)
+
     def update_one(self, condition: dict, new_model: dict, collection: str = "admins") -> dict:
         if model := self.database[collection].find_one_and_update(condition, {"$set": new_model}):
             return self.find_one({"_id": model["_id"]}, {}, collection=collection)
 
     def delete_one(self, condition: dict, collection: str = "admins") -> Any:
         return self.database[collection].delete_one(condition)
+
+    def delete_all(self, condition: dict, collection: str = "admins") -> Any:
+        return self.database[collection].delete_many(condition)
+
+    def bulk_update(self, updates: list[tuple[dict, dict, list | None]], upsert: bool = False,
+                    collection: str = "admins") -> Any:
+        if not updates:
+            return None
+        operations = [
+            UpdateOne(condition, update, upsert=upsert, array_filters=array_filters)
+            for condition, update, array_filters in updates
+        ]
+        return self.database[collection].bulk_write(operations, ordered=False)
+
+    def ensure_time_series_collection(self, collection: str, time_field: str, meta_field: str, granularity: str,
+                                      log_helper: LogHelper):
+        if collection not in self.database.list_collection_names(filter={"name": collection}):
+            self.database.create_collection(
+                collection,
+                timeseries={"timeField": time_field, "metaField": meta_field, "granularity": granularity}
+            )
+
+            log_helper.log_info_message(f"[DbHelper] Created time series collection: {collection} successfully")
@@ -0,0 +1,59 @@
+from helper.database.abstract_db_helper import AbstractDbHelper
+
+
+class DocumentLoader(dict):
+    def __init__(self, db_helper: AbstractDbHelper, condition: dict, document: dict, collection: str = "admins",
+                 element_field: str = None, fully_loaded: bool = False) -> None:
+        super().__init__(document)
+        self.__db_helper = db_helper
+        self.__condition = condition
+        self.__collection = collection
+        self.__element_field = element_field
+        self.__loaded_fields = set(document)
+        self.__fully_loaded = fully_loaded
+
+    @property
+    def fully_loaded(self) -> bool:
+        return self.__fully_loaded
+
+    @staticmethod
+    def covers(fields, field: str) -> bool:
+        return any(field == covering or field.startswith(f"{covering}.") for covering in fields)
+
+    async def load(self, *fields: str) -> "DocumentLoader":
+        if self.fully_loaded:
+            return self
+
+        missing_fields = [field for field in fields if not DocumentLoader.covers(self.__loaded_fields, field)]
+        if fields and not missing_fields:
+            return self
+
+        if self.__element_field:
+            projection = {"_id": False, self.__element_field: {"$elemMatch": {"_id": self["_id"]}}}
+        elif fields:
+            missing_roots = {field.split(".")[0] for field in missing_fields}
+            projected_fields = set(missing_fields).union(
+                field
+                for field in self.__loaded_fields
+                if "." in field and field.split(".")[0] in missing_roots
+            )
+            projection = {
+                field: True
+                for field in projected_fields
+                if not DocumentLoader.covers(projected_fields - {field}, field)
+            }
+        else:
+            projection = {}
+
+        if document := await self.__db_helper.find_one(self.__condition, projection, collection=self.__collection):
+            if self.__element_field:
+                for element in document.get(self.__element_field, []):
+                    self.update(element)
+            else:
+                self.update(document)
+
+        if self.__element_field or not fields:
+            self.__fully_loaded = True
+        else:
+            self.__loaded_fields.update(missing_fields)
+        return self
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import pymongo
+from pymongo import IndexModel
+
+
+class IndexConfigHelper:
+    INDEXES = {
+        "admins": [
+            IndexModel([("username", pymongo.ASCENDING), ("password", pymongo.ASCENDING)],
+                       name="username_password"),
+            IndexModel([("authKey", pymongo.ASCENDING)], name="authKey",
+                       partialFilterExpression={"authKey": {"$exists": True}})
+        ],
+        "organizations": [
+            IndexModel([("orgKey", pymongo.ASCENDING), ("password", pymongo.ASCENDING)],
+                       name="orgKey_password"),
+            IndexModel([("authKey", pymongo.ASCENDING)], name="authKey",
+                       partialFilterExpression={"authKey": {"$exists": True}}),
+            IndexModel([("orgKey", pymongo.ASCENDING), ("subjects.username", pymongo.ASCENDING),
+                        ("subjects.password", pymongo.ASCENDING)],
+                       name="orgKey_subjects_username_password"),
+            IndexModel([("orgKey", pymongo.ASCENDING), ("subjects.authKey", pymongo.ASCENDING)],
+                       name="orgKey_subjects_authKey"),
+            IndexModel([("happyEngagement", pymongo.DESCENDING), ("_id", pymongo.ASCENDING)],
+                       name="happyEngagement_id")
+        ],
+        "work_emotions": [
+            IndexModel([("meta.orgId", pymongo.ASCENDING), ("meta.subjectId", pymongo.ASCENDING),
+                        ("recordedOn", pymongo.ASCENDING)],
+                       name="orgId_subjectId_recordedOn"),
+            IndexModel([("meta.orgId", pymongo.ASCENDING), ("recordedOn", pymongo.ASCENDING)],
+                       name="orgId_recordedOn")
+        ],
+        "emotion_rollups": [
+            IndexModel([("orgId", pymongo.ASCENDING), ("subjectId", pymongo.ASCENDING),
+                        ("granularity", pymongo.ASCENDING), ("bucketStart", pymongo.ASCENDING)],
+                       name="orgId_subjectId_granularity_bucketStart", unique=True)
+        ]
+    }
+    CANONICAL_QUERIES = [
+        ("admins", {"username": "", "password": ""}),
+        ("admins", {"authKey": ""}),
+        ("organizations", {"_id": ""}),
+        ("organizations", {"orgKey": ""}),
+        ("organizations", {"orgKey": "", "password": ""}),
+        ("organizations", {"authKey": ""}),
+        ("organizations", {"orgKey": "", "subjects": {"$elemMatch": {"username": "", "password": ""}}}),
+        ("organizations", {"orgKey": "", "subjects.authKey": ""}),
+        ("work_emotions", {"meta.orgId": ""}),
+        ("work_emotions", {"meta.orgId": "", "recordedOn": {"$gte": datetime.min}}),
+        ("work_emotions", {"meta.orgId": "", "meta.subjectId": ""}),
+        ("work_emotions", {"meta.orgId": "", "meta.subjectId": "", "recordedOn": {"$gte": datetime.min}}),
+        ("emotion_rollups", {"orgId": "", "subjectId": None, "granularity": "all", "bucketStart": None}),
+        ("emotion_rollups", {"orgId": "", "subjectId": ""}),
+        ("emotion_rollups", {"orgId": "", "subjectId": "", "granularity": "day", "bucketStart": {"$gte": datetime.min}})
+    ]
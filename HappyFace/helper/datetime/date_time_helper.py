@@ -2,6 +2,11 @@ from datetime import datetime, timedelta
 
 
 class DateTimeHelper:
+    EPOCH = datetime(1970, 1, 1)
+    ISO_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+    LIFETIME_WINDOW = "all"
+    WINDOW_UNITS = {"h": "hours", "w": "weeks", "m": "months", "y": "years"}
+
     @staticmethod
     def get_iso_datetime(current_datetime: datetime) -> str:
         return current_datetime.isoformat()
@@ -12,16 +17,88 @@ class DateTimeHelper:
         return DateTimeHelper.get_iso_datetime(current_datetime)
 
     @staticmethod
-    def str_to_iso_datetime(datetime_str: str, dt_format: str = "%Y-%m-%dT%H:%M:%S.%f") -> datetime:
-        return datetime.strptime(datetime_str, dt_format)
+    def str_to_iso_datetime(datetime_str: str, dt_format: str = ISO_FORMAT) -> datetime:
+        if dt_format != DateTimeHelper.ISO_FORMAT:
+            return datetime.strptime(datetime_str, dt_format)
+
+        iso_datetime = datetime.fromisoformat(datetime_str)
+        if iso_datetime.tzinfo:
+            iso_datetime = iso_datetime.astimezone().replace(tzinfo=None)
+        return iso_datetime
 
     @staticmethod
-    def subtract_iso_datetime(hours: int = 0, weeks: int = 0, months: int = 0, years: int = 0):
+    def to_epoch(value: datetime) -> int:
+        return (value - DateTimeHelper.EPOCH) // timedelta(microseconds=1)
+
+    @staticmethod
+    def from_epoch(value: int) -> datetime:
+        return DateTimeHelper.EPOCH + timedelta(microseconds=value)
+
+    @staticmethod
+    def iso_to_epoch(datetime_str: str) -> int:
+        return DateTimeHelper.to_epoch(DateTimeHelper.str_to_iso_datetime(datetime_str))
+
+    @staticmethod
+    def get_current_epoch() -> int:
+        return DateTimeHelper.to_epoch(datetime.now())
+
+    @staticmethod
+    def get_epoch(record: dict, field: str) -> int | None:
+        if (epoch := record.get(f"{field}Epoch")) is not None:
+            return epoch
+        if datetime_str := record.get(field):
+            return DateTimeHelper.iso_to_epoch(datetime_str)
+        return None
+
+    @staticmethod
+    def with_epochs(record: dict, *fields: str) -> dict:
+        for field in fields:
+            if datetime_str := record.get(field):
+                record[f"{field}Epoch"] = DateTimeHelper.iso_to_epoch(datetime_str)
+        return record
+
+    @staticmethod
+    def subtract_datetime(hours: int = 0, weeks: int = 0, months: int = 0, years: int = 0) -> datetime:
         current_datetime = datetime.now()
         duration = timedelta(
             hours=hours,
             weeks=weeks,
             days=months * 30 + years * 365
         )
-        result_datetime = current_datetime - duration
+        return current_datetime - duration
+
+    @staticmethod
+    def subtract_window(window: str) -> datetime | None:
+        if window == DateTimeHelper.LIFETIME_WINDOW:
+            return None
+        amount, unit = window[:-1], window[-1:]
+        if not amount.isdigit() or unit not in DateTimeHelper.WINDOW_UNITS:
+            raise ValueError(f"invalid window: {window}")
+        try:
+            return DateTimeHelper.subtract_datetime(**{DateTimeHelper.WINDOW_UNITS[unit]: int(amount)})
+        except OverflowError as e:
+            raise ValueError(f"window out of range: {window}") from e
+
+    @staticmethod
+    def subtract_epoch(hours: int = 0, weeks: int = 0, months: int = 0, years: int = 0) -> int:
+        return DateTimeHelper.to_epoch(DateTimeHelper.subtract_datetime(hours, weeks, months, years))
+
+    @staticmethod
+    def subtract_iso_datetime(hours: int = 0, weeks: int = 0, months: int = 0, years: int = 0):
+        result_datetime = DateTimeHelper.subtract_datetime(hours, weeks, months, years)
         return DateTimeHelper.get_iso_datetime(result_datetime)
+
+    @staticmethod
+    def floor_datetime(value: datetime, unit: str = "hours") -> datetime:
+        if unit == "weeks":
+            return DateTimeHelper.floor_datetime(value, "days") - timedelta(days=value.weekday())
+        if unit == "days":
+            return value.replace(hour=0, minute=0, second=0, microsecond=0)
+        return value.replace(minute=0, second=0, microsecond=0)
+
+    @staticmethod
+    def ceil_datetime(value: datetime, unit: str = "hours") -> datetime:
+        floored_datetime = DateTimeHelper.floor_datetime(value, unit)
+        if floored_datetime == value:
+            return floored_datetime
+        return floored_datetime + timedelta(**{unit: 1})
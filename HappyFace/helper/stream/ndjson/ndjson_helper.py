@@ -0,0 +1,33 @@
+from typing import AsyncIterator
+
+
+class NdjsonHelper:
+    @staticmethod
+    async def iter_lines(stream: AsyncIterator[bytes], max_line_size: int) -> AsyncIterator[tuple[int, bytes | None]]:
+        pending = bytearray()
+        line_no = 0
+        oversized = False
+
+        async for data in stream:
+            start = 0
+            while (end := data.find(b"\n", start)) != -1:
+                line_no += 1
+                if oversized or len(pending) + end - start > max_line_size:
+                    yield line_no, None
+                else:
+                    pending.extend(data[start:end])
+                    if line := bytes(pending).strip():
+                        yield line_no, line
+                pending.clear()
+                oversized = False
+                start = end + 1
+            if not oversized:
+                pending.extend(data[start:])
+                if len(pending) > max_line_size:
+                    pending.clear()
+                    oversized = True
+
+        if oversized:
+            yield line_no + 1, None
+        elif line := bytes(pending).strip():
+            yield line_no + 1, line
@@ -0,0 +1,11 @@
+import json
+from typing import Any
+
+
+class SseHelper:
+    MEDIA_TYPE = "text/event-stream"
+    HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+    @staticmethod
+    def format_event(event: str, data: Any) -> str:
+        return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
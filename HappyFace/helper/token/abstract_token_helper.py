@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class AbstractTokenHelper(ABC):
+    @abstractmethod
+    def encode(self, claims: dict, ttl: int):
+        pass
+
+    @abstractmethod
+    def decode(self, token: str):
+        pass
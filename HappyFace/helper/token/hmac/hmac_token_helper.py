@@ -0,0 +1,48 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
+
+from helper.token.abstract_token_helper import AbstractTokenHelper
+
+
+class HmacTokenHelper(AbstractTokenHelper):
+    def __init__(self, key_str: str):
+        if not key_str:
+            raise ValueError("HMAC key is not configured")
+        self.__key = key_str.encode("utf-8")
+
+    @property
+    def key(self) -> bytes:
+        return self.__key
+
+    @staticmethod
+    def b64_encode(content: bytes) -> str:
+        return base64.urlsafe_b64encode(content).decode("utf-8").rstrip("=")
+
+    @staticmethod
+    def b64_decode(content: str) -> bytes:
+        return base64.urlsafe_b64decode(content + "=" * (-len(content) % 4))
+
+    def sign(self, payload: str) -> str:
+        signature = hmac.new(self.key, payload.encode("utf-8"), hashlib.sha256).digest()
+        return HmacTokenHelper.b64_encode(signature)
+
+    def encode(self, claims: dict, ttl: int) -> str:
+        claims = {**claims, "exp": int(time.time()) + ttl}
+        payload = HmacTokenHelper.b64_encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+        return f"{payload}.{self.sign(payload)}"
+
+    def decode(self, token: str) -> dict | None:
+        payload, _, signature = token.partition(".")
+
+        if not payload or not hmac.compare_digest(signature, self.sign(payload)):
+            return None
+        try:
+            claims = json.loads(HmacTokenHelper.b64_decode(payload))
+        except ValueError:
+            return None
+        if claims.get("exp", 0) <= time.time():
+            return None
+        return claims
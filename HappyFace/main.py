@@ -1,53 +1,143 @@
+import os
+
 import uvicorn
 from dotenv import dotenv_values
 from fastapi import FastAPI
 
+from helper.api.config_helper import ConfigHelper
+from helper.api.request_helper import RequestHelper
 from helper.crypto.aes.aes_crypto_helper import AesCryptoHelper
-from helper.database.mongodb.db_helper import DbHelper
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from helper.database.mongodb.index_config_helper import IndexConfigHelper
+from helper.key.random_key_helper import RandomKeyHelper
 from helper.log.default.log_helper import LogHelper
+from helper.token.hmac.hmac_token_helper import HmacTokenHelper
 from route.admin_router import router as admin_router
 from route.organization_router import router as organization_router
 from route.subject_router import router as subject_router
 from route.utility_router import router as utility_router
 from service.admin_service import AdminService
 from service.auth_service import AuthService
+from service.chat_history_service import ChatHistoryService
+from service.emotion_window_service import EmotionWindowService
+from service.emotionistant_cache_service import EmotionistantCacheService
 from service.organization_service import OrganizationService
+from service.session_service import SessionService
 from service.subject_service import SubjectService
+from service.work_emotion_service import WorkEmotionService
+from worker.facial_emotion_ingest_buffer import FacialEmotionIngestBuffer
+from worker.happy_engagement_reconciler import HappyEngagementReconciler
+from worker.sentimental_emotion_sync_worker import SentimentalEmotionSyncWorker
 
 db_config = dotenv_values("config/database/mongodb.env")
 log_config = dotenv_values("config/log/default.env")
 crypto_config = dotenv_values("config/crypto/aes.env")
+token_config = dotenv_values("config/crypto/hmac.env")
+reconciler_config = dotenv_values("config/worker/reconciler.env")
+ingest_buffer_config = dotenv_values("config/worker/ingest_buffer.env")
+sentimental_sync_config = dotenv_values("config/worker/sentimental_sync.env")
+emotion_window_config = dotenv_values("config/cache/emotion_window.env")
+emotionistant_cache_config = dotenv_values("config/cache/emotionistant.env")
+chat_history_config = dotenv_values("config/api/chat_history.env")
+http_client_config = dotenv_values("config/api/http_client.env")
 
 app = FastAPI()
 
 
 @app.on_event("startup")
-def startup_client():
-    app.db_helper = DbHelper()
+async def startup_client():
+    app.db_helper = AsyncDbHelper()
+    app.consultancy_concurrency = int(http_client_config["CONSULTANCY_CONCURRENCY"])
+    RequestHelper.open(
+        ConfigHelper.BASE_URLS,
+        pool_size=int(http_client_config["POOL_SIZE"]),
+        connect_timeout=int(http_client_config["CONNECT_TIMEOUT_MILLISECONDS"]) / 1000,
+        read_timeout=int(http_client_config["READ_TIMEOUT_MILLISECONDS"]) / 1000,
+        read_timeouts=ConfigHelper.READ_TIMEOUTS,
+        non_idempotent_urls=ConfigHelper.NON_IDEMPOTENT_URLS,
+        max_retries=int(http_client_config["MAX_RETRIES"]),
+        retry_backoff=int(http_client_config["RETRY_BACKOFF_MILLISECONDS"]) / 1000
+    )
     app.crypto_helper = AesCryptoHelper(crypto_config["KEY"])
     app.auth_service = AuthService()
     app.admin_service = AdminService()
     app.organization_service = OrganizationService()
     app.subject_service = SubjectService()
+    app.emotion_window_service = EmotionWindowService(
+        span_hours=int(emotion_window_config["SPAN_HOURS"]),
+        slot_minutes=int(emotion_window_config["SLOT_MINUTES"]),
+        refresh_seconds=int(emotion_window_config["REFRESH_SECONDS"]),
+        max_windows=int(emotion_window_config["MAX_WINDOWS"])
+    )
+    app.emotionistant_cache_service = EmotionistantCacheService(
+        ttl_hours=int(emotionistant_cache_config["TTL_HOURS"]),
+        max_entries=int(emotionistant_cache_config["MAX_ENTRIES"]),
+        evict_every=int(emotionistant_cache_config["EVICT_EVERY"])
+    )
+    app.chat_history_service = ChatHistoryService(
+        recent_messages=int(chat_history_config["RECENT_MESSAGES"]),
+        summary_batch=int(chat_history_config["SUMMARY_BATCH"])
+    )
     app.log_helper = LogHelper(
         logger_name=log_config["LOGGER_NAME"],
         log_file_name=log_config["LOG_FILE_NAME"],
         log_format_template=log_config["LOG_FORMAT_TEMPLATE"],
         log_file_open_mode=log_config["LOG_FILE_OPEN_MODE"]
     )
+    if not (hmac_key := os.environ.get("HAPPYFACE_HMAC_KEY") or token_config["KEY"]):
+        hmac_key = RandomKeyHelper.generate_random_key(48)
+        app.log_helper.log_warn_message(
+            "[Main] HMAC key is not configured, using a temporary development key: session tokens will not survive "
+            "a restart, set HAPPYFACE_HMAC_KEY to a persistent secret"
+        )
+    app.session_service = SessionService(HmacTokenHelper(hmac_key), int(token_config["TOKEN_TTL"]))
     app.db_helper.get_connected(
         db_uri=db_config["DB_URI"],
         db=db_config["DB_NAME"],
         log_helper=app.log_helper
     )
+    await WorkEmotionService.setup(app.db_helper, app.log_helper)
+    await app.db_helper.ensure_indexes(IndexConfigHelper.INDEXES, app.log_helper)
+    await app.emotionistant_cache_service.setup(app.db_helper, app.log_helper)
+    if db_config["DB_INDEX_CHECK"] == "True":
+        await app.db_helper.check_indexes(IndexConfigHelper.CANONICAL_QUERIES, app.log_helper)
+    app.happy_engagement_reconciler = HappyEngagementReconciler(
+        app.db_helper,
+        app.log_helper,
+        int(reconciler_config["HAPPY_ENGAGEMENT_RECONCILE_INTERVAL"])
+    )
+    app.happy_engagement_reconciler.start()
+    app.sentimental_emotion_sync_worker = SentimentalEmotionSyncWorker(
+        app.db_helper,
+        app.emotion_window_service,
+        app.log_helper,
+        interval=int(sentimental_sync_config["SYNC_INTERVAL_MILLISECONDS"]) / 1000,
+        batch_size=int(sentimental_sync_config["BATCH_SIZE"]),
+        max_retries=int(sentimental_sync_config["MAX_RETRIES"]),
+        retry_delay=int(sentimental_sync_config["RETRY_DELAY_MILLISECONDS"]) / 1000
+    )
+    app.sentimental_emotion_sync_worker.start()
+    app.facial_emotion_ingest_buffer = FacialEmotionIngestBuffer(
+        app.db_helper,
+        app.emotion_window_service,
+        app.sentimental_emotion_sync_worker,
+        app.log_helper,
+        max_batch_size=int(ingest_buffer_config["MAX_BATCH_SIZE"]),
+        max_delay=int(ingest_buffer_config["MAX_DELAY_MILLISECONDS"]) / 1000,
+        max_pending=int(ingest_buffer_config["MAX_PENDING"])
+    )
     app.log_helper.log_info_message("[Main] App initialized successfully")
 
 
 @app.on_event("shutdown")
-def shutdown_client():
+async def shutdown_client():
     log_helper = app.log_helper
     db_helper = app.db_helper
 
+    await app.facial_emotion_ingest_buffer.stop()
+    await app.sentimental_emotion_sync_worker.stop()
+    await app.happy_engagement_reconciler.stop()
+    RequestHelper.close()
     db_helper.get_disconnected(log_helper)
     log_helper.log_info_message("[Main] App disabled successfully")
 
@@ -0,0 +1,61 @@
+import pymongo
+from dotenv import dotenv_values
+
+from helper.database.mongodb.db_helper import DbHelper
+from helper.log.default.log_helper import LogHelper
+from service.emotion_rollup_service import EmotionRollupService
+from service.work_emotion_service import WorkEmotionService
+
+
+class EmotionRollupMigration:
+    BATCH_SIZE = 10000
+
+    @staticmethod
+    def migrate(db_helper: DbHelper, log_helper: LogHelper) -> int:
+        db_helper.delete_all({}, collection=EmotionRollupService.COLLECTION)
+        work_emotions = db_helper.find_all(
+            {},
+            {"_id": False},
+            sort=[(WorkEmotionService.TIME_FIELD, pymongo.ASCENDING)],
+            collection=WorkEmotionService.COLLECTION
+        )
+        tot_rolled_up = 0
+        documents = []
+
+        for work_emotion in work_emotions:
+            documents.append(work_emotion)
+
+            if len(documents) == EmotionRollupMigration.BATCH_SIZE:
+                tot_rolled_up += EmotionRollupMigration.roll_up(db_helper, documents, log_helper)
+                documents = []
+        return tot_rolled_up + EmotionRollupMigration.roll_up(db_helper, documents, log_helper)
+
+    @staticmethod
+    def roll_up(db_helper: DbHelper, documents: list[dict], log_helper: LogHelper) -> int:
+        db_helper.bulk_update(EmotionRollupService.get_updates(documents), upsert=True,
+                              collection=EmotionRollupService.COLLECTION)
+
+        log_helper.log_info_message(f"[EmotionRollupMigration] Rolled up {len(documents)} work emotion(s)")
+        return len(documents)
+
+
+if __name__ == "__main__":
+    db_config = dotenv_values("config/database/mongodb.env")
+    log_config = dotenv_values("config/log/default.env")
+
+    migration_log_helper = LogHelper(
+        logger_name=log_config["LOGGER_NAME"],
+        log_file_name=log_config["LOG_FILE_NAME"],
+        log_format_template=log_config["LOG_FORMAT_TEMPLATE"],
+        log_file_open_mode=log_config["LOG_FILE_OPEN_MODE"]
+    )
+    migration_db_helper = DbHelper().get_connected(
+        db_uri=db_config["DB_URI"],
+        db=db_config["DB_NAME"],
+        log_helper=migration_log_helper
+    )
+    rolled_up = EmotionRollupMigration.migrate(migration_db_helper, migration_log_helper)
+    migration_log_helper.log_info_message(
+        f"[EmotionRollupMigration] Rolled up {rolled_up} work emotion(s) successfully"
+    )
+    migration_db_helper.get_disconnected(migration_log_helper)
@@ -0,0 +1,80 @@
+from dotenv import dotenv_values
+
+from helper.database.mongodb.db_helper import DbHelper
+from helper.datetime.date_time_helper import DateTimeHelper
+from helper.log.default.log_helper import LogHelper
+
+
+class TimestampEpochMigration:
+    ARRAY_FIELDS = {
+        "consultancies": ["consultedOn"],
+        "specialConsiderationRequests": ["requestedOn", "respondedOn"]
+    }
+
+    @staticmethod
+    def get_updates(organization: dict) -> list[tuple[dict, dict, list]]:
+        updates = []
+
+        for subject in organization.get("subjects", []):
+            for array_field, fields in TimestampEpochMigration.ARRAY_FIELDS.items():
+                for element in subject.get(array_field, []):
+                    epochs = {
+                        f"subjects.$[s].{array_field}.$[e].{field}Epoch": DateTimeHelper.iso_to_epoch(element[field])
+                        for field in fields
+                        if element.get(field) and f"{field}Epoch" not in element
+                    }
+                    if epochs:
+                        updates.append(
+                            (
+                                {"_id": organization["_id"]},
+                                {"$set": epochs},
+                                [{"s._id": subject["_id"]}, {"e._id": element["_id"]}]
+                            )
+                        )
+        return updates
+
+    @staticmethod
+    def migrate(db_helper: DbHelper, log_helper: LogHelper) -> int:
+        organizations = db_helper.find_all(
+            {},
+            {
+                "subjects._id": True,
+                "subjects.consultancies": True,
+                "subjects.specialConsiderationRequests": True
+            },
+            collection="organizations"
+        )
+        tot_migrated = 0
+
+        for organization in organizations:
+            updates = TimestampEpochMigration.get_updates(organization)
+            db_helper.bulk_update(updates, collection="organizations")
+            tot_migrated += len(updates)
+
+            log_helper.log_info_message(
+                f"[TimestampEpochMigration] Added epochs to {len(updates)} record(s) of organization: "
+                f"{organization['_id']}"
+            )
+        return tot_migrated
+
+
+if __name__ == "__main__":
+    db_config = dotenv_values("config/database/mongodb.env")
+    log_config = dotenv_values("config/log/default.env")
+
+    migration_log_helper = LogHelper(
+        logger_name=log_config["LOGGER_NAME"],
+        log_file_name=log_config["LOG_FILE_NAME"],
+        log_format_template=log_config["LOG_FORMAT_TEMPLATE"],
+        log_file_open_mode=log_config["LOG_FILE_OPEN_MODE"]
+    )
+    migration_db_helper = DbHelper().get_connected(
+        db_uri=db_config["DB_URI"],
+        db=db_config["DB_NAME"],
+        log_helper=migration_log_helper
+    )
+    migrated = TimestampEpochMigration.migrate(migration_db_helper, migration_log_helper)
+    migration_log_helper.log_info_message(
+        f"[TimestampEpochMigration] Added epochs to {migrated} record(s) successfully"
+    )
+    migration_db_helper.get_disconnected(migration_log_helper)
@@ -0,0 +1,82 @@
+from dotenv import dotenv_values
+
+from helper.database.mongodb.db_helper import DbHelper
+from helper.log.default.log_helper import LogHelper
+from service.work_emotion_service import WorkEmotionService
+
+
+class WorkEmotionMigration:
+    @staticmethod
+    def migrate_subject(db_helper: DbHelper, org_id: str, subject: dict) -> int:
+        documents = [
+            WorkEmotionService.with_sync_key(WorkEmotionService.to_document(org_id, subject["_id"], work_emotion))
+            for work_emotion in subject["workEmotions"]
+        ]
+        if documents:
+            condition = WorkEmotionService.get_condition(org_id, subject["_id"])
+            condition[WorkEmotionService.SYNC_KEY] = {
+                "$in": [document[WorkEmotionService.SYNC_KEY] for document in documents]
+            }
+            migrated_keys = {
+                document[WorkEmotionService.SYNC_KEY]
+                for document in db_helper.find_all(condition, {"_id": False, WorkEmotionService.SYNC_KEY: True},
+                                                   collection=WorkEmotionService.COLLECTION)
+            }
+            documents = [
+                document for document in documents if document[WorkEmotionService.SYNC_KEY] not in migrated_keys
+            ]
+            db_helper.insert_all(documents, collection=WorkEmotionService.COLLECTION)
+        db_helper.bulk_update(
+            [({"_id": org_id}, {"$unset": {"subjects.$[s].workEmotions": ""}}, [{"s._id": subject["_id"]}])],
+            collection="organizations"
+        )
+        return len(documents)
+
+    @staticmethod
+    def migrate(db_helper: DbHelper, log_helper: LogHelper) -> int:
+        db_helper.ensure_time_series_collection(
+            WorkEmotionService.COLLECTION,
+            WorkEmotionService.TIME_FIELD,
+            WorkEmotionService.META_FIELD,
+            WorkEmotionService.GRANULARITY,
+            log_helper
+        )
+        organizations = db_helper.find_all(
+            {"subjects.workEmotions": {"$exists": True}},
+            {"subjects": {"_id": True, "workEmotions": True}},
+            collection="organizations"
+        )
+        tot_migrated = 0
+
+        for organization in organizations:
+            org_id = organization["_id"]
+            migrated = sum(
+                WorkEmotionMigration.migrate_subject(db_helper, org_id, subject)
+                for subject in organization["subjects"]
+                if "workEmotions" in subject
+            )
+            tot_migrated += migrated
+
+            log_helper.log_info_message(
+                f"[WorkEmotionMigration] Moved {migrated} work emotion(s) of organization: {org_id}"
+            )
+        return tot_migrated
+
+if __name__ == "__main__":
+    db_config = dotenv_values("config/database/mongodb.env")
+    log_config = dotenv_values("config/log/default.env")
+
+    migration_log_helper = LogHelper(
+        logger_name=log_config["LOGGER_NAME"],
+        log_file_name=log_config["LOG_FILE_NAME"],
+        log_format_template=log_config["LOG_FORMAT_TEMPLATE"],
+        log_file_open_mode=log_config["LOG_FILE_OPEN_MODE"]
+    )
+    migration_db_helper = DbHelper().get_connected(
+        db_uri=db_config["DB_URI"],
+        db=db_config["DB_NAME"],
+        log_helper=migration_log_helper
+    )
+    migrated = WorkEmotionMigration.migrate(migration_db_helper, migration_log_helper)
+    migration_log_helper.log_info_message(f"[WorkEmotionMigration] Migrated {migrated} work emotion(s) successfully")
+    migration_db_helper.get_disconnected(migration_log_helper)
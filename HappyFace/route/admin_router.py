@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Request, status, HTTPException, Body
+from fastapi import APIRouter, Request, status, HTTPException, Body, Query
 
 from entity.models import AdministrativeOrganization, AuthAdmin, BasicRememberMe, Admin
 
@@ -11,8 +11,8 @@ async def fetch_admin(request: Request, admin: AuthAdmin = Body(...)) -> dict:
     db_helper = request.app.db_helper
     admin_service = request.app.admin_service
 
-    if auth_admin := auth_service.auth_admin(db_helper, admin_service, admin):
-        return auth_admin
+    if auth_admin := await auth_service.auth_admin(db_helper, admin_service, admin):
+        return await auth_admin.load()
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
@@ -24,8 +24,8 @@ async def update_admin_with_credentials(request: Request, admin: AuthAdmin = Bod
     db_helper = request.app.db_helper
     admin_service = request.app.admin_service
 
-    if auth_admin := auth_service.auth_admin(db_helper, admin_service, admin):
-        if admin := admin_service.update(db_helper, auth_admin, new_admin):
+    if auth_admin := await auth_service.auth_admin(db_helper, admin_service, admin):
+        if admin := await admin_service.update(db_helper, auth_admin, new_admin):
             return admin
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
@@ -36,22 +36,24 @@ async def update_admin(request: Request, admin: AuthAdmin = Body(...), new_admin
     db_helper = request.app.db_helper
     admin_service = request.app.admin_service
 
-    if auth_admin := auth_service.auth_admin(db_helper, admin_service, admin):
-        if admin := admin_service.update(db_helper, auth_admin, new_admin, hashing=False):
+    if auth_admin := await auth_service.auth_admin(db_helper, admin_service, admin):
+        if admin := await admin_service.update(db_helper, auth_admin, new_admin, hashing=False):
             return admin
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
 @router.post("/orgs/all", response_description="all organization retrieval", status_code=status.HTTP_200_OK,
              response_model=list[AdministrativeOrganization])
-async def fetch_organizations(request: Request, admin: AuthAdmin = Body(...)) -> list[dict]:
+async def fetch_organizations(request: Request, admin: AuthAdmin = Body(...),
+                              limit: int = Query(50, ge=1, le=500, description="page size"),
+                              offset: int = Query(0, ge=0, description="page offset")) -> list[dict]:
     auth_service = request.app.auth_service
     db_helper = request.app.db_helper
     admin_service = request.app.admin_service
     organization_service = request.app.organization_service
 
-    if _ := auth_service.auth_admin(db_helper, admin_service, admin):
-        if organizations := organization_service.retrieve_all(db_helper):
+    if _ := await auth_service.auth_admin(db_helper, admin_service, admin):
+        if organizations := await organization_service.retrieve_all(db_helper, limit, offset):
             return organizations
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="organization(s) not available")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
@@ -62,6 +64,6 @@ async def remember_me(request: Request, basic_remember_me: BasicRememberMe = Bod
     db_helper = request.app.db_helper
     admin_service = request.app.admin_service
 
-    if admin := admin_service.remember_me(db_helper, basic_remember_me):
+    if admin := await admin_service.remember_me(db_helper, basic_remember_me):
         return admin
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="not remember")
@@ -1,13 +1,30 @@
-from fastapi import APIRouter, Body, Request, HTTPException, status, Query
+from fastapi import APIRouter, Body, Request, HTTPException, status, Query, Depends
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from pymongo.errors import PyMongoError
 
+from entity.emotion import EmotionExpression
 from entity.models import (
     Organization, Subject, FacialWorkEmotionEntry, AuthOrganization, BasicRememberMe, SpecialConsiderationRequestEntry,
-    SpecialConsiderationResponseEntry
+    SpecialConsiderationResponseEntry, SessionToken, IngestReceipt
 )
-from helper.api.organization_api_helper import OrganizationApiHelper
+from helper.codec.packed.packed_emotion_codec import PackedEmotionCodec
+from helper.stream.ndjson.ndjson_helper import NdjsonHelper
+from route.session_dependency import get_session
 
 router = APIRouter()
 
+FACIAL_WORK_EMOTION_ENTRIES = TypeAdapter(list[FacialWorkEmotionEntry])
+FACIAL_WORK_EMOTION_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": {"type": "array", "items": {"type": "object"}}},
+            PackedEmotionCodec.CONTENT_TYPE: {"schema": {"type": "string", "format": "binary"}}
+        }
+    }
+}
+
 
 @router.post("/new", response_description="organization registration", status_code=status.HTTP_200_OK,
              response_model=Organization)
@@ -15,50 +32,68 @@ async def register_organization(request: Request, organization: Organization = B
     db_helper = request.app.db_helper
     organization_service = request.app.organization_service
 
-    if registered_organization := organization_service.register(db_helper, organization):
+    if registered_organization := await organization_service.register(db_helper, organization):
         return registered_organization
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="organization registration failed")
 
 
 @router.post("/subjects/new", response_description="subject registration", status_code=status.HTTP_200_OK,
              response_model=list[Subject])
-async def register_subjects(request: Request, organization: AuthOrganization = Body(...),
+async def register_subjects(request: Request, organization: AuthOrganization = Body(None),
+                            session: dict = Depends(get_session),
                             subjects: list[Subject] = Body(...)) -> list[dict]:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     subject_service = request.app.subject_service
     organization_service = request.app.organization_service
 
-    if auth_organization := auth_service.auth_organization(db_helper, organization_service, organization):
-        if updated_subjects := subject_service.register_all(db_helper, organization_service, auth_organization,
-                                                            subjects):
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization,
+                                                                 session):
+        if updated_subjects := await subject_service.register_all(db_helper, auth_organization, subjects):
             return updated_subjects
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="subject(s) registration failed")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
+@router.post("/session", response_description="organization session token issuance", status_code=status.HTTP_200_OK,
+             response_model=SessionToken)
+async def issue_organization_session(request: Request, organization: AuthOrganization = Body(...)) -> dict:
+    db_helper = request.app.db_helper
+    auth_service = request.app.auth_service
+    session_service = request.app.session_service
+    organization_service = request.app.organization_service
+
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization):
+        return session_service.issue(auth_organization["_id"], auth_organization.get("credVersion", 0))
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
+
+
 @router.post("", response_description="organization retrieval", status_code=status.HTTP_200_OK,
              response_model=Organization)
-async def fetch_organization(request: Request, organization: AuthOrganization = Body(...)) -> dict:
+async def fetch_organization(request: Request, organization: AuthOrganization = Body(None),
+                             session: dict = Depends(get_session)) -> dict:
     db_helper = request.app.db_helper
     organization_service = request.app.organization_service
     auth_service = request.app.auth_service
 
-    if auth_organization := auth_service.auth_organization(db_helper, organization_service, organization):
-        return auth_organization
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization,
+                                                                 session):
+        return await auth_organization.load()
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
 @router.post("/subjects/all", response_description="all subject retrieval", status_code=status.HTTP_200_OK,
              response_model=list[Subject])
-async def fetch_subjects(request: Request, organization: AuthOrganization = Body(...)) -> list[dict]:
+async def fetch_subjects(request: Request, organization: AuthOrganization = Body(None),
+                         session: dict = Depends(get_session)) -> list[dict]:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     subject_service = request.app.subject_service
     organization_service = request.app.organization_service
 
-    if auth_organization := auth_service.auth_organization(db_helper, organization_service, organization):
-        if subjects := subject_service.retrieve_all(auth_organization):
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization,
+                                                                 session):
+        if subjects := await subject_service.retrieve_all(auth_organization):
             return subjects
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="subject(s) not available")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
@@ -66,15 +101,17 @@ async def fetch_subjects(request: Request, organization: AuthOrganization = Body
 
 @router.put("", response_description="organization modification", status_code=status.HTTP_200_OK,
             response_model=Organization)
-async def update_organization(request: Request, organization: AuthOrganization = Body(...),
+async def update_organization(request: Request, organization: AuthOrganization = Body(None),
+                              session: dict = Depends(get_session),
                               new_organization: Organization = Body(..., alias="newOrganization")) -> dict:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     organization_service = request.app.organization_service
 
-    if auth_organization := auth_service.auth_organization(db_helper, organization_service, organization):
-        if updated_organization := organization_service.update(db_helper, auth_organization, new_organization,
-                                                               hashing=False):
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization,
+                                                                 session):
+        if updated_organization := await organization_service.update(db_helper, auth_organization,
+                                                                     new_organization, hashing=False):
             return updated_organization
         raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, detail="organization modification failed")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
@@ -82,35 +119,40 @@ async def update_organization(request: Request, organization: AuthOrganization =
 
 @router.put("/credentials", response_description="organization credential modification", status_code=status.HTTP_200_OK,
             response_model=Organization)
-async def update_organization_with_credentials(request: Request, organization: AuthOrganization = Body(...),
+async def update_organization_with_credentials(request: Request, organization: AuthOrganization = Body(None),
+                                               session: dict = Depends(get_session),
                                                new_organization: Organization = Body(...,
                                                                                      alias="newOrganization")) -> dict:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     organization_service = request.app.organization_service
 
-    if auth_organization := auth_service.auth_organization(db_helper, organization_service, organization):
-        if updated_organization := organization_service.update(db_helper, auth_organization, new_organization):
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization,
+                                                                 session):
+        if updated_organization := await organization_service.update(db_helper, auth_organization, new_organization):
             return updated_organization
         raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, detail="organization modification failed")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
 @router.delete("", response_description="organization deletion", status_code=status.HTTP_200_OK)
-async def delete_organization(request: Request, organization: AuthOrganization = Body(...)) -> int:
+async def delete_organization(request: Request, organization: AuthOrganization = Body(None),
+                              session: dict = Depends(get_session)) -> int:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     organization_service = request.app.organization_service
 
-    if auth_organization := auth_service.auth_organization(db_helper, organization_service, organization):
-        if organization_service.delete(db_helper, auth_organization):
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization,
+                                                                 session):
+        if await organization_service.delete(db_helper, auth_organization):
             return status.HTTP_200_OK
         raise HTTPException(status_code=status.HTTP_204_NO_CONTENT, detail="organization deletion failed")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
 @router.delete("/subjects", response_description="subject deletion", status_code=status.HTTP_200_OK)
-async def delete_subject(request: Request, organization: AuthOrganization = Body(...),
+async def delete_subject(request: Request, organization: AuthOrganization = Body(None),
+                         session: dict = Depends(get_session),
                          sub_id: str = Query(..., alias="subId", description="subject id")) -> int:
     db_helper = request.app.db_helper
     crypto_helper = request.app.crypto_helper
@@ -119,66 +161,185 @@ async def delete_subject(request: Request, organization: AuthOrganization = Body
     organization_service = request.app.organization_service
     sub_id = crypto_helper.decrypt(sub_id)
 
-    if auth_organization := auth_service.auth_organization(db_helper, organization_service, organization):
-        if subject_service.delete(db_helper, organization_service, auth_organization, sub_id):
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization,
+                                                                 session):
+        if await subject_service.delete(db_helper, auth_organization, sub_id):
             return status.HTTP_200_OK
         raise HTTPException(status_code=status.HTTP_204_NO_CONTENT, detail="organization subject deletion failed")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
 @router.post("/emotions", response_description="emotion engagement retrieval", status_code=status.HTTP_200_OK)
-async def fetch_emotion_engagement(request: Request, organization: AuthOrganization = Body(...),
+async def fetch_emotion_engagement(request: Request, organization: AuthOrganization = Body(None),
+                                   session: dict = Depends(get_session),
                                    hours: int = Query(None, description="hours before"),
                                    weeks: int = Query(None, description="weeks before"),
                                    months: int = Query(None, description="months before"),
-                                   years: int = Query(None, description="years before")) -> dict | None:
+                                   years: int = Query(None, description="years before"),
+                                   windows: list[str] = Query(None, description="windows before (24h, 2w, 1y, all)"),
+                                   emotions: list[str] = Query(None, description="based emotions")) -> dict | None:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     organization_service = request.app.organization_service
 
-    if auth_organization := auth_service.auth_organization(db_helper, organization_service, organization):
-        if emotional_engagement := organization_service.retrieve_emotion_engagement(db_helper, auth_organization["_id"],
-                                                                                    hours=hours, weeks=weeks,
-                                                                                    months=months, years=years):
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization,
+                                                                 session):
+        if windows:
+            try:
+                emotions = [EmotionExpression[emotion.upper()].value for emotion in emotions or []]
+                emotional_engagement = await organization_service.retrieve_windowed_emotion_engagement(
+                    db_helper,
+                    auth_organization["_id"],
+                    windows,
+                    emotions
+                )
+            except KeyError as e:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="emotion not available") from e
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+            if emotional_engagement:
+                return emotional_engagement
+        elif emotional_engagement := await organization_service.retrieve_emotion_engagement(
+                db_helper,
+                auth_organization["_id"],
+                hours=hours,
+                weeks=weeks,
+                months=months,
+                years=years
+        ):
             return emotional_engagement
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,
                             detail="organization emotional engagement not available")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
+@router.post("/emotions/history", response_description="emotion history retrieval", status_code=status.HTTP_200_OK)
+async def fetch_emotion_history(request: Request, organization: AuthOrganization = Body(None),
+                                session: dict = Depends(get_session),
+                                window: str = Query("1w", description="window before (24h, 2w, 1y, all)"),
+                                width: str = Query("day", description="bucket width (hour, day, week)")) -> list:
+    db_helper = request.app.db_helper
+    auth_service = request.app.auth_service
+    organization_service = request.app.organization_service
+
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization,
+                                                                 session):
+        try:
+            return await organization_service.retrieve_emotion_history(db_helper, auth_organization["_id"], window,
+                                                                       width)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
+
+
+@router.post("/emotions/distribution", response_description="emotion distribution retrieval",
+             status_code=status.HTTP_200_OK)
+async def fetch_emotion_distribution(request: Request, organization: AuthOrganization = Body(None),
+                                     session: dict = Depends(get_session),
+                                     window: str = Query("all", description="window before (24h, 2w, 1y, all)"),
+                                     percentiles: list[int] = Query(None, description="percentiles (0 - 100)"),
+                                     subject_ids: list[str] = Query(None, description="merged subjects")) -> dict:
+    db_helper = request.app.db_helper
+    auth_service = request.app.auth_service
+    organization_service = request.app.organization_service
+
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization,
+                                                                 session):
+        try:
+            return await organization_service.retrieve_emotion_distribution(db_helper, auth_organization["_id"],
+                                                                            window, percentiles, subject_ids)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
+
+
 @router.put("/emotions", response_description="work emotion entry submission", status_code=status.HTTP_200_OK,
-            response_model=Organization)
+            response_model=IngestReceipt, openapi_extra=FACIAL_WORK_EMOTION_REQUEST_BODY)
 async def upload_work_emotion_entries(request: Request, org_key=Query(..., description="organization key"),
-                                      facial_work_emotion_entries: list[FacialWorkEmotionEntry] = Body(...)):
+                                      durable: bool = Query(False, description="acknowledge after commit")):
+    db_helper = request.app.db_helper
+    organization_service = request.app.organization_service
+    facial_emotion_ingest_buffer = request.app.facial_emotion_ingest_buffer
+
+    if not await organization_service.exists(db_helper, org_key):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, detail="work emotion entry updation failed")
+    try:
+        if PackedEmotionCodec.is_packed(request.headers.get("content-type")):
+            facial_readings = PackedEmotionCodec.decode(await request.body())
+        else:
+            facial_readings = organization_service.get_facial_readings(
+                FACIAL_WORK_EMOTION_ENTRIES.validate_json(await request.body())
+            )
+    except ValidationError as e:
+        raise RequestValidationError([{**error, "loc": ("body", *error["loc"])} for error in e.errors()]) from e
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+
+    try:
+        receipt = await facial_emotion_ingest_buffer.submit(org_key, facial_readings, durable)
+    except PyMongoError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                            detail="work emotion entry commit failed") from e
+    if durable and receipt["committed"] is None:
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, detail="work emotion entry updation failed")
+    return receipt
+
+
+@router.put("/emotions/stream", response_description="streamed work emotion entry submission",
+            status_code=status.HTTP_200_OK)
+async def stream_work_emotion_entries(request: Request, org_key=Query(..., description="organization key"),
+                                      chunk_size: int = Query(500, ge=1, le=5000, description="entries per chunk"),
+                                      max_line_size: int = Query(1 << 20, ge=1, le=1 << 24,
+                                                                 description="max bytes per entry")) -> dict:
     db_helper = request.app.db_helper
     organization_service = request.app.organization_service
+    emotion_window_service = request.app.emotion_window_service
+    sentimental_emotion_sync_worker = request.app.sentimental_emotion_sync_worker
 
-    if organization := organization_service.insert_facial_work_emotion_entries(
-            db_helper,
-            org_key,
-            facial_work_emotion_entries
-    ):
-        if sentimental_emotions := OrganizationApiHelper.get_organizational_sentimental_emotions(org_key):
-            OrganizationApiHelper.delete_organizational_sentimental_emotions(org_key)
-            if organization := organization_service.insert_sentimental_work_emotion_entries(
+    if await organization_service.exists(db_helper, org_key):
+        report = {"accepted": 0, "committed": 0, "rejected": 0, "chunks": [], "errors": [], "failedChunk": None}
+
+        try:
+            async for chunk in organization_service.stream_facial_work_emotion_entries(
                     db_helper,
+                    emotion_window_service,
                     org_key,
-                    sentimental_emotions
+                    NdjsonHelper.iter_lines(request.stream(), max_line_size),
+                    chunk_size
             ):
-                return organization
-        return organization
+                for field in ("accepted", "committed", "rejected"):
+                    report[field] += chunk[field]
+                report["chunks"].append({field: chunk[field] for field in ("chunk", "lines", "committed")})
+                report["errors"].extend(
+                    chunk["errors"][:organization_service.MAX_CHUNK_ERRORS - len(report["errors"])]
+                )
+        except PyMongoError as e:
+            report["failedChunk"] = len(report["chunks"])
+            sentimental_emotion_sync_worker.notify(org_key)
+            raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=report) from e
+        sentimental_emotion_sync_worker.notify(org_key)
+        return report
     raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, detail="work emotion entry updation failed")
 
 
 @router.post("/consultation", response_description="setup consultations on work entry submission",
              status_code=status.HTTP_200_OK)
 async def setup_consultancies_on_latest_work_emotion_entries(request: Request,
-                                                             org_key=Query(..., description="organization key")) -> int:
+                                                             org_key=Query(..., description="organization key")) \
+        -> dict:
     db_helper = request.app.db_helper
     organization_service = request.app.organization_service
+    emotion_window_service = request.app.emotion_window_service
+    emotionistant_cache_service = request.app.emotionistant_cache_service
 
-    if organization_service.init_consultancy_services_on_latest_work_emotion_entries(db_helper, org_key):
-        return status.HTTP_200_OK
+    if report := await organization_service.init_consultancy_services_on_latest_work_emotion_entries(
+            db_helper,
+            emotion_window_service,
+            emotionistant_cache_service,
+            org_key,
+            request.app.consultancy_concurrency
+    ):
+        return report
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="consultation setup failed")
 
 
@@ -186,13 +347,15 @@ async def setup_consultancies_on_latest_work_emotion_entries(request: Request,
              response_description="fetch unresponded special consideration requests",
              status_code=status.HTTP_200_OK,
              response_model=list[SpecialConsiderationRequestEntry])
-async def fetch_special_consideration_requests(request: Request, organization: AuthOrganization = Body(...)) -> list:
+async def fetch_special_consideration_requests(request: Request, organization: AuthOrganization = Body(None),
+                                               session: dict = Depends(get_session)) -> list:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     organization_service = request.app.organization_service
 
-    if auth_organization := auth_service.auth_organization(db_helper, organization_service, organization):
-        return organization_service.retrieve_unresponded_special_consideration_requests(auth_organization)
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization,
+                                                                 session):
+        return await organization_service.retrieve_unresponded_special_consideration_requests(auth_organization)
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
@@ -200,15 +363,17 @@ async def fetch_special_consideration_requests(request: Request, organization: A
              response_description="make responses for special consideration requests",
              status_code=status.HTTP_200_OK,
              response_model=Organization)
-async def response_for_special_consideration_request(request: Request, organization: AuthOrganization = Body(...),
+async def response_for_special_consideration_request(request: Request, organization: AuthOrganization = Body(None),
+                                                     session: dict = Depends(get_session),
                                                      scr_responses: list[SpecialConsiderationResponseEntry] = Body(
                                                          ..., alias="scrResponses")) -> dict:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     organization_service = request.app.organization_service
 
-    if auth_organization := auth_service.auth_organization(db_helper, organization_service, organization):
-        if updated_organization := organization_service.write_response_for_special_consideration_requests(
+    if auth_organization := await auth_service.auth_organization(db_helper, organization_service, organization,
+                                                                 session):
+        if updated_organization := await organization_service.write_response_for_special_consideration_requests(
                 db_helper,
                 auth_organization,
                 scr_responses
@@ -224,6 +389,6 @@ async def remember_me(request: Request, basic_remember_me: BasicRememberMe = Bod
     db_helper = request.app.db_helper
     organization_service = request.app.organization_service
 
-    if organization := organization_service.remember_me(db_helper, basic_remember_me):
+    if organization := await organization_service.remember_me(db_helper, basic_remember_me):
         return organization
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="not remember")
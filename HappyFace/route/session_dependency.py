@@ -0,0 +1,12 @@
+from fastapi import Request, Header, HTTPException, status
+
+
+async def get_session(request: Request, authorization: str = Header(None)) -> dict | None:
+    if authorization is None:
+        return None
+
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() == "bearer":
+        if session := request.app.session_service.verify(token):
+            return session
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid session token")
@@ -1,38 +1,57 @@
-from fastapi import APIRouter, Request, HTTPException, status, Query, Body
+from fastapi import APIRouter, Request, HTTPException, status, Query, Body, Depends
+from fastapi.responses import StreamingResponse
 
 from entity.emotion import EmotionExpression
 from entity.models import Subject, EmotionistantConsultancy, Message, AuthSubject, SubjectRememberMe, \
-    SpecialConsiderationRequest
+    SpecialConsiderationRequest, SessionToken
+from helper.stream.sse.sse_helper import SseHelper
+from route.session_dependency import get_session
 
 router = APIRouter()
 
 
+@router.post("/session", response_description="subject session token issuance", status_code=status.HTTP_200_OK,
+             response_model=SessionToken)
+async def issue_subject_session(request: Request, subject: AuthSubject = Body(...)) -> dict:
+    db_helper = request.app.db_helper
+    auth_service = request.app.auth_service
+    session_service = request.app.session_service
+    subject_service = request.app.subject_service
+
+    if auth_org_subject := await auth_service.auth_subject(db_helper, subject_service, subject):
+        auth_organization = auth_org_subject["auth_organization"]
+        auth_subject = auth_org_subject["auth_subject"]
+        return session_service.issue(auth_organization["_id"], auth_subject.get("credVersion", 0), auth_subject["_id"])
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
+
+
 @router.post("", response_description="subject retrieval", status_code=status.HTTP_200_OK, response_model=Subject)
-async def fetch_subject(request: Request, subject: AuthSubject = Body(...)) -> dict:
+async def fetch_subject(request: Request, subject: AuthSubject = Body(None),
+                        session: dict = Depends(get_session)) -> dict:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     subject_service = request.app.subject_service
 
-    if auth_org_subject := auth_service.auth_subject(db_helper, subject_service, subject):
-        return auth_org_subject["auth_subject"]
+    if auth_org_subject := await auth_service.auth_subject(db_helper, subject_service, subject, session):
+        return await auth_org_subject["auth_subject"].load()
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
 @router.put("", response_description="subject modification", status_code=status.HTTP_200_OK,
             response_model=Subject)
-async def update_subject(request: Request, subject: AuthSubject = Body(...),
+async def update_subject(request: Request, subject: AuthSubject = Body(None),
+                         session: dict = Depends(get_session),
                          new_subject: Subject = Body(..., alias="newSubject")) -> dict:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     subject_service = request.app.subject_service
-    organization_service = request.app.organization_service
 
-    if auth_org_subject := auth_service.auth_subject(db_helper, subject_service, subject):
+    if auth_org_subject := await auth_service.auth_subject(db_helper, subject_service, subject, session):
         auth_organization = auth_org_subject["auth_organization"]
         auth_subject = auth_org_subject["auth_subject"]
 
-        if updated_subject := subject_service.update(db_helper, organization_service, auth_organization, auth_subject,
-                                                     new_subject, hashing=False):
+        if updated_subject := await subject_service.update(db_helper, auth_organization, auth_subject, new_subject,
+                                                           hashing=False):
             return updated_subject
         raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, detail="subject modification failed")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
@@ -40,114 +59,216 @@ async def update_subject(request: Request, subject: AuthSubject = Body(...),
 
 @router.put("/credentials", response_description="subject credential modification", status_code=status.HTTP_200_OK,
             response_model=Subject)
-async def update_subject_with_credentials(request: Request, subject: AuthSubject = Body(...),
+async def update_subject_with_credentials(request: Request, subject: AuthSubject = Body(None),
+                                          session: dict = Depends(get_session),
                                           new_subject: Subject = Body(..., alias="newSubject")) -> dict:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     subject_service = request.app.subject_service
-    organization_service = request.app.organization_service
 
-    if auth_org_subject := auth_service.auth_subject(db_helper, subject_service, subject):
+    if auth_org_subject := await auth_service.auth_subject(db_helper, subject_service, subject, session):
         auth_organization = auth_org_subject["auth_organization"]
         auth_subject = auth_org_subject["auth_subject"]
 
-        if updated_subject := subject_service.update(db_helper, organization_service, auth_organization, auth_subject,
-                                                     new_subject):
+        if updated_subject := await subject_service.update(db_helper, auth_organization, auth_subject,
+                                                           new_subject):
             return updated_subject
         raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, detail="subject modification failed")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
 @router.post("/emotions", response_description="emotion engagement retrieval", status_code=status.HTTP_200_OK)
-async def fetch_emotion_engagement(request: Request, subject: AuthSubject = Body(...),
+async def fetch_emotion_engagement(request: Request, subject: AuthSubject = Body(None),
+                                   session: dict = Depends(get_session),
                                    hours: int = Query(None, description="hours before"),
                                    weeks: int = Query(None, description="weeks before"),
                                    months: int = Query(None, description="months before"),
                                    years: int = Query(None, description="years before"),
-                                   emotion: str = Query(None, description="based emotion")) -> dict | float:
+                                   emotion: str = Query(None, description="based emotion"),
+                                   windows: list[str] = Query(None, description="windows before (24h, 2w, 1y, all)"),
+                                   emotions: list[str] = Query(None, description="based emotions")) -> dict | float:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     subject_service = request.app.subject_service
 
-    if auth_org_subject := auth_service.auth_subject(db_helper, subject_service, subject):
+    if auth_org_subject := await auth_service.auth_subject(db_helper, subject_service, subject, session):
         org_id = auth_org_subject["auth_organization"]["_id"]
         sub_id = auth_org_subject["auth_subject"]["_id"]
 
-        if emotion:
+        if windows:
+            try:
+                emotions = [EmotionExpression[emotion.upper()].value for emotion in emotions or []]
+                emotional_engagement = await subject_service.retrieve_windowed_emotion_engagement(db_helper, org_id,
+                                                                                                  sub_id, windows,
+                                                                                                  emotions)
+            except KeyError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="emotion not available",
+                ) from e
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+        elif emotion:
             try:
                 emotion = emotion.upper()
                 emotion = EmotionExpression[emotion].value
-                emotional_engagement = subject_service.retrieve_emotion_engagement(db_helper, org_id, sub_id,
-                                                                                   hours=hours,
-                                                                                   weeks=weeks, months=months,
-                                                                                   years=years,
-                                                                                   emotion=emotion)
+                emotional_engagement = await subject_service.retrieve_emotion_engagement(db_helper, org_id, sub_id,
+                                                                                         hours=hours,
+                                                                                         weeks=weeks, months=months,
+                                                                                         years=years,
+                                                                                         emotion=emotion)
             except KeyError as e:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="emotion not available",
                 ) from e
         else:
-            emotional_engagement = subject_service.retrieve_emotion_engagement(db_helper, org_id, sub_id, hours=hours,
-                                                                               weeks=weeks, months=months, years=years)
+            emotional_engagement = await subject_service.retrieve_emotion_engagement(db_helper, org_id, sub_id,
+                                                                                     hours=hours, weeks=weeks,
+                                                                                     months=months, years=years)
         if emotional_engagement:
             return emotional_engagement
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="emotion engagement not available")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
+@router.post("/emotions/history", response_description="emotion history retrieval", status_code=status.HTTP_200_OK)
+async def fetch_emotion_history(request: Request, subject: AuthSubject = Body(None),
+                                session: dict = Depends(get_session),
+                                window: str = Query("1w", description="window before (24h, 2w, 1y, all)"),
+                                width: str = Query("day", description="bucket width (hour, day, week)")) -> list:
+    db_helper = request.app.db_helper
+    auth_service = request.app.auth_service
+    subject_service = request.app.subject_service
+
+    if auth_org_subject := await auth_service.auth_subject(db_helper, subject_service, subject, session):
+        try:
+            return await subject_service.retrieve_emotion_history(
+                db_helper,
+                auth_org_subject["auth_organization"]["_id"],
+                auth_org_subject["auth_subject"]["_id"],
+                window,
+                width
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
+
+
+@router.post("/emotions/distribution", response_description="emotion distribution retrieval",
+             status_code=status.HTTP_200_OK)
+async def fetch_emotion_distribution(request: Request, subject: AuthSubject = Body(None),
+                                     session: dict = Depends(get_session),
+                                     window: str = Query("all", description="window before (24h, 2w, 1y, all)"),
+                                     percentiles: list[int] = Query(None, description="percentiles (0 - 100)")) \
+        -> dict:
+    db_helper = request.app.db_helper
+    auth_service = request.app.auth_service
+    subject_service = request.app.subject_service
+
+    if auth_org_subject := await auth_service.auth_subject(db_helper, subject_service, subject, session):
+        try:
+            return await subject_service.retrieve_emotion_distribution(
+                db_helper,
+                auth_org_subject["auth_organization"]["_id"],
+                auth_org_subject["auth_subject"]["_id"],
+                window,
+                percentiles
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
+
+
 @router.post("/consultation",
              response_description="assistant consultation retrieval",
              status_code=status.HTTP_200_OK,
              response_model=EmotionistantConsultancy)
-async def fetch_consultancy(request: Request, subject: AuthSubject = Body(...)) -> dict:
+async def fetch_consultancy(request: Request, subject: AuthSubject = Body(None),
+                            session: dict = Depends(get_session)) -> dict:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     subject_service = request.app.subject_service
 
-    if auth_org_subject := auth_service.auth_subject(db_helper, subject_service, subject):
+    if auth_org_subject := await auth_service.auth_subject(db_helper, subject_service, subject, session):
         auth_subject = auth_org_subject["auth_subject"]
 
-        if consultancy := subject_service.retrieve_consultancy(auth_subject):
+        if consultancy := await subject_service.retrieve_consultancy(auth_subject):
             return consultancy
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="consultancy not available")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
 @router.post("/consultation/chat", response_description="chat with assistant", status_code=status.HTTP_200_OK)
-async def chat_with_assistant(request: Request, subject: AuthSubject = Body(...),
+async def chat_with_assistant(request: Request, subject: AuthSubject = Body(None),
+                              session: dict = Depends(get_session),
                               message: Message = Body(...)) -> dict:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     subject_service = request.app.subject_service
-    organization_service = request.app.organization_service
+    emotion_window_service = request.app.emotion_window_service
+    emotionistant_cache_service = request.app.emotionistant_cache_service
+    chat_history_service = request.app.chat_history_service
 
-    if auth_org_subject := auth_service.auth_subject(db_helper, subject_service, subject):
+    if auth_org_subject := await auth_service.auth_subject(db_helper, subject_service, subject, session):
         auth_organization = auth_org_subject["auth_organization"]
         auth_subject = auth_org_subject["auth_subject"]
 
-        if conversation := subject_service.build_user_assistant_conversation(db_helper, organization_service,
-                                                                             auth_organization, auth_subject, message):
+        if conversation := await subject_service.build_user_assistant_conversation(db_helper, emotion_window_service,
+                                                                                   emotionistant_cache_service,
+                                                                                   chat_history_service,
+                                                                                   auth_organization, auth_subject,
+                                                                                   message):
             return conversation
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="chat with assistant failed")
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
+@router.post("/consultation/chat/stream", response_description="stream chat with assistant as server-sent events",
+             status_code=status.HTTP_200_OK)
+async def stream_chat_with_assistant(request: Request, subject: AuthSubject = Body(None),
+                                     session: dict = Depends(get_session),
+                                     message: Message = Body(...)) -> StreamingResponse:
+    db_helper = request.app.db_helper
+    auth_service = request.app.auth_service
+    subject_service = request.app.subject_service
+    emotion_window_service = request.app.emotion_window_service
+    emotionistant_cache_service = request.app.emotionistant_cache_service
+    chat_history_service = request.app.chat_history_service
+
+    if auth_org_subject := await auth_service.auth_subject(db_helper, subject_service, subject, session):
+        return StreamingResponse(
+            subject_service.stream_user_assistant_conversation(
+                db_helper,
+                emotion_window_service,
+                emotionistant_cache_service,
+                chat_history_service,
+                auth_org_subject["auth_organization"],
+                auth_org_subject["auth_subject"],
+                message
+            ),
+            media_type=SseHelper.MEDIA_TYPE,
+            headers=SseHelper.HEADERS
+        )
+    raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
+
+
 @router.post("/scr", response_description="request a special consideration", status_code=status.HTTP_200_OK)
-async def request_special_consideration(request: Request, subject: AuthSubject = Body(...),
+async def request_special_consideration(request: Request, subject: AuthSubject = Body(None),
+                                        session: dict = Depends(get_session),
                                         special_consideration_request: SpecialConsiderationRequest =
                                         Body(..., alias="specialConsiderationRequest")) -> dict:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     subject_service = request.app.subject_service
 
-    if auth_org_subject := auth_service.auth_subject(db_helper, subject_service, subject):
+    if auth_org_subject := await auth_service.auth_subject(db_helper, subject_service, subject, session):
         auth_organization = auth_org_subject["auth_organization"]
         auth_subject = auth_org_subject["auth_subject"]
 
-        if analysis := subject_service.create_special_consideration_request(
+        if analysis := await subject_service.create_special_consideration_request(
                 special_consideration_request.message,
-                auth_organization["orgKey"],
+                (await auth_organization.load("orgKey"))["orgKey"],
                 auth_subject["_id"]
         ):
             return analysis
@@ -160,14 +281,15 @@ async def request_special_consideration(request: Request, subject: AuthSubject =
     response_description="fetch responded special consideration requests",
     status_code=status.HTTP_200_OK,
     response_model=list[SpecialConsiderationRequest])
-async def fetch_responded_special_consideration_requests(request: Request, subject: AuthSubject = Body(...)) -> dict:
+async def fetch_responded_special_consideration_requests(request: Request, subject: AuthSubject = Body(None),
+                                                         session: dict = Depends(get_session)) -> dict:
     db_helper = request.app.db_helper
     auth_service = request.app.auth_service
     subject_service = request.app.subject_service
 
-    if auth_org_subject := auth_service.auth_subject(db_helper, subject_service, subject):
+    if auth_org_subject := await auth_service.auth_subject(db_helper, subject_service, subject, session):
         auth_subject = auth_org_subject["auth_subject"]
-        return subject_service.fetch_responded_special_consideration_requests(auth_subject)
+        return await subject_service.fetch_responded_special_consideration_requests(auth_subject)
     raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="unauthorized request")
 
 
@@ -177,6 +299,6 @@ async def remember_me(request: Request, subject_remember_me: SubjectRememberMe =
     db_helper = request.app.db_helper
     subject_service = request.app.subject_service
 
-    if subject := subject_service.remember_me(db_helper, subject_remember_me):
+    if subject := await subject_service.remember_me(db_helper, subject_remember_me):
         return subject
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="not remember")
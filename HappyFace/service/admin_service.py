@@ -1,20 +1,23 @@
 from fastapi.encoders import jsonable_encoder
 
 from entity.models import AuthAdmin, BasicRememberMe, Admin
-from helper.database.mongodb.db_helper import DbHelper
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from helper.database.mongodb.document_loader import DocumentLoader
 from helper.hash.hash_helper import HashHelper
 
 
 class AdminService:
+    IDENTITY_PROJECTION = {"username": True, "password": True}
+
     @staticmethod
-    def authenticate(db_helper: DbHelper, admin: AuthAdmin) -> dict | None:
-        if auth_admin := db_helper.find_one(
-                {"username": admin.username, "password": admin.password}, {}
+    async def authenticate(db_helper: AsyncDbHelper, admin: AuthAdmin) -> dict | None:
+        if auth_admin := await db_helper.find_one(
+                {"username": admin.username, "password": admin.password}, AdminService.IDENTITY_PROJECTION
         ):
-            return auth_admin
+            return DocumentLoader(db_helper, {"_id": auth_admin["_id"]}, auth_admin)
 
     @staticmethod
-    def update(db_helper: DbHelper, admin: dict, new_admin: Admin, hashing: bool = True) -> dict:
+    async def update(db_helper: AsyncDbHelper, admin: dict, new_admin: Admin, hashing: bool = True) -> dict:
         new_jsonable_admin = jsonable_encoder(new_admin)
         new_jsonable_admin["_id"] = admin["_id"]
 
@@ -26,10 +29,10 @@ class AdminService:
             new_jsonable_admin["username"] = admin["username"]
             new_jsonable_admin["password"] = admin["password"]
 
-        if admin := db_helper.update_one({"_id": admin["_id"]}, new_jsonable_admin):
+        if admin := await db_helper.update_one({"_id": admin["_id"]}, new_jsonable_admin):
             return admin
 
     @staticmethod
-    def remember_me(db_helper: DbHelper, remember_me: BasicRememberMe) -> dict | None:
-        if admin := db_helper.find_one({"authKey": remember_me.auth_key}, {}):
+    async def remember_me(db_helper: AsyncDbHelper, remember_me: BasicRememberMe) -> dict | None:
+        if admin := await db_helper.find_one({"authKey": remember_me.auth_key}, {}):
             return admin
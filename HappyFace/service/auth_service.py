@@ -1,24 +1,34 @@
 from entity.models import AuthAdmin, AuthOrganization, AuthSubject
-from helper.database.mongodb.db_helper import DbHelper
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
 from service.admin_service import AdminService
 from service.organization_service import OrganizationService
+from service.session_service import SessionService
 from service.subject_service import SubjectService
 
 
 class AuthService:
     @staticmethod
-    def auth_admin(db_helper: DbHelper, admin_service: AdminService,
-                   admin: AuthAdmin) -> dict | None:
-        if auth_admin := admin_service.authenticate(db_helper, admin):
+    async def auth_admin(db_helper: AsyncDbHelper, admin_service: AdminService,
+                         admin: AuthAdmin) -> dict | None:
+        if auth_admin := await admin_service.authenticate(db_helper, admin):
             return auth_admin
 
     @staticmethod
-    def auth_organization(db_helper: DbHelper, organization_service: OrganizationService,
-                          organization: AuthOrganization) -> dict | None:
-        if auth_organization := organization_service.authenticate(db_helper, organization):
-            return auth_organization
+    async def auth_organization(db_helper: AsyncDbHelper, organization_service: OrganizationService,
+                                organization: AuthOrganization | None, session: dict | None = None) -> dict | None:
+        if session:
+            if session["scope"] == SessionService.ORGANIZATION_SCOPE:
+                return await organization_service.authenticate_session(db_helper, session)
+        elif organization:
+            if auth_organization := await organization_service.authenticate(db_helper, organization):
+                return auth_organization
 
     @staticmethod
-    def auth_subject(db_helper: DbHelper, subject_service: SubjectService, subject: AuthSubject) -> dict | None:
-        if auth_org_subject := subject_service.authenticate(db_helper, subject):
-            return auth_org_subject
+    async def auth_subject(db_helper: AsyncDbHelper, subject_service: SubjectService,
+                           subject: AuthSubject | None, session: dict | None = None) -> dict | None:
+        if session:
+            if session["scope"] == SessionService.SUBJECT_SCOPE:
+                return await subject_service.authenticate_session(db_helper, session)
+        elif subject:
+            if auth_org_subject := await subject_service.authenticate(db_helper, subject):
+                return auth_org_subject
@@ -0,0 +1,65 @@
+from fastapi.encoders import jsonable_encoder
+
+from entity.models import Message
+from helper.api.subject_api_helper import SubjectApiHelper
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from service.emotionistant_cache_service import EmotionistantCacheService
+
+
+class ChatHistoryService:
+    def __init__(self, recent_messages: int, summary_batch: int):
+        self.__recent_messages = recent_messages
+        self.__summary_batch = summary_batch
+
+    @staticmethod
+    def get_chat_summary(summary: str | None, messages: list[dict]) -> str | None:
+        if summarization := SubjectApiHelper.get_profile_summary(
+                {
+                    "conversationSummary": summary or "No earlier conversation",
+                    "conversation": [{"sender": message["sender"], "body": message["body"]} for message in messages]
+                }
+        ):
+            return summarization["profileSummary"]
+
+    async def summarize(self, db_helper: AsyncDbHelper, emotionistant_cache_service: EmotionistantCacheService,
+                        org_id: str, sub_id: str, consultancy: dict):
+        chat = consultancy["chat"]
+        summarized_count = consultancy.get("summarizedCount", 0)
+        boundary = len(chat) - self.__recent_messages
+
+        if boundary - summarized_count < self.__summary_batch:
+            return
+        messages = chat[summarized_count:boundary]
+        if summary := await emotionistant_cache_service.retrieve(
+                db_helper,
+                "chatSummary",
+                {"summary": consultancy.get("summary"), "messages": messages},
+                ChatHistoryService.get_chat_summary,
+                consultancy.get("summary"),
+                messages
+        ):
+            if modification := await db_helper.set_fields(
+                    {"_id": org_id},
+                    {
+                        "subjects.$[s].consultancies.$[c].summary": summary,
+                        "subjects.$[s].consultancies.$[c].summarizedCount": boundary
+                    },
+                    array_filters=[{"s._id": sub_id}, {"c._id": consultancy["_id"]}],
+                    collection="organizations"
+            ):
+                if modification.matched_count >= 1:
+                    consultancy["summary"] = summary
+                    consultancy["summarizedCount"] = boundary
+
+    async def retrieve_history(self, db_helper: AsyncDbHelper, emotionistant_cache_service: EmotionistantCacheService,
+                               org_id: str, sub_id: str, consultancy: dict | None) -> list[dict]:
+        if not consultancy:
+            return []
+        await self.summarize(db_helper, emotionistant_cache_service, org_id, sub_id, consultancy)
+        chat = consultancy["chat"]
+
+        if summary := consultancy.get("summary"):
+            history = chat[max(consultancy.get("summarizedCount", 0),
+                               len(chat) - self.__recent_messages - self.__summary_batch):]
+            return [jsonable_encoder(Message(body=f"Summary of our earlier conversation: {summary}"))] + history
+        return chat[-self.__recent_messages:] if self.__recent_messages else []
@@ -0,0 +1,378 @@
+from datetime import datetime, timedelta
+
+from entity.emotion import EmotionExpression
+from helper.analytics.streaming.quantile_sketch import QuantileSketch
+from helper.analytics.streaming.streaming_moments import StreamingMoments
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from helper.datetime.date_time_helper import DateTimeHelper
+from service.work_emotion_service import WorkEmotionService
+
+
+class EmotionRollupService:
+    COLLECTION = "emotion_rollups"
+    MIN_ACCURACY = 80
+    HOUR = "hour"
+    DAY = "day"
+    LIFETIME = "all"
+    STATS = ("count", "accurate", "arousal", "valence")
+    DIMENSIONS = ("arousal", "valence")
+    DISTRIBUTION_STATS = ("accurate", "arousal", "valence", "arousalSq", "valenceSq", "arousalBins", "valenceBins")
+    WIDTH_UNITS = {"hour": "hours", "day": "days", "week": "weeks"}
+    MAX_HISTOGRAM_BINS = 5000
+    PERCENTILES = (10, 50, 90)
+
+    @staticmethod
+    def get_condition(org_id: str, sub_id: str = None, granularity: str = LIFETIME,
+                      bucket_start: datetime = None) -> dict:
+        return {"orgId": org_id, "subjectId": sub_id, "granularity": granularity, "bucketStart": bucket_start}
+
+    @staticmethod
+    def get_projection(*stats: str) -> dict:
+        return {f"expressions.{emotion.value}.{stat}": True for emotion in EmotionExpression for stat in stats}
+
+    @staticmethod
+    def get_empty_stats() -> dict:
+        return {emotion.value: dict.fromkeys(EmotionRollupService.STATS, 0) for emotion in EmotionExpression}
+
+    @staticmethod
+    def get_updates(documents: list[dict]) -> list[tuple[dict, dict, None]]:
+        increments = {}
+
+        for document in documents:
+            meta = document[WorkEmotionService.META_FIELD]
+            recorded_on = document[WorkEmotionService.TIME_FIELD]
+            expression_field = f"expressions.{document['expression']}"
+            accurate = document.get("accuracy", 0) >= EmotionRollupService.MIN_ACCURACY
+            buckets = (
+                (EmotionRollupService.HOUR, DateTimeHelper.floor_datetime(recorded_on, "hours")),
+                (EmotionRollupService.DAY, DateTimeHelper.floor_datetime(recorded_on, "days")),
+                (EmotionRollupService.LIFETIME, None)
+            )
+
+            for sub_id in (meta["subjectId"], None):
+                for granularity, bucket_start in buckets:
+                    increment = increments.setdefault((meta["orgId"], sub_id, granularity, bucket_start), {})
+                    increment["total"] = increment.get("total", 0) + 1
+                    increment[f"{expression_field}.count"] = increment.get(f"{expression_field}.count", 0) + 1
+
+                    if accurate:
+                        fields = [(f"{expression_field}.accurate", 1)]
+                        for dimension in EmotionRollupService.DIMENSIONS:
+                            value = document[dimension]
+                            fields.extend([
+                                (f"{expression_field}.{dimension}", value),
+                                (f"{expression_field}.{dimension}Sq", value * value),
+                                (f"{expression_field}.{dimension}Bins.{QuantileSketch.get_bin(value)}", 1)
+                            ])
+                        for field, value in fields:
+                            increment[field] = increment.get(field, 0) + value
+        return [
+            (EmotionRollupService.get_condition(*bucket), {"$inc": increment}, None)
+            for bucket, increment in increments.items()
+        ]
+
+    @staticmethod
+    async def record(db_helper: AsyncDbHelper, documents: list[dict]):
+        await db_helper.bulk_update(EmotionRollupService.get_updates(documents), upsert=True,
+                                    collection=EmotionRollupService.COLLECTION)
+
+    @staticmethod
+    async def count(db_helper: AsyncDbHelper, org_id: str, sub_id: str = None) -> int:
+        if lifetime := await db_helper.find_one(EmotionRollupService.get_condition(org_id, sub_id), {"total": True},
+                                                collection=EmotionRollupService.COLLECTION):
+            return lifetime["total"]
+        return 0
+
+    @staticmethod
+    def add_stats(expression_stats: dict, expression: str, stats: dict):
+        for stat in EmotionRollupService.STATS:
+            expression_stats[expression][stat] += stats.get(stat, 0)
+
+    @staticmethod
+    def get_reading_stats(work_emotion: dict) -> dict:
+        if work_emotion.get("accuracy", 0) >= EmotionRollupService.MIN_ACCURACY:
+            return {"count": 1, "accurate": 1, "arousal": work_emotion["arousal"], "valence": work_emotion["valence"]}
+        return {"count": 1}
+
+    @staticmethod
+    def get_bounds(since: datetime) -> tuple:
+        return since, DateTimeHelper.ceil_datetime(since, "hours"), DateTimeHelper.ceil_datetime(since, "days")
+
+    @staticmethod
+    def get_bucket_conditions(org_id: str, sub_id: str | list[str], window_bounds: list[tuple],
+                              lifetime: bool) -> list[dict]:
+        scope = {"orgId": org_id, "subjectId": {"$in": sub_id} if isinstance(sub_id, list) else sub_id}
+        conditions = [
+            {**scope, "granularity": EmotionRollupService.HOUR, "bucketStart": {"$gte": hour_start, "$lt": day_start}}
+            for _, hour_start, day_start in window_bounds
+        ]
+        if window_bounds:
+            day_start = min(day_start for _, _, day_start in window_bounds)
+            conditions.append({**scope, "granularity": EmotionRollupService.DAY, "bucketStart": {"$gte": day_start}})
+        if lifetime:
+            conditions.append({**scope, "granularity": EmotionRollupService.LIFETIME})
+        return conditions
+
+    @staticmethod
+    def in_window(bucket: dict, bounds: tuple | None) -> bool:
+        if bounds is None:
+            return bucket["granularity"] == EmotionRollupService.LIFETIME
+        _, hour_start, day_start = bounds
+        if bucket["granularity"] == EmotionRollupService.HOUR:
+            return hour_start <= bucket["bucketStart"] < day_start
+        return bucket["granularity"] == EmotionRollupService.DAY and bucket["bucketStart"] >= day_start
+
+    @staticmethod
+    async def retrieve_windowed_expression_stats(db_helper: AsyncDbHelper, org_id: str, sub_id: str = None,
+                                                 windows: dict[str, datetime | None] = None) -> dict[str, dict]:
+        windowed_stats = {window: EmotionRollupService.get_empty_stats() for window in windows}
+        window_bounds = {
+            window: EmotionRollupService.get_bounds(since)
+            for window, since in windows.items()
+            if since is not None
+        }
+        conditions = EmotionRollupService.get_bucket_conditions(org_id, sub_id, list(window_bounds.values()),
+                                                                len(window_bounds) < len(windows))
+
+        async for bucket in db_helper.find_all(
+                {"$or": conditions},
+                {"_id": False, "granularity": True, "bucketStart": True,
+                 **EmotionRollupService.get_projection(*EmotionRollupService.STATS)},
+                collection=EmotionRollupService.COLLECTION
+        ):
+            for window in windows:
+                if EmotionRollupService.in_window(bucket, window_bounds.get(window)):
+                    for expression, stats in bucket.get("expressions", {}).items():
+                        EmotionRollupService.add_stats(windowed_stats[window], expression, stats)
+
+        if window_bounds:
+            for work_emotion in await WorkEmotionService.retrieve_between(
+                    db_helper,
+                    org_id,
+                    sub_id,
+                    [(since, hour_start) for since, hour_start, _ in window_bounds.values()],
+                    {"_id": False, "recordedOn": True, "expression": True, "accuracy": True, "arousal": True,
+                     "valence": True}
+            ):
+                reading_stats = EmotionRollupService.get_reading_stats(work_emotion)
+                for window, (since, hour_start, _) in window_bounds.items():
+                    if since <= work_emotion["recordedOn"] < hour_start:
+                        EmotionRollupService.add_stats(windowed_stats[window], work_emotion["expression"],
+                                                       reading_stats)
+        return windowed_stats
+
+    @staticmethod
+    async def retrieve_expression_stats(db_helper: AsyncDbHelper, org_id: str, sub_id: str = None,
+                                        since: datetime = None) -> dict:
+        windowed_stats = await EmotionRollupService.retrieve_windowed_expression_stats(db_helper, org_id, sub_id,
+                                                                                      {"window": since})
+        return windowed_stats["window"]
+
+    @staticmethod
+    async def retrieve_expression_distributions(db_helper: AsyncDbHelper, org_id: str, sub_id: str | list[str] = None,
+                                                since: datetime = None) -> dict[str, dict]:
+        distributions = {
+            emotion.value: {
+                dimension: (StreamingMoments(), QuantileSketch())
+                for dimension in EmotionRollupService.DIMENSIONS
+            }
+            for emotion in EmotionExpression
+        }
+        window_bounds = [EmotionRollupService.get_bounds(since)] if since is not None else []
+
+        async for bucket in db_helper.find_all(
+                {"$or": EmotionRollupService.get_bucket_conditions(org_id, sub_id, window_bounds, since is None)},
+                {"_id": False, **EmotionRollupService.get_projection(*EmotionRollupService.DISTRIBUTION_STATS)},
+                collection=EmotionRollupService.COLLECTION
+        ):
+            for expression, stats in bucket.get("expressions", {}).items():
+                for dimension, (moments, sketch) in distributions[expression].items():
+                    moments.merge(StreamingMoments.from_sums(stats.get("accurate", 0), stats.get(dimension, 0),
+                                                             stats.get(f"{dimension}Sq", 0)))
+                    sketch.merge(QuantileSketch.from_bins(stats.get(f"{dimension}Bins", {})))
+
+        for since, hour_start, _ in window_bounds:
+            for work_emotion in await WorkEmotionService.retrieve_between(
+                    db_helper,
+                    org_id,
+                    sub_id,
+                    [(since, hour_start)],
+                    {"_id": False, "expression": True, "accuracy": True, "arousal": True, "valence": True}
+            ):
+                if work_emotion.get("accuracy", 0) >= EmotionRollupService.MIN_ACCURACY:
+                    for dimension, (moments, sketch) in distributions[work_emotion["expression"]].items():
+                        moments.add(work_emotion[dimension])
+                        sketch.add(work_emotion[dimension])
+        return distributions
+
+    @staticmethod
+    def describe_distribution(moments: StreamingMoments, sketch: QuantileSketch, percentiles: list[int]) -> dict:
+        return {
+            "count": moments.count,
+            "mean": moments.mean,
+            "variance": moments.variance,
+            "std": moments.std,
+            "percentiles": {f"p{percentile}": sketch.quantile(percentile) for percentile in percentiles}
+        }
+
+    @staticmethod
+    async def retrieve_distribution_report(db_helper: AsyncDbHelper, org_id: str, sub_id: str | list[str] = None,
+                                           since: datetime = None, percentiles: list[int] = None) -> dict[str, dict]:
+        percentiles = percentiles or EmotionRollupService.PERCENTILES
+        distributions = await EmotionRollupService.retrieve_expression_distributions(db_helper, org_id, sub_id,
+                                                                                     since)
+        return {
+            expression: {
+                dimension: EmotionRollupService.describe_distribution(moments, sketch, percentiles)
+                for dimension, (moments, sketch) in dimensions.items()
+            }
+            for expression, dimensions in distributions.items()
+        }
+
+    @staticmethod
+    async def retrieve_expression_tally(db_helper: AsyncDbHelper, org_id: str, sub_id: str = None,
+                                        since: datetime = None) -> dict:
+        expression_stats = await EmotionRollupService.retrieve_expression_stats(db_helper, org_id, sub_id, since)
+        return {expression: stats["accurate"] for expression, stats in expression_stats.items()}
+
+    @staticmethod
+    async def retrieve_windowed_engagements(db_helper: AsyncDbHelper, org_id: str, sub_id: str = None,
+                                            windows: dict[str, datetime | None] = None,
+                                            emotions: list[str] = None) -> dict[str, dict] | None:
+        if tot_work_emotions := await EmotionRollupService.count(db_helper, org_id, sub_id):
+            windowed_stats = await EmotionRollupService.retrieve_windowed_expression_stats(db_helper, org_id, sub_id,
+                                                                                          windows)
+            return {
+                window: {
+                    expression: stats["accurate"] / tot_work_emotions
+                    for expression, stats in expression_stats.items()
+                    if not emotions or expression in emotions
+                }
+                for window, expression_stats in windowed_stats.items()
+            }
+
+    @staticmethod
+    def get_histogram_bucket(bucket_start: datetime, expression_stats: dict) -> dict:
+        accurate = sum(stats["accurate"] for stats in expression_stats.values())
+        return {
+            "bucketStart": bucket_start,
+            "expressions": {expression: stats["count"] for expression, stats in expression_stats.items()},
+            "arousal": sum(stats["arousal"] for stats in expression_stats.values()) / accurate if accurate else 0,
+            "valence": sum(stats["valence"] for stats in expression_stats.values()) / accurate if accurate else 0
+        }
+
+    @staticmethod
+    def check_histogram_bins(since: datetime, unit: str):
+        if (datetime.now() - since) // timedelta(**{unit: 1}) + 1 > EmotionRollupService.MAX_HISTOGRAM_BINS:
+            raise ValueError(f"histogram exceeds {EmotionRollupService.MAX_HISTOGRAM_BINS} buckets, widen the width")
+
+    @staticmethod
+    async def retrieve_expression_histogram(db_helper: AsyncDbHelper, org_id: str, sub_id: str = None,
+                                            since: datetime = None, width: str = "day") -> list[dict]:
+        if width not in EmotionRollupService.WIDTH_UNITS:
+            raise ValueError(f"invalid width: {width}")
+        unit = EmotionRollupService.WIDTH_UNITS[width]
+        if since is not None:
+            EmotionRollupService.check_histogram_bins(since, unit)
+        granularity = EmotionRollupService.HOUR if width == "hour" else EmotionRollupService.DAY
+        condition = {"orgId": org_id, "subjectId": sub_id, "granularity": granularity}
+        conditions = [condition]
+
+        if since is not None:
+            hour_start = DateTimeHelper.ceil_datetime(since, "hours")
+            rollup_start = DateTimeHelper.ceil_datetime(since, "days") if width != "hour" else hour_start
+            condition["bucketStart"] = {"$gte": rollup_start}
+            if rollup_start > hour_start:
+                conditions.append({**condition, "granularity": EmotionRollupService.HOUR,
+                                   "bucketStart": {"$gte": hour_start, "$lt": rollup_start}})
+        bins = {}
+
+        async for bucket in db_helper.find_all(
+                {"$or": conditions},
+                {"_id": False, "bucketStart": True, **EmotionRollupService.get_projection(*EmotionRollupService.STATS)},
+                collection=EmotionRollupService.COLLECTION
+        ):
+            bin_stats = bins.setdefault(DateTimeHelper.floor_datetime(bucket["bucketStart"], unit),
+                                        EmotionRollupService.get_empty_stats())
+            for expression, stats in bucket.get("expressions", {}).items():
+                EmotionRollupService.add_stats(bin_stats, expression, stats)
+
+        if since is not None:
+            for work_emotion in await WorkEmotionService.retrieve_between(
+                    db_helper,
+                    org_id,
+                    sub_id,
+                    [(since, hour_start)],
+                    {"_id": False, "recordedOn": True, "expression": True, "accuracy": True, "arousal": True,
+                     "valence": True}
+            ):
+                bin_stats = bins.setdefault(DateTimeHelper.floor_datetime(work_emotion["recordedOn"], unit),
+                                            EmotionRollupService.get_empty_stats())
+                EmotionRollupService.add_stats(bin_stats, work_emotion["expression"],
+                                               EmotionRollupService.get_reading_stats(work_emotion))
+            bin_start = DateTimeHelper.floor_datetime(since, unit)
+        elif bins:
+            bin_start = min(bins)
+            EmotionRollupService.check_histogram_bins(bin_start, unit)
+        else:
+            return []
+
+        histogram = []
+        bin_end = DateTimeHelper.floor_datetime(datetime.now(), unit)
+        while bin_start <= bin_end:
+            histogram.append(
+                EmotionRollupService.get_histogram_bucket(
+                    bin_start,
+                    bins.get(bin_start) or EmotionRollupService.get_empty_stats()
+                )
+            )
+            bin_start += timedelta(**{unit: 1})
+        return histogram
+
+    @staticmethod
+    async def retrieve_expression_engagements(db_helper: AsyncDbHelper, expression: str, org_id: str = None) -> dict:
+        condition = {"subjectId": {"$ne": None}, "granularity": EmotionRollupService.LIFETIME}
+        if org_id is not None:
+            condition["orgId"] = org_id
+        projection = {"_id": False, "orgId": True, "subjectId": True, "total": True,
+                      f"expressions.{expression}.count": True}
+        expression_engagements = {}
+
+        async for lifetime in db_helper.find_all(condition, projection, collection=EmotionRollupService.COLLECTION):
+            if lifetime["total"]:
+                engaged = lifetime.get("expressions", {}).get(expression, {}).get("count", 0)
+                expression_engagements[(lifetime["orgId"], lifetime["subjectId"])] = engaged / lifetime["total"]
+        return expression_engagements
+
+    @staticmethod
+    async def delete_all(db_helper: AsyncDbHelper, org_id: str, sub_id: str = None) -> int:
+        if sub_id is not None:
+            updates = []
+
+            async for bucket in db_helper.find_all({"orgId": org_id, "subjectId": sub_id}, {},
+                                                   collection=EmotionRollupService.COLLECTION):
+                decrement = {"total": -bucket.get("total", 0)}
+                for expression, stats in bucket.get("expressions", {}).items():
+                    for stat, value in stats.items():
+                        if isinstance(value, dict):
+                            decrement.update({
+                                f"expressions.{expression}.{stat}.{index}": -count
+                                for index, count in value.items()
+                            })
+                        else:
+                            decrement[f"expressions.{expression}.{stat}"] = -value
+                updates.append(
+                    (
+                        EmotionRollupService.get_condition(org_id, None, bucket["granularity"],
+                                                           bucket["bucketStart"]),
+                        {"$inc": decrement},
+                        None
+                    )
+                )
+            await db_helper.bulk_update(updates, collection=EmotionRollupService.COLLECTION)
+            condition = {"orgId": org_id, "subjectId": sub_id}
+        else:
+            condition = {"orgId": org_id}
+
+        deletion = await db_helper.delete_all(condition, collection=EmotionRollupService.COLLECTION)
+        return deletion.deleted_count
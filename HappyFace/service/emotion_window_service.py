@@ -0,0 +1,73 @@
+from collections import OrderedDict
+
+from helper.analytics.numpy.emotion_frame import EmotionFrame
+from helper.analytics.numpy.emotion_window import EmotionWindow
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from helper.datetime.date_time_helper import DateTimeHelper
+from service.work_emotion_service import WorkEmotionService
+
+
+class EmotionWindowService:
+    WORK_EMOTION_PROJECTION = {
+        "_id": False,
+        "meta.subjectId": True,
+        "recordedOn": True,
+        "expression": True,
+        "accuracy": True,
+        "arousal": True,
+        "valence": True,
+        "specialConsiderationMessage": True
+    }
+
+    def __init__(self, span_hours: int, slot_minutes: int, refresh_seconds: int, max_windows: int):
+        self.__span_hours = span_hours
+        self.__span = span_hours * 3600 * 10 ** 6
+        self.__slot = slot_minutes * 60 * 10 ** 6
+        self.__refresh = refresh_seconds * 10 ** 6
+        self.__max_windows = max_windows
+        self.__windows = OrderedDict()
+
+    def put_window(self, org_id: str, sub_id: str, window: EmotionWindow, loaded_on: int):
+        self.__windows[(org_id, sub_id)] = (loaded_on, window)
+        self.__windows.move_to_end((org_id, sub_id))
+
+        while len(self.__windows) > self.__max_windows:
+            self.__windows.popitem(last=False)
+
+    def get_window(self, org_id: str, sub_id: str, now: int) -> EmotionWindow | None:
+        if entry := self.__windows.get((org_id, sub_id)):
+            loaded_on, window = entry
+            if now - loaded_on < self.__refresh:
+                self.__windows.move_to_end((org_id, sub_id))
+                return window
+            del self.__windows[(org_id, sub_id)]
+
+    async def retrieve_windows(self, db_helper: AsyncDbHelper, org_id: str, sub_ids: list[str]) \
+            -> dict[str, EmotionWindow]:
+        now = DateTimeHelper.get_current_epoch()
+        windows = {sub_id: self.get_window(org_id, sub_id, now) for sub_id in sub_ids}
+
+        if missing_sub_ids := [sub_id for sub_id, window in windows.items() if window is None]:
+            work_emotions = await WorkEmotionService.retrieve_all(
+                db_helper,
+                org_id,
+                missing_sub_ids,
+                since=DateTimeHelper.subtract_datetime(hours=self.__span_hours),
+                project_vals=EmotionWindowService.WORK_EMOTION_PROJECTION
+            )
+            subject_ids = [work_emotion["meta"]["subjectId"] for work_emotion in work_emotions]
+            frames = EmotionFrame.from_documents(work_emotions).group_by(subject_ids)
+
+            for sub_id in missing_sub_ids:
+                windows[sub_id] = EmotionWindow(self.__span, self.__slot)
+                windows[sub_id].add(frames.get(sub_id, EmotionFrame.empty()), now)
+                self.put_window(org_id, sub_id, windows[sub_id], now)
+        return windows
+
+    def record(self, org_id: str, documents: list[dict]):
+        now = DateTimeHelper.get_current_epoch()
+        subject_ids = [document[WorkEmotionService.META_FIELD]["subjectId"] for document in documents]
+
+        for sub_id, frame in EmotionFrame.from_documents(documents).group_by(subject_ids).items():
+            if window := self.get_window(org_id, sub_id, now):
+                window.add(frame, now)
@@ -0,0 +1,91 @@
+import asyncio
+import json
+from concurrent.futures import Executor
+from datetime import datetime
+from typing import Any, Callable
+
+import pymongo
+from pymongo import IndexModel
+
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from helper.datetime.date_time_helper import DateTimeHelper
+from helper.hash.hash_helper import HashHelper
+from helper.log.default.log_helper import LogHelper
+
+
+class EmotionistantCacheService:
+    COLLECTION = "emotionistant_cache"
+
+    def __init__(self, ttl_hours: int, max_entries: int, evict_every: int):
+        self.__ttl_hours = ttl_hours
+        self.__max_entries = max_entries
+        self.__evict_every = evict_every
+        self.__inflight = {}
+        self.__insertions = 0
+
+    async def setup(self, db_helper: AsyncDbHelper, log_helper: LogHelper):
+        await db_helper.ensure_indexes(
+            {
+                EmotionistantCacheService.COLLECTION: [
+                    IndexModel([("createdOn", pymongo.ASCENDING)], name="createdOn",
+                               expireAfterSeconds=self.__ttl_hours * 3600),
+                    IndexModel([("accessedOn", pymongo.ASCENDING)], name="accessedOn")
+                ]
+            },
+            log_helper
+        )
+
+    @staticmethod
+    def get_key(kind: str, payload: Any) -> str:
+        return HashHelper.hash(
+            json.dumps({"kind": kind, "payload": payload}, sort_keys=True, separators=(",", ":"), default=str)
+        )
+
+    async def retrieve(self, db_helper: AsyncDbHelper, kind: str, payload: Any, compute: Callable, *args,
+                       executor: Executor = None) -> Any:
+        key = EmotionistantCacheService.get_key(kind, payload)
+
+        if (inflight := self.__inflight.get(key)) is not None:
+            return await asyncio.shield(inflight)
+        if (value := await self.find(db_helper, key)) is not None:
+            return value
+
+        inflight = self.__inflight[key] = asyncio.get_running_loop().run_in_executor(executor, compute, *args)
+        try:
+            if (value := await asyncio.shield(inflight)) is not None:
+                await self.store(db_helper, key, kind, value)
+            return value
+        finally:
+            self.__inflight.pop(key, None)
+
+    async def find(self, db_helper: AsyncDbHelper, key: str) -> Any:
+        if entry := await db_helper.find_one(
+                {"_id": key, "createdOn": {"$gte": DateTimeHelper.subtract_datetime(hours=self.__ttl_hours)}},
+                {"value": True},
+                collection=EmotionistantCacheService.COLLECTION
+        ):
+            await db_helper.set_fields({"_id": key}, {"accessedOn": datetime.now()},
+                                       collection=EmotionistantCacheService.COLLECTION)
+            return entry["value"]
+
+    async def store(self, db_helper: AsyncDbHelper, key: str, kind: str, value: Any):
+        now = datetime.now()
+
+        await db_helper.bulk_update(
+            [({"_id": key}, {"$set": {"kind": kind, "value": value, "createdOn": now, "accessedOn": now}}, None)],
+            upsert=True,
+            collection=EmotionistantCacheService.COLLECTION
+        )
+        self.__insertions += 1
+        if self.__insertions % self.__evict_every == 0:
+            await self.evict(db_helper)
+
+    async def evict(self, db_helper: AsyncDbHelper) -> int:
+        excess = await db_helper.count({}, collection=EmotionistantCacheService.COLLECTION) - self.__max_entries
+        if excess <= 0:
+            return 0
+        cursor = db_helper.find_all({}, {"_id": True}, sort=[("accessedOn", pymongo.ASCENDING)],
+                                    collection=EmotionistantCacheService.COLLECTION).limit(excess)
+        keys = [entry["_id"] for entry in await cursor.to_list(length=excess)]
+        deletion = await db_helper.delete_all({"_id": {"$in": keys}}, collection=EmotionistantCacheService.COLLECTION)
+        return deletion.deleted_count
@@ -0,0 +1,48 @@
+from entity.emotion import EmotionExpression
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from service.emotion_rollup_service import EmotionRollupService
+
+
+class HappyEngagementService:
+    @staticmethod
+    def get_happy_engagement(organization: dict, happy_engagements: dict) -> float:
+        subjects = organization.get("subjects", [])
+        happy_engagement = sum(
+            happy_engagements.get((organization["_id"], subject["_id"]), 0)
+            for subject in subjects
+        )
+
+        if subjects:
+            happy_engagement /= len(subjects)
+        return happy_engagement
+
+    @staticmethod
+    async def refresh(db_helper: AsyncDbHelper, org_id: str) -> float | None:
+        if organization := await db_helper.find_one({"_id": org_id}, {"subjects": {"_id": True}},
+                                                    collection="organizations"):
+            happy_engagements = await EmotionRollupService.retrieve_expression_engagements(
+                db_helper,
+                EmotionExpression.HAPPY.value,
+                org_id
+            )
+            happy_engagement = HappyEngagementService.get_happy_engagement(organization, happy_engagements)
+            await db_helper.set_fields({"_id": org_id}, {"happyEngagement": happy_engagement},
+                                       collection="organizations")
+            return happy_engagement
+
+    @staticmethod
+    async def reconcile(db_helper: AsyncDbHelper) -> int:
+        happy_engagements = await EmotionRollupService.retrieve_expression_engagements(
+            db_helper,
+            EmotionExpression.HAPPY.value
+        )
+        updates = []
+
+        async for organization in db_helper.find_all({}, {"subjects": {"_id": True}, "happyEngagement": True},
+                                                     collection="organizations"):
+            happy_engagement = HappyEngagementService.get_happy_engagement(organization, happy_engagements)
+            if organization.get("happyEngagement") != happy_engagement:
+                updates.append(({"_id": organization["_id"]}, {"$set": {"happyEngagement": happy_engagement}}, None))
+
+        await db_helper.bulk_update(updates, collection="organizations")
+        return len(updates)
@@ -1,40 +1,72 @@
-import copy
+import asyncio
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator
 
+import pymongo
 from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
+from pymongo.errors import PyMongoError
+from requests import RequestException
 from varname import nameof
 
-from entity.emotion import EmotionExpression
 from entity.models import EmotionistantConsultancy
 from entity.models import Message
 from entity.models import (
     Organization, FacialWorkEmotionEntry, AuthOrganization, BasicRememberMe, SpecialConsiderationRequestEntry,
     SpecialConsiderationRequest
 )
+from helper.analytics.numpy.emotion_window import EmotionWindow
 from helper.api.subject_api_helper import SubjectApiHelper
-from helper.database.mongodb.db_helper import DbHelper
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from helper.database.mongodb.document_loader import DocumentLoader
 from helper.datetime.date_time_helper import DateTimeHelper
 from helper.hash.hash_helper import HashHelper
+from service.emotion_rollup_service import EmotionRollupService
+from service.emotion_window_service import EmotionWindowService
+from service.emotionistant_cache_service import EmotionistantCacheService
+from service.happy_engagement_service import HappyEngagementService
+from service.session_service import SessionService
 from service.subject_service import SubjectService
+from service.work_emotion_service import WorkEmotionService
 
 
 class OrganizationService:
+    IDENTITY_PROJECTION = {"name": True, "orgKey": True, "password": True, "credVersion": True}
+    CONSULTANCY_PROJECTION = {
+        f"subjects.{field}": True
+        for field in ("_id", "name", "address", "dob", "gender", "salary", "hiddenDiseases", "family")
+    }
+    MAX_CHUNK_ERRORS = 10
+
     @staticmethod
-    def authenticate(db_helper: DbHelper, organization: AuthOrganization) -> dict | None:
-        if auth_organization := db_helper.find_one(
-                {"orgKey": organization.org_key, "password": organization.password}, {}, collection="organizations"
+    async def authenticate(db_helper: AsyncDbHelper, organization: AuthOrganization) -> dict | None:
+        if auth_organization := await db_helper.find_one(
+                {"orgKey": organization.org_key, "password": organization.password},
+                OrganizationService.IDENTITY_PROJECTION,
+                collection="organizations"
         ):
-            return auth_organization
+            return DocumentLoader(db_helper, {"_id": auth_organization["_id"]}, auth_organization,
+                                  collection="organizations")
+
+    @staticmethod
+    async def authenticate_session(db_helper: AsyncDbHelper, session: dict) -> DocumentLoader | None:
+        if auth_organization := await db_helper.find_one({"_id": session["orgId"]}, {"credVersion": True},
+                                                         collection="organizations"):
+            if SessionService.is_current(session, auth_organization):
+                return DocumentLoader(db_helper, {"_id": auth_organization["_id"]}, auth_organization,
+                                      collection="organizations")
 
     @staticmethod
-    def register(db_helper: DbHelper, organization: Organization) -> dict:
+    async def register(db_helper: AsyncDbHelper, organization: Organization) -> dict:
         organization_key = organization.org_key
         organization.org_key = HashHelper.hash(organization.org_key)
         organization.password = HashHelper.hash(organization.password)
         organization.auth_key = HashHelper.hash(organization.auth_key)
         jsonable_organization = jsonable_encoder(organization)
-        organization_insertion = db_helper.insert_one(jsonable_organization, collection="organizations")
-        registered_organization = db_helper.find_one(
+        jsonable_organization["happyEngagement"] = 0
+        organization_insertion = await db_helper.insert_one(jsonable_organization, collection="organizations")
+        registered_organization = await db_helper.find_one(
             {"_id": organization_insertion.inserted_id},
             {},
             collection="organizations"
@@ -43,7 +75,7 @@ class OrganizationService:
         return registered_organization
 
     @staticmethod
-    def retrieve_all(db_helper: DbHelper) -> list[dict]:
+    async def retrieve_all(db_helper: AsyncDbHelper, limit: int = 50, offset: int = 0) -> list[dict]:
         projection = {
             "name": True,
             "address": True,
@@ -53,40 +85,22 @@ class OrganizationService:
             "displayLogo": True,
             "email": True,
             "subjects": {
-                "_id": True,
-                "workEmotions": True
+                "_id": True
             },
+            "happyEngagement": True,
             "subscription": True
         }
-        organization_result = db_helper.find_all({}, projection, collection="organizations")
-        organizations = list(organization_result)
-
-        for organization in organizations:
-            subjects = organization["subjects"]
-            happy_engagement = 0
-
-            for subject in subjects:
-                work_emotions = subject["workEmotions"]
-                subject_happy_engagement = sum(
-                    work_emotion["expression"] == EmotionExpression.HAPPY.value
-                    for work_emotion in work_emotions
-                )
-                if work_emotions:
-                    subject_happy_engagement /= len(work_emotions)
-                happy_engagement += subject_happy_engagement
-                del subject["workEmotions"]
-
-            if subjects:
-                happy_engagement /= len(subjects)
-            organization["happyEngagement"] = happy_engagement
-
-        if organizations:
-            organizations = sorted(organizations, key=lambda org: org["happyEngagement"], reverse=True)
-        return organizations
+        organization_result = db_helper.find_all(
+            {},
+            projection,
+            sort=[("happyEngagement", pymongo.DESCENDING), ("_id", pymongo.ASCENDING)],
+            collection="organizations"
+        )
+        return await organization_result.skip(offset).limit(limit).to_list(length=None)
 
     @staticmethod
-    def update(db_helper: DbHelper, organization: dict, new_organization: Organization | dict,
-               hashing=True) -> dict:
+    async def update(db_helper: AsyncDbHelper, organization: DocumentLoader, new_organization: Organization | dict,
+                     hashing=True) -> dict:
         new_jsonable_organization = jsonable_encoder(new_organization)
         new_jsonable_organization["_id"] = organization["_id"]
 
@@ -94,98 +108,292 @@ class OrganizationService:
             new_jsonable_organization["orgKey"] = HashHelper.hash(new_jsonable_organization["orgKey"])
             new_jsonable_organization["password"] = HashHelper.hash(new_jsonable_organization["password"])
             new_jsonable_organization["authKey"] = HashHelper.hash(new_jsonable_organization["authKey"])
+            await organization.load("credVersion")
+            new_jsonable_organization["credVersion"] = organization.get("credVersion", 0) + 1
         else:
-            new_jsonable_organization["orgKey"] = organization["orgKey"]
-            new_jsonable_organization["password"] = organization["password"]
+            new_jsonable_organization.pop("orgKey", None)
+            new_jsonable_organization.pop("password", None)
+        await organization.load("subjects._id", "subjects.credVersion")
+        cred_versions = {
+            subject["_id"]: subject["credVersion"]
+            for subject in organization.get("subjects", [])
+            if "credVersion" in subject
+        }
+        for subject in new_jsonable_organization.get("subjects", []):
+            if subject["_id"] in cred_versions:
+                subject["credVersion"] = cred_versions[subject["_id"]]
 
-        if organization := db_helper.update_one({"_id": organization["_id"]}, new_jsonable_organization,
-                                                collection="organizations"):
+        if organization := await db_helper.update_one({"_id": organization["_id"]}, new_jsonable_organization,
+                                                      collection="organizations"):
             return organization
 
     @staticmethod
-    def delete(db_helper: DbHelper, organization: dict) -> bool:
-        if deletion := db_helper.delete_one({"_id": organization["_id"]}, collection="organizations"):
+    async def delete(db_helper: AsyncDbHelper, organization: dict) -> bool:
+        if deletion := await db_helper.delete_one({"_id": organization["_id"]}, collection="organizations"):
+            await WorkEmotionService.delete_all(db_helper, organization["_id"])
+            await EmotionRollupService.delete_all(db_helper, organization["_id"])
             return deletion.deleted_count >= 1
 
-    def insert_facial_work_emotion_entries(self, db_helper: DbHelper, org_key: str,
-                                           facial_work_emotion_entries: list[FacialWorkEmotionEntry]) -> dict | None:
-        if organization := db_helper.find_one({"orgKey": org_key}, {}, collection="organizations"):
-            old_organization = copy.copy(organization)
-            subjects = organization["subjects"]
-            face_snap_dir_subjects = {}
+    @staticmethod
+    async def exists(db_helper: AsyncDbHelper, org_key: str) -> bool:
+        return await db_helper.find_one({"orgKey": org_key}, {"_id": True}, collection="organizations") is not None
+
+    @staticmethod
+    def get_facial_readings(facial_work_emotion_entries: list[FacialWorkEmotionEntry]) -> list[tuple[str, dict]]:
+        return [
+            (entry.face_snap_dir_uri, we)
+            for entry in facial_work_emotion_entries
+            for we in jsonable_encoder(entry.work_emotions)
+        ]
+
+    @staticmethod
+    async def get_facial_documents(db_helper: AsyncDbHelper, org_key: str,
+                                   facial_readings: list[tuple[str, dict]]) -> tuple[str, list[dict]] | None:
+        if organization := await db_helper.find_one(
+                {"orgKey": org_key},
+                {"subjects": {"_id": True, "faceSnapDirURI": True}},
+                collection="organizations"
+        ):
+            org_id = organization["_id"]
+            face_snap_dir_subject_ids = {
+                subject["faceSnapDirURI"]: subject["_id"]
+                for subject in organization["subjects"]
+            }
+            return org_id, [
+                WorkEmotionService.to_document(org_id, face_snap_dir_subject_ids[face_snap_dir_uri], we)
+                for face_snap_dir_uri, we in facial_readings
+                if face_snap_dir_uri in face_snap_dir_subject_ids
+            ]
 
-            for subject in subjects:
-                face_snap_dir_subjects[subject["faceSnapDirURI"]] = subject
+    @staticmethod
+    async def record_work_emotions(db_helper: AsyncDbHelper, emotion_window_service: EmotionWindowService,
+                                   org_id: str, documents: list[dict]):
+        await EmotionRollupService.record(db_helper, documents)
+        await HappyEngagementService.refresh(db_helper, org_id)
+        emotion_window_service.record(org_id, documents)
 
-            for entry in facial_work_emotion_entries:
-                if subject := face_snap_dir_subjects[entry.face_snap_dir_uri]:
-                    subject["workEmotions"].extend(jsonable_encoder(entry.work_emotions))
+    @staticmethod
+    async def insert_facial_work_emotion_readings(db_helper: AsyncDbHelper,
+                                                  emotion_window_service: EmotionWindowService, org_key: str,
+                                                  facial_readings: list[tuple[str, dict]]) -> int | None:
+        if facial_documents := await OrganizationService.get_facial_documents(db_helper, org_key, facial_readings):
+            org_id, documents = facial_documents
+            await WorkEmotionService.insert_all(db_helper, documents)
+            await OrganizationService.record_work_emotions(db_helper, emotion_window_service, org_id, documents)
+            return len(documents)
 
-            if organization := self.update(db_helper, old_organization, organization, hashing=False):
-                return organization
+    @staticmethod
+    async def insert_facial_work_emotion_entries(db_helper: AsyncDbHelper, emotion_window_service: EmotionWindowService,
+                                                 org_key: str,
+                                                 facial_work_emotion_entries: list[FacialWorkEmotionEntry]) \
+            -> int | None:
+        return await OrganizationService.insert_facial_work_emotion_readings(
+            db_helper,
+            emotion_window_service,
+            org_key,
+            OrganizationService.get_facial_readings(facial_work_emotion_entries)
+        )
 
-    def insert_sentimental_work_emotion_entries(self, db_helper: DbHelper, org_key: str,
-                                                sentimental_work_emotion_entries: list[dict]) \
-            -> dict | None:
-        if organization := db_helper.find_one({"orgKey": org_key}, {}, collection="organizations"):
-            old_organization = copy.copy(organization)
-            subjects = organization["subjects"]
-            id_subjects = {}
+    @staticmethod
+    async def ingest_facial_work_emotion_chunk(db_helper: AsyncDbHelper, emotion_window_service: EmotionWindowService,
+                                               org_key: str, index: int, lines: list[int],
+                                               entries: list[FacialWorkEmotionEntry], errors: list[dict]) -> dict:
+        committed = await OrganizationService.insert_facial_work_emotion_entries(db_helper, emotion_window_service,
+                                                                                 org_key, entries)
+        return {
+            "chunk": index,
+            "lines": [lines[0], lines[-1]],
+            "accepted": len(entries),
+            "committed": committed or 0,
+            "rejected": len(errors),
+            "errors": errors[:OrganizationService.MAX_CHUNK_ERRORS]
+        }
+
+    @staticmethod
+    async def stream_facial_work_emotion_entries(db_helper: AsyncDbHelper, emotion_window_service: EmotionWindowService,
+                                                 org_key: str, lines: AsyncIterator[tuple[int, bytes | None]],
+                                                 chunk_size: int) -> AsyncIterator[dict]:
+        entries = []
+        errors = []
+        line_nos = []
+        index = 0
+
+        async for line_no, line in lines:
+            line_nos.append(line_no)
+            if line is None:
+                errors.append({"line": line_no, "detail": "line too large"})
+            else:
+                try:
+                    entries.append(FacialWorkEmotionEntry.model_validate_json(line))
+                except ValidationError as e:
+                    errors.append({"line": line_no, "detail": e.errors()[0]["msg"]})
+
+            if len(line_nos) == chunk_size:
+                yield await OrganizationService.ingest_facial_work_emotion_chunk(
+                    db_helper, emotion_window_service, org_key, index, line_nos, entries, errors
+                )
+                entries, errors, line_nos = [], [], []
+                index += 1
 
-            for subject in subjects:
-                id_subjects[subject["_id"]] = subject
+        if line_nos:
+            yield await OrganizationService.ingest_facial_work_emotion_chunk(
+                db_helper, emotion_window_service, org_key, index, line_nos, entries, errors
+            )
+
+    @staticmethod
+    async def insert_sentimental_work_emotion_entries(db_helper: AsyncDbHelper,
+                                                      emotion_window_service: EmotionWindowService, org_key: str,
+                                                      sentimental_work_emotion_entries: list[dict]) \
+            -> int | None:
+        if organization := await db_helper.find_one(
+                {"orgKey": org_key},
+                {"subjects": {"_id": True}},
+                collection="organizations"
+        ):
+            org_id = organization["_id"]
+            subject_ids = {subject["_id"] for subject in organization["subjects"]}
+            readings = []
 
             for entry in sentimental_work_emotion_entries:
-                if subject := id_subjects[entry["subjectId"]]:
-                    new_work_emotions = jsonable_encoder(entry["workEmotions"])
-                    subject["workEmotions"].extend(new_work_emotions)
-                    for we in new_work_emotions:
-                        if "specialConsiderationMessage" in we:
-                            subject["specialConsiderationRequests"].append(
-                                jsonable_encoder(
-                                    SpecialConsiderationRequest(
-                                        message=we["specialConsiderationMessage"],
-                                        requestedOn=we["recordedOn"]
-                                    )
+                if entry["subjectId"] not in subject_ids:
+                    continue
+                for we in jsonable_encoder(entry["workEmotions"]):
+                    document = WorkEmotionService.to_document(org_id, entry["subjectId"], we)
+                    readings.append((entry["subjectId"], we, WorkEmotionService.with_sync_key(document)))
+            synced_keys = await WorkEmotionService.retrieve_sync_keys(
+                db_helper,
+                org_id,
+                [document for _, _, document in readings]
+            )
+            documents = []
+            special_consideration_requests = {}
+
+            for subject_id, we, document in readings:
+                if document[WorkEmotionService.SYNC_KEY] in synced_keys:
+                    continue
+                documents.append(document)
+                if "specialConsiderationMessage" in we:
+                    special_consideration_requests.setdefault(subject_id, []).append(
+                        DateTimeHelper.with_epochs(
+                            jsonable_encoder(
+                                SpecialConsiderationRequest(
+                                    message=we["specialConsiderationMessage"],
+                                    requestedOn=we["recordedOn"]
                                 )
-                            )
+                            ),
+                            "requestedOn"
+                        )
+                    )
+            updates = [
+                (
+                    {"_id": org_id},
+                    {"$push": {"subjects.$[s].specialConsiderationRequests": {"$each": subject_requests}}},
+                    [{"s._id": subject_id}]
+                )
+                for subject_id, subject_requests in special_consideration_requests.items()
+            ]
+            await WorkEmotionService.insert_all(db_helper, documents)
+            await OrganizationService.record_work_emotions(db_helper, emotion_window_service, org_id, documents)
+            await db_helper.bulk_update(updates, collection="organizations")
+            return len(documents)
 
-            if organization := self.update(db_helper, old_organization, organization, hashing=False):
-                return organization
+    @staticmethod
+    def init_consultancy(bio_data_profile_summary: str, emotion_engagement_profile_summary: str) -> dict | None:
+        if consultation := SubjectApiHelper.get_init_consultancy(
+                bio_data_profile_summary,
+                emotion_engagement_profile_summary
+        ):
+            message = Message(body=consultation)
+            consultancy = EmotionistantConsultancy(_id=str(uuid.uuid4()), chat=[message])
+            return DateTimeHelper.with_epochs(jsonable_encoder(consultancy), "consultedOn")
 
     @staticmethod
-    def init_consultancy_services_on_latest_work_emotion_entries(db_helper: DbHelper, org_key: str) -> bool | None:
-        if organization := db_helper.find_one({"orgKey": org_key}, {}, collection="organizations"):
-            old_organization = copy.copy(organization)
-            subjects = organization["subjects"]
-            for subject in subjects:
-                bio_data_profile = SubjectService.get_bio_data_profile(subject)
-                bio_data_profile_summary = SubjectService.get_profile_summary(bio_data_profile)
-                if emotion_engagement_profile := SubjectService.get_emotion_engagement_profile(
-                        subject["workEmotions"]):
-                    emotion_engagement_profile_summary = SubjectService.get_profile_summary(
-                        emotion_engagement_profile)
+    async def init_subject_consultancy(db_helper: AsyncDbHelper, emotionistant_cache_service: EmotionistantCacheService,
+                                       executor: ThreadPoolExecutor, subject: dict,
+                                       work_emotions: EmotionWindow) -> dict | str:
+        try:
+            bio_data_profile_summary = await SubjectService.retrieve_profile_summary(
+                db_helper,
+                emotionistant_cache_service,
+                SubjectService.get_bio_data_profile(subject),
+                executor
+            )
+            if emotion_engagement_profile := SubjectService.get_emotion_engagement_profile(work_emotions):
+                emotion_engagement_profile_summary = await SubjectService.retrieve_profile_summary(
+                    db_helper,
+                    emotionistant_cache_service,
+                    emotion_engagement_profile,
+                    executor
+                )
+            else:
+                emotion_engagement_profile_summary = "No emotion engagement profile available"
+            if consultancy := await asyncio.get_running_loop().run_in_executor(
+                    executor,
+                    OrganizationService.init_consultancy,
+                    bio_data_profile_summary,
+                    emotion_engagement_profile_summary
+            ):
+                return consultancy
+            return "consultation not available"
+        except (RequestException, PyMongoError) as e:
+            return str(e)
+
+    @staticmethod
+    async def init_consultancy_services_on_latest_work_emotion_entries(db_helper: AsyncDbHelper,
+                                                                       emotion_window_service: EmotionWindowService,
+                                                                       emotionistant_cache_service:
+                                                                       EmotionistantCacheService,
+                                                                       org_key: str, concurrency: int) -> dict | None:
+        if organization := await db_helper.find_one({"orgKey": org_key}, OrganizationService.CONSULTANCY_PROJECTION,
+                                                    collection="organizations"):
+            subjects = organization.get("subjects", [])
+            subject_windows = await emotion_window_service.retrieve_windows(
+                db_helper,
+                organization["_id"],
+                [subject["_id"] for subject in subjects]
+            )
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = await asyncio.gather(*(
+                    OrganizationService.init_subject_consultancy(
+                        db_helper,
+                        emotionistant_cache_service,
+                        executor,
+                        subject,
+                        subject_windows[subject["_id"]]
+                    )
+                    for subject in subjects
+                ), return_exceptions=True)
+            updates = []
+            failures = []
+
+            for subject, result in zip(subjects, results):
+                if isinstance(result, dict):
+                    updates.append(
+                        (
+                            {"_id": organization["_id"]},
+                            {"$push": {"subjects.$[s].consultancies": result}},
+                            [{"s._id": subject["_id"]}]
+                        )
+                    )
                 else:
-                    emotion_engagement_profile_summary = "No emotion engagement profile available"
-                if consultation := SubjectApiHelper.get_init_consultancy(
-                        bio_data_profile_summary,
-                        emotion_engagement_profile_summary
-                ):
-                    message = Message(body=consultation)
-                    consultancy = EmotionistantConsultancy(_id=str(uuid.uuid4()), chat=[message])
-                    consultancy = jsonable_encoder(consultancy)
-                    subject["consultancies"].append(consultancy)
-            if organization := OrganizationService.update(db_helper, old_organization, organization, hashing=False):
-                return organization
+                    failures.append(
+                        {
+                            "subjectId": subject["_id"],
+                            "name": subject["name"],
+                            "detail": result if isinstance(result, str) else repr(result)
+                        }
+                    )
+            await db_helper.bulk_update(updates, collection="organizations")
+            return {"initialized": len(updates), "failed": failures}
 
     @staticmethod
-    def remember_me(db_helper: DbHelper, remember_me: BasicRememberMe) -> dict | None:
-        if organization := db_helper.find_one({"authKey": remember_me.auth_key}, {},
-                                              collection="organizations"):
+    async def remember_me(db_helper: AsyncDbHelper, remember_me: BasicRememberMe) -> dict | None:
+        if organization := await db_helper.find_one({"authKey": remember_me.auth_key}, {},
+                                                    collection="organizations"):
             return organization
 
     @staticmethod
-    def retrieve_emotion_engagement(db_helper: DbHelper, org_id: str, **kwargs) -> dict | None:
+    async def retrieve_emotion_engagement(db_helper: AsyncDbHelper, org_id: str, **kwargs) -> dict | None:
         hours = weeks = months = years = 0
 
         if kwargs[nameof(hours)]:
@@ -197,33 +405,51 @@ class OrganizationService:
         if kwargs[nameof(years)]:
             years = abs(int(kwargs[nameof(years)]))
 
-        if subjects := db_helper.find_one({"_id": org_id},
-                                          {"_id": False, "subjects": {"workEmotions": True}},
-                                          collection="organizations"):
-            subject_work_emotions = subjects["subjects"]
-            subtracted_iso_datetime = DateTimeHelper.subtract_iso_datetime(hours, weeks, months, years)
-            subtracted_iso_datetime = DateTimeHelper.str_to_iso_datetime(subtracted_iso_datetime)
-            emotion_engagement = {emotion.value: 0 for emotion in EmotionExpression}
-            tot_work_emotions = 0
+        if tot_work_emotions := await EmotionRollupService.count(db_helper, org_id):
+            subtracted_datetime = DateTimeHelper.subtract_datetime(hours, weeks, months, years)
+            emotion_engagement = await EmotionRollupService.retrieve_expression_tally(
+                db_helper,
+                org_id,
+                since=subtracted_datetime
+            )
+            return {
+                key: value / tot_work_emotions
+                for key, value in emotion_engagement.items()
+            }
 
-            for subject_work_emotion in subject_work_emotions:
-                work_emotions = subject_work_emotion["workEmotions"]
-
-                for work_emotion in work_emotions:
-                    recorded_on = DateTimeHelper.str_to_iso_datetime(work_emotion["recordedOn"])
+    @staticmethod
+    async def retrieve_windowed_emotion_engagement(db_helper: AsyncDbHelper, org_id: str, windows: list[str],
+                                                   emotions: list[str] = None) -> dict | None:
+        return await EmotionRollupService.retrieve_windowed_engagements(
+            db_helper,
+            org_id,
+            windows={window: DateTimeHelper.subtract_window(window) for window in windows},
+            emotions=emotions
+        )
 
-                    if work_emotion["accuracy"] >= 80 and recorded_on >= subtracted_iso_datetime:
-                        emotion_engagement[work_emotion["expression"]] += 1
-                tot_work_emotions += len(work_emotions)
+    @staticmethod
+    async def retrieve_emotion_history(db_helper: AsyncDbHelper, org_id: str, window: str, width: str) -> list[dict]:
+        return await EmotionRollupService.retrieve_expression_histogram(
+            db_helper,
+            org_id,
+            since=DateTimeHelper.subtract_window(window),
+            width=width
+        )
 
-            if tot_work_emotions > 0:
-                return {
-                    key: value / tot_work_emotions
-                    for key, value in emotion_engagement.items()
-                }
+    @staticmethod
+    async def retrieve_emotion_distribution(db_helper: AsyncDbHelper, org_id: str, window: str,
+                                            percentiles: list[int] = None, sub_ids: list[str] = None) -> dict:
+        return await EmotionRollupService.retrieve_distribution_report(
+            db_helper,
+            org_id,
+            sub_ids,
+            since=DateTimeHelper.subtract_window(window),
+            percentiles=percentiles
+        )
 
     @staticmethod
-    def retrieve_unresponded_special_consideration_requests(organization: dict) -> list:
+    async def retrieve_unresponded_special_consideration_requests(organization: DocumentLoader) -> list:
+        await organization.load("subjects._id", "subjects.name", "subjects.specialConsiderationRequests")
         unresponded_requests = []
         for subject in organization["subjects"]:
             for request in subject["specialConsiderationRequests"]:
@@ -239,26 +465,28 @@ class OrganizationService:
         return unresponded_requests
 
     @staticmethod
-    def write_response_for_special_consideration_requests(db_helper: DbHelper, organization: dict,
-                                                          special_consideration_responses: list) -> dict:
-        old_organization = copy.copy(organization)
-        id_subject_sc_requests = {}
-        for subject in organization["subjects"]:
-            subject_id = subject["_id"]
-            id_subject_sc_requests[subject_id] = {"subject": subject, "sc_requests": []}
-            for request in subject["specialConsiderationRequests"]:
-                if request["response"] is None:
-                    id_subject_sc_requests[subject_id]["sc_requests"].append(request)
+    async def write_response_for_special_consideration_requests(db_helper: AsyncDbHelper, organization: dict,
+                                                                special_consideration_responses: list) -> dict:
+        updates = []
 
         for response in special_consideration_responses:
             response = jsonable_encoder(response)
-            response_subject_id = response["subjectId"]
-            if response_subject_id in id_subject_sc_requests:
-                id_subject_sc_request = id_subject_sc_requests[response_subject_id]
-                for request in id_subject_sc_request["sc_requests"]:
-                    if request["_id"] == response["requestId"]:
-                        request["response"] = response["message"]
-                        request["respondedOn"] = response["respondedOn"]
-
-        if organization := OrganizationService.update(db_helper, old_organization, organization, hashing=False):
+            updates.append(
+                (
+                    {"_id": organization["_id"]},
+                    {
+                        "$set": {
+                            "subjects.$[s].specialConsiderationRequests.$[r].response": response["message"],
+                            "subjects.$[s].specialConsiderationRequests.$[r].respondedOn": response["respondedOn"],
+                            "subjects.$[s].specialConsiderationRequests.$[r].respondedOnEpoch": (
+                                DateTimeHelper.iso_to_epoch(response["respondedOn"])
+                            )
+                        }
+                    },
+                    [{"s._id": response["subjectId"]}, {"r._id": response["requestId"], "r.response": None}]
+                )
+            )
+        await db_helper.bulk_update(updates, collection="organizations")
+
+        if organization := await db_helper.find_one({"_id": organization["_id"]}, {}, collection="organizations"):
             return organization
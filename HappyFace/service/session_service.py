@@ -0,0 +1,31 @@
+from helper.token.abstract_token_helper import AbstractTokenHelper
+
+
+class SessionService:
+    ORGANIZATION_SCOPE = "organization"
+    SUBJECT_SCOPE = "subject"
+
+    def __init__(self, token_helper: AbstractTokenHelper, ttl: int):
+        self.__token_helper = token_helper
+        self.__ttl = ttl
+
+    @property
+    def ttl(self) -> int:
+        return self.__ttl
+
+    def issue(self, org_id: str, cred_version: int, sub_id: str = None) -> dict:
+        claims = {
+            "scope": SessionService.SUBJECT_SCOPE if sub_id else SessionService.ORGANIZATION_SCOPE,
+            "orgId": org_id,
+            "ver": cred_version
+        }
+        if sub_id:
+            claims["subId"] = sub_id
+        return {"token": self.__token_helper.encode(claims, self.ttl), "tokenType": "bearer", "expiresIn": self.ttl}
+
+    def verify(self, token: str) -> dict | None:
+        return self.__token_helper.decode(token)
+
+    @staticmethod
+    def is_current(session: dict, principal: dict) -> bool:
+        return session["ver"] >= principal.get("credVersion", 0)
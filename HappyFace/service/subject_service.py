@@ -1,86 +1,130 @@
-import copy
+import asyncio
+from concurrent.futures import Executor
+from typing import AsyncIterator
 
 from fastapi.encoders import jsonable_encoder
+from requests import RequestException
 from varname import nameof
 
 from entity.emotion import EmotionExpression
 from entity.models import Subject, Message, AuthSubject, SubjectRememberMe, EmotionistantConsultancy
+from helper.analytics.numpy.emotion_window import EmotionWindow
 from helper.api.subject_api_helper import SubjectApiHelper
-from helper.database.mongodb.db_helper import DbHelper
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from helper.database.mongodb.document_loader import DocumentLoader
 from helper.datetime.date_time_helper import DateTimeHelper
 from helper.hash.hash_helper import HashHelper
+from helper.stream.sse.sse_helper import SseHelper
+from service.chat_history_service import ChatHistoryService
+from service.emotion_rollup_service import EmotionRollupService
+from service.emotion_window_service import EmotionWindowService
+from service.emotionistant_cache_service import EmotionistantCacheService
+from service.happy_engagement_service import HappyEngagementService
+from service.session_service import SessionService
+from service.work_emotion_service import WorkEmotionService
 
 
 class SubjectService:
     @staticmethod
-    def authenticate(db_helper: DbHelper, subject: AuthSubject) -> dict | None:
-        if auth_organization := db_helper.find_one({"orgKey": subject.org_key}, {}, collection="organizations"):
-            subjects = auth_organization["subjects"]
+    async def authenticate(db_helper: AsyncDbHelper, subject: AuthSubject) -> dict | None:
+        credentials = {"username": subject.username, "password": subject.password}
 
-            for sub in subjects:
-                if sub["username"] == subject.username and sub["password"] == subject.password:
-                    return {"auth_organization": auth_organization, "auth_subject": sub}
+        if auth_organization := await db_helper.find_one(
+                {"orgKey": subject.org_key, "subjects": {"$elemMatch": credentials}},
+                {"name": True, "orgKey": True, "subjects": {"$elemMatch": credentials}},
+                collection="organizations"
+        ):
+            auth_subject = auth_organization.pop("subjects")[0]
+            org_condition = {"_id": auth_organization["_id"]}
+
+            return {
+                "auth_organization": DocumentLoader(db_helper, org_condition, auth_organization,
+                                                    collection="organizations"),
+                "auth_subject": DocumentLoader(db_helper, org_condition, auth_subject, collection="organizations",
+                                               element_field="subjects", fully_loaded=True)
+            }
 
     @staticmethod
-    def register_all(db_helper: DbHelper, organization_service, organization: dict,
-                     subjects: list[Subject]) -> list[dict]:
-        old_organization = copy.copy(organization)
+    async def authenticate_session(db_helper: AsyncDbHelper, session: dict) -> dict | None:
+        if auth_organization := await db_helper.find_one(
+                {"_id": session["orgId"], "subjects._id": session["subId"]},
+                {"subjects": {"$elemMatch": {"_id": session["subId"]}}},
+                collection="organizations"
+        ):
+            auth_subject = auth_organization.pop("subjects")[0]
+            org_condition = {"_id": auth_organization["_id"]}
+
+            if SessionService.is_current(session, auth_subject):
+                return {
+                    "auth_organization": DocumentLoader(db_helper, org_condition, auth_organization,
+                                                        collection="organizations"),
+                    "auth_subject": DocumentLoader(db_helper, org_condition, auth_subject, collection="organizations",
+                                                   element_field="subjects", fully_loaded=True)
+                }
 
+    @staticmethod
+    async def register_all(db_helper: AsyncDbHelper, organization: dict, subjects: list[Subject]) -> list[dict]:
         for subject in subjects:
             subject.username = HashHelper.hash(subject.username)
             subject.password = HashHelper.hash(subject.password)
             subject.auth_key = HashHelper.hash(subject.auth_key)
 
         subjects = jsonable_encoder(subjects)
-        organization["subjects"].extend(subjects)
+        for subject in subjects:
+            subject.pop("workEmotions", None)
 
-        if _ := organization_service.update(db_helper, old_organization, organization, hashing=False):
-            return subjects
+        if registration := await db_helper.push_all({"_id": organization["_id"]}, {"subjects": subjects},
+                                                    collection="organizations"):
+            if registration.matched_count >= 1:
+                await HappyEngagementService.refresh(db_helper, organization["_id"])
+                return subjects
 
     @staticmethod
-    def retrieve_all(organization: dict) -> list[dict]:
+    async def retrieve_all(organization: DocumentLoader) -> list[dict]:
+        await organization.load("subjects")
         return organization["subjects"]
 
     @staticmethod
-    def update(db_helper: DbHelper, organization_service, organization: dict, subject: dict,
-               new_subject: dict, hashing=True) -> dict:
-        old_organization = copy.copy(organization)
-        subjects = organization["subjects"]
+    async def update(db_helper: AsyncDbHelper, organization: dict, subject: DocumentLoader, new_subject: dict,
+                     hashing=True) -> dict:
+        await subject.load()
         new_jsonable_subject = jsonable_encoder(new_subject)
         new_jsonable_subject["_id"] = subject["_id"]
+        new_jsonable_subject.pop("workEmotions", None)
+        new_jsonable_subject["credVersion"] = subject.get("credVersion", 0)
 
         if hashing:
             new_jsonable_subject["username"] = HashHelper.hash(new_jsonable_subject["username"])
             new_jsonable_subject["password"] = HashHelper.hash(new_jsonable_subject["password"])
             new_jsonable_subject["authKey"] = HashHelper.hash(new_jsonable_subject["authKey"])
+            new_jsonable_subject["credVersion"] += 1
         else:
             new_jsonable_subject["username"] = subject["username"]
             new_jsonable_subject["password"] = subject["password"]
 
-        for i in range(len(subjects)):
-            if subjects[i]["_id"] == subject["_id"]:
-                subjects[i] = new_jsonable_subject
-                break
-
-        if _ := organization_service.update(db_helper, old_organization, organization, hashing=False):
-            return new_jsonable_subject
+        if modification := await db_helper.set_fields(
+                {"_id": organization["_id"]},
+                {"subjects.$[s]": new_jsonable_subject},
+                array_filters=[{"s._id": subject["_id"]}],
+                collection="organizations"
+        ):
+            if modification.matched_count >= 1:
+                return new_jsonable_subject
 
     @staticmethod
-    def delete(db_helper: DbHelper, organization_service, organization: dict, sub_id: str) \
-            -> bool:
-        old_organization = copy.copy(organization)
-        subjects = organization["subjects"]
-
-        for sub in subjects:
-            if sub["_id"] == sub_id:
-                subjects.remove(sub)
-                break
-
-        if _ := organization_service.update(db_helper, old_organization, organization, hashing=False):
-            return True
+    async def delete(db_helper: AsyncDbHelper, organization: dict, sub_id: str) -> bool:
+        if deletion := await db_helper.pull({"_id": organization["_id"]}, {"subjects": {"_id": sub_id}},
+                                            collection="organizations"):
+            if deletion.modified_count >= 1:
+                await WorkEmotionService.delete_all(db_helper, organization["_id"], sub_id)
+                await EmotionRollupService.delete_all(db_helper, organization["_id"], sub_id)
+                await HappyEngagementService.refresh(db_helper, organization["_id"])
+                return True
+            return False
 
     @staticmethod
-    def retrieve_emotion_engagement(db_helper: DbHelper, org_id: str, id: str, **kwargs) -> dict | float | None:
+    async def retrieve_emotion_engagement(db_helper: AsyncDbHelper, org_id: str, id: str, **kwargs) \
+            -> dict | float | None:
         hours = weeks = months = years = 0
         emotion = None
 
@@ -95,83 +139,205 @@ class SubjectService:
         if nameof(emotion) in kwargs:
             emotion = kwargs[nameof(emotion)]
 
-        if subjects := db_helper.find_one(
-                {"_id": org_id},
-                {"_id": False, "subjects": {"_id": True, "workEmotions": True}},
-                collection="organizations",
+        tot_work_emotions = await EmotionRollupService.count(db_helper, org_id, id)
+        subtracted_datetime = DateTimeHelper.subtract_datetime(hours, weeks, months, years)
+        emotion_engagement = await EmotionRollupService.retrieve_expression_tally(
+            db_helper,
+            org_id,
+            id,
+            since=subtracted_datetime
+        )
+
+        if emotion:
+            return emotion_engagement[emotion] / tot_work_emotions if tot_work_emotions else 0
+        elif tot_work_emotions:
+            return {key: value / tot_work_emotions for key, value in emotion_engagement.items()}
+        return emotion_engagement
+
+    @staticmethod
+    async def retrieve_windowed_emotion_engagement(db_helper: AsyncDbHelper, org_id: str, id: str, windows: list[str],
+                                                   emotions: list[str] = None) -> dict:
+        if windowed_engagement := await EmotionRollupService.retrieve_windowed_engagements(
+                db_helper,
+                org_id,
+                id,
+                windows={window: DateTimeHelper.subtract_window(window) for window in windows},
+                emotions=emotions
         ):
-            subject_work_emotions = subjects["subjects"]
-            subtracted_iso_datetime = DateTimeHelper.subtract_iso_datetime(hours, weeks, months, years)
-            subtracted_iso_datetime = DateTimeHelper.str_to_iso_datetime(subtracted_iso_datetime)
-            emotion_engagement = {emotion.value: 0 for emotion in EmotionExpression}
-
-            for subject_work_emotion in subject_work_emotions:
-                if subject_work_emotion["_id"] == id:
-                    work_emotions = subject_work_emotion["workEmotions"]
-
-                    for work_emotion in work_emotions:
-                        recorded_on = DateTimeHelper.str_to_iso_datetime(work_emotion["recordedOn"])
-
-                        if work_emotion["accuracy"] >= 80 and recorded_on >= subtracted_iso_datetime:
-                            if emotion and work_emotion["expression"] == emotion:
-                                emotion_engagement[emotion] += 1
-                            else:
-                                emotion_engagement[work_emotion["expression"]] += 1
-
-                    if emotion:
-                        emotion_engagement = emotion_engagement[emotion] / len(work_emotions)
-                    elif work_emotions:
-                        emotion_engagement = {key: value / len(work_emotions) for key, value in
-                                              emotion_engagement.items()}
-                    return emotion_engagement
+            return windowed_engagement
+        return {
+            window: dict.fromkeys(emotions or [emotion.value for emotion in EmotionExpression], 0)
+            for window in windows
+        }
 
     @staticmethod
-    def retrieve_consultancy(subject: dict) -> dict | None:
+    async def retrieve_emotion_history(db_helper: AsyncDbHelper, org_id: str, id: str, window: str,
+                                       width: str) -> list[dict]:
+        return await EmotionRollupService.retrieve_expression_histogram(
+            db_helper,
+            org_id,
+            id,
+            since=DateTimeHelper.subtract_window(window),
+            width=width
+        )
+
+    @staticmethod
+    async def retrieve_emotion_distribution(db_helper: AsyncDbHelper, org_id: str, id: str, window: str,
+                                            percentiles: list[int] = None) -> dict:
+        return await EmotionRollupService.retrieve_distribution_report(
+            db_helper,
+            org_id,
+            id,
+            since=DateTimeHelper.subtract_window(window),
+            percentiles=percentiles
+        )
+
+    @staticmethod
+    async def retrieve_consultancy(subject: DocumentLoader) -> dict | None:
+        await subject.load("consultancies")
         if consultancies := subject["consultancies"]:
-            return max(consultancies, key=lambda c: c["consultedOn"])
+            return max(consultancies, key=lambda c: DateTimeHelper.get_epoch(c, "consultedOn"))
 
     @staticmethod
-    def build_user_assistant_conversation(db_helper: DbHelper, organization_service, organization, subject: dict,
-                                          message: Message) -> dict | None:
-        old_subject = copy.copy(subject)
+    async def retrieve_profile_recommendation_of(db_helper: AsyncDbHelper, emotion_window_service: EmotionWindowService,
+                                                 emotionistant_cache_service: EmotionistantCacheService,
+                                                 organization: DocumentLoader, subject: DocumentLoader) -> str | None:
+        await organization.load("name")
+        await subject.load()
         bio_data_profile = SubjectService.get_bio_data_profile(subject)
-        bio_data_profile_summary = SubjectService.get_profile_summary(bio_data_profile)
-        if emotion_engagement_profile := SubjectService.get_emotion_engagement_profile(subject["workEmotions"]):
-            emotion_engagement_profile_summary = SubjectService.get_profile_summary(emotion_engagement_profile)
-            profile_recommendation = SubjectService.get_profile_recommendation(
-                bio_data_profile_summary, emotion_engagement_profile_summary
+        bio_data_profile_summary = await SubjectService.retrieve_profile_summary(
+            db_helper,
+            emotionistant_cache_service,
+            bio_data_profile
+        )
+        subject_windows = await emotion_window_service.retrieve_windows(db_helper, organization["_id"],
+                                                                        [subject["_id"]])
+        if emotion_engagement_profile := SubjectService.get_emotion_engagement_profile(
+                subject_windows[subject["_id"]]):
+            emotion_engagement_profile_summary = await SubjectService.retrieve_profile_summary(
+                db_helper,
+                emotionistant_cache_service,
+                emotion_engagement_profile
             )
         else:
-            profile_recommendation = SubjectService.get_profile_recommendation(
-                bio_data_profile_summary, "No emotion engagement profile available"
-            )
-        if latest_consultancy := SubjectService.retrieve_consultancy(subject):
-            if query_consultancy := SubjectApiHelper.get_query_consultancy(
-                    message.body,
-                    organization["name"],
-                    subject["_id"],
-                    profile_recommendation,
-                    latest_consultancy["chat"]
+            emotion_engagement_profile_summary = "No emotion engagement profile available"
+        return await SubjectService.retrieve_profile_recommendation(
+            db_helper,
+            emotionistant_cache_service,
+            bio_data_profile_summary,
+            emotion_engagement_profile_summary
+        )
+
+    @staticmethod
+    async def save_conversation(db_helper: AsyncDbHelper, organization: DocumentLoader, subject: DocumentLoader,
+                                latest_consultancy: dict | None, message: Message, reply: str) -> dict | None:
+        if latest_consultancy:
+            messages = jsonable_encoder([message, Message(body=reply)])
+            if conversation := await db_helper.push_all(
+                    {"_id": organization["_id"]},
+                    {"subjects.$[s].consultancies.$[c].chat": messages},
+                    array_filters=[{"s._id": subject["_id"]}, {"c._id": latest_consultancy["_id"]}],
+                    collection="organizations"
             ):
-                latest_consultancy["chat"].append(message)
-                latest_consultancy["chat"].append(Message(body=query_consultancy["emotionistant"]))
+                if conversation.matched_count >= 1:
+                    latest_consultancy["chat"].extend(messages)
+                    return latest_consultancy
         else:
-            if query_consultancy := SubjectApiHelper.get_query_consultancy(
-                    message.body,
-                    organization["name"],
-                    subject["_id"],
-                    profile_recommendation,
-                    []
+            consultancy = jsonable_encoder(EmotionistantConsultancy(chat=[message, Message(body=reply)]))
+            DateTimeHelper.with_epochs(consultancy, "consultedOn")
+            if conversation := await db_helper.push_all(
+                    {"_id": organization["_id"]},
+                    {"subjects.$[s].consultancies": [consultancy]},
+                    array_filters=[{"s._id": subject["_id"]}],
+                    collection="organizations"
             ):
-                subject["consultancies"].append(
-                    EmotionistantConsultancy(
-                        chat=[message, Message(body=query_consultancy["emotionistant"])]
-                    )
-                )
-                subject = jsonable_encoder(subject)
-        if _ := SubjectService.update(db_helper, organization_service, organization, old_subject, subject,
-                                      hashing=False):
-            return SubjectService.retrieve_consultancy(subject)
+                if conversation.matched_count >= 1:
+                    return consultancy
+
+    @staticmethod
+    async def build_user_assistant_conversation(db_helper: AsyncDbHelper, emotion_window_service: EmotionWindowService,
+                                                emotionistant_cache_service: EmotionistantCacheService,
+                                                chat_history_service: ChatHistoryService,
+                                                organization: DocumentLoader, subject: DocumentLoader,
+                                                message: Message) -> dict | None:
+        profile_recommendation = await SubjectService.retrieve_profile_recommendation_of(
+            db_helper,
+            emotion_window_service,
+            emotionistant_cache_service,
+            organization,
+            subject
+        )
+        latest_consultancy = await SubjectService.retrieve_consultancy(subject)
+        chat_history = await chat_history_service.retrieve_history(
+            db_helper,
+            emotionistant_cache_service,
+            organization["_id"],
+            subject["_id"],
+            latest_consultancy
+        )
+        if query_consultancy := await asyncio.to_thread(
+                SubjectApiHelper.get_query_consultancy,
+                message.body,
+                organization["name"],
+                subject["_id"],
+                profile_recommendation,
+                chat_history
+        ):
+            return await SubjectService.save_conversation(db_helper, organization, subject, latest_consultancy,
+                                                          message, query_consultancy["emotionistant"])
+
+    @staticmethod
+    async def stream_user_assistant_conversation(db_helper: AsyncDbHelper,
+                                                 emotion_window_service: EmotionWindowService,
+                                                 emotionistant_cache_service: EmotionistantCacheService,
+                                                 chat_history_service: ChatHistoryService,
+                                                 organization: DocumentLoader, subject: DocumentLoader,
+                                                 message: Message) -> AsyncIterator[str]:
+        yield SseHelper.format_event("start", {"query": message.body})
+        response = None
+
+        try:
+            profile_recommendation = await SubjectService.retrieve_profile_recommendation_of(
+                db_helper,
+                emotion_window_service,
+                emotionistant_cache_service,
+                organization,
+                subject
+            )
+            latest_consultancy = await SubjectService.retrieve_consultancy(subject)
+            chat_history = await chat_history_service.retrieve_history(
+                db_helper,
+                emotionistant_cache_service,
+                organization["_id"],
+                subject["_id"],
+                latest_consultancy
+            )
+            response = await asyncio.to_thread(
+                SubjectApiHelper.stream_query_consultancy,
+                message.body,
+                organization["name"],
+                subject["_id"],
+                profile_recommendation,
+                chat_history
+            )
+            chunks = response.iter_content(chunk_size=None, decode_unicode=True)
+            reply = []
+
+            while chunk := await asyncio.to_thread(next, chunks, None):
+                reply.append(chunk)
+                yield SseHelper.format_event("token", chunk)
+        except RequestException:
+            yield SseHelper.format_event("error", {"detail": "chat with assistant failed"})
+            return
+        finally:
+            if response is not None:
+                response.close()
+
+        if consultancy := await SubjectService.save_conversation(db_helper, organization, subject,
+                                                                 latest_consultancy, message, "".join(reply)):
+            yield SseHelper.format_event("done", consultancy)
+        else:
+            yield SseHelper.format_event("error", {"detail": "chat with assistant failed"})
 
     @staticmethod
     def get_profile_summary(profile: dict) -> str | None:
@@ -183,6 +349,33 @@ class SubjectService:
         if recommendation := SubjectApiHelper.get_profile_recommendation(bio_data_profile, emotion_engagement_profile):
             return recommendation["profileRecommendation"]
 
+    @staticmethod
+    async def retrieve_profile_summary(db_helper: AsyncDbHelper, emotionistant_cache_service: EmotionistantCacheService,
+                                       profile: dict, executor: Executor = None) -> str | None:
+        return await emotionistant_cache_service.retrieve(
+            db_helper,
+            "profileSummary",
+            profile,
+            SubjectService.get_profile_summary,
+            profile,
+            executor=executor
+        )
+
+    @staticmethod
+    async def retrieve_profile_recommendation(db_helper: AsyncDbHelper,
+                                              emotionistant_cache_service: EmotionistantCacheService,
+                                              bio_data_profile: str, emotion_engagement_profile: str,
+                                              executor: Executor = None) -> str | None:
+        return await emotionistant_cache_service.retrieve(
+            db_helper,
+            "profileRecommendation",
+            {"bioDataProfile": bio_data_profile, "emotionEngagementProfile": emotion_engagement_profile},
+            SubjectService.get_profile_recommendation,
+            bio_data_profile,
+            emotion_engagement_profile,
+            executor=executor
+        )
+
     @staticmethod
     def get_bio_data_profile(subject: dict) -> dict:
         return {
@@ -204,45 +397,18 @@ class SubjectService:
         }
 
     @staticmethod
-    def get_classified_work_emotions(work_emotions: list, before_hours=24 * 7) -> tuple[list, list]:
-        subtracted_iso_datetime = DateTimeHelper.subtract_iso_datetime(hours=before_hours)
-        subtracted_iso_datetime = DateTimeHelper.str_to_iso_datetime(subtracted_iso_datetime)
-        facial_emotions = []
-        sentimental_emotions = []
-        for we in work_emotions:
-            if DateTimeHelper.str_to_iso_datetime(we["recordedOn"]) >= subtracted_iso_datetime:
-                if "specialConsiderationMessage" in we:
-                    sentimental_emotions.append(we)
-                else:
-                    facial_emotions.append(we)
-        return facial_emotions, sentimental_emotions
-
-    @staticmethod
-    def analyze_work_emotions(work_emotions: list) -> tuple:
-        emotion_engagement = {emotion.value: {"tally": 0, "avg_aro": 0, "avg_val": 0} for emotion in EmotionExpression}
-        for emotion in work_emotions:
-            emotion_engagement[emotion["expression"]]["tally"] += 1
-            emotion_engagement[emotion["expression"]]["avg_aro"] += emotion["arousal"]
-            emotion_engagement[emotion["expression"]]["avg_val"] += emotion["valence"]
-        for k, v in emotion_engagement.items():
-            if emotion_engagement[k]["avg_aro"]:
-                emotion_engagement[k]["avg_aro"] /= emotion_engagement[k]["tally"]
-            if emotion_engagement[k]["avg_val"]:
-                emotion_engagement[k]["avg_val"] /= emotion_engagement[k]["tally"]
-        mostly_engaging_emotion = max(emotion_engagement, key=lambda x: emotion_engagement[x]["tally"])
-        return emotion_engagement, mostly_engaging_emotion
+    def analyze_work_emotions(work_emotions: EmotionWindow, sentimental: bool) -> tuple:
+        return work_emotions.analyze(sentimental, DateTimeHelper.get_current_epoch())
 
     @staticmethod
-    def get_emotion_engagement_profile(work_emotions: list) -> dict:
-        classified_facial_work_emotions, classified_sentimental_work_emotions = (
-            SubjectService.get_classified_work_emotions(work_emotions)
-        )
+    def get_emotion_engagement_profile(work_emotions: EmotionWindow) -> dict:
+        now = DateTimeHelper.get_current_epoch()
         emotion_engagement_profile = {
             "emotionEngagementProfile": {}
         }
-        if classified_facial_work_emotions:
+        if work_emotions.count(False, now):
             analyzed_facial_emotion_engagement, analyzed_mostly_engaging_facial_emotion = (
-                SubjectService.analyze_work_emotions(classified_facial_work_emotions)
+                SubjectService.analyze_work_emotions(work_emotions, False)
             )
             mostly_engaging_facial_emotion_record = {
                 "emotion": analyzed_mostly_engaging_facial_emotion,
@@ -257,9 +423,9 @@ class SubjectService:
                 mostly_engaging_facial_emotion_record
             )
 
-        if classified_sentimental_work_emotions:
+        if work_emotions.count(True, now):
             analyzed_sent_emotion_engagement, analyzed_mostly_engaging_sent_emotion = (
-                SubjectService.analyze_work_emotions(classified_sentimental_work_emotions)
+                SubjectService.analyze_work_emotions(work_emotions, True)
             )
             mostly_engaging_sent_emotion_record = {
                 "emotion": analyzed_mostly_engaging_sent_emotion,
@@ -277,30 +443,30 @@ class SubjectService:
             "emotionEngagementProfile"] else None
 
     @staticmethod
-    def create_special_consideration_request(request_message: str, org_key: str, subject_id: str) -> dict | None:
-        return SubjectApiHelper.request_for_special_consideration_inquiry(request_message, org_key, subject_id)
+    async def create_special_consideration_request(request_message: str, org_key: str,
+                                                   subject_id: str) -> dict | None:
+        return await asyncio.to_thread(SubjectApiHelper.request_for_special_consideration_inquiry, request_message,
+                                       org_key, subject_id)
 
     @staticmethod
-    def fetch_responded_special_consideration_requests(subject: dict, before_months: int = 1):
+    async def fetch_responded_special_consideration_requests(subject: DocumentLoader, before_months: int = 1):
+        await subject.load("specialConsiderationRequests")
         responded_requests = []
-        subtracted_iso_datetime = DateTimeHelper.subtract_iso_datetime(months=before_months)
-        subtracted_iso_datetime = DateTimeHelper.str_to_iso_datetime(subtracted_iso_datetime)
+        subtracted_epoch = DateTimeHelper.subtract_epoch(months=before_months)
         for request in subject["specialConsiderationRequests"]:
-            if request["response"] and DateTimeHelper.str_to_iso_datetime(
-                    request["respondedOn"]) >= subtracted_iso_datetime:
+            if request["response"] and DateTimeHelper.get_epoch(request, "respondedOn") >= subtracted_epoch:
                 responded_requests.append(request)
-        responded_requests.sort(key=lambda r: r["respondedOn"], reverse=True)
+        responded_requests.sort(key=lambda r: DateTimeHelper.get_epoch(r, "respondedOn"), reverse=True)
         return responded_requests
 
     @staticmethod
-    def remember_me(db_helper: DbHelper, subject_remember_me: SubjectRememberMe) -> dict | None:
-        if organization := db_helper.find_one(
-                {"orgKey": subject_remember_me.basic_remember_me.auth_key},
-                {"_id": False, "subjects": True},
+    async def remember_me(db_helper: AsyncDbHelper, subject_remember_me: SubjectRememberMe) -> dict | None:
+        if organization := await db_helper.find_one(
+                {
+                    "orgKey": subject_remember_me.basic_remember_me.auth_key,
+                    "subjects.authKey": subject_remember_me.sub_auth_key
+                },
+                {"_id": False, "subjects": {"$elemMatch": {"authKey": subject_remember_me.sub_auth_key}}},
                 collection="organizations"
         ):
-            subjects = organization["subjects"]
-
-            for subject in subjects:
-                if subject["authKey"] == subject_remember_me.sub_auth_key:
-                    return subject
+            return organization["subjects"][0]
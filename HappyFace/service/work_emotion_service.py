@@ -0,0 +1,115 @@
+import json
+from datetime import timedelta
+
+import pymongo
+
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from helper.datetime.date_time_helper import DateTimeHelper
+from helper.hash.hash_helper import HashHelper
+from helper.log.default.log_helper import LogHelper
+
+
+class WorkEmotionService:
+    COLLECTION = "work_emotions"
+    TIME_FIELD = "recordedOn"
+    META_FIELD = "meta"
+    GRANULARITY = "minutes"
+    SYNC_KEY = "syncKey"
+
+    @staticmethod
+    async def setup(db_helper: AsyncDbHelper, log_helper: LogHelper):
+        await db_helper.ensure_time_series_collection(
+            WorkEmotionService.COLLECTION,
+            WorkEmotionService.TIME_FIELD,
+            WorkEmotionService.META_FIELD,
+            WorkEmotionService.GRANULARITY,
+            log_helper
+        )
+
+    @staticmethod
+    def to_document(org_id: str, sub_id: str, work_emotion: dict) -> dict:
+        document = dict(work_emotion)
+        document[WorkEmotionService.META_FIELD] = {"orgId": org_id, "subjectId": sub_id}
+        if isinstance(recorded_on := work_emotion[WorkEmotionService.TIME_FIELD], str):
+            document[WorkEmotionService.TIME_FIELD] = DateTimeHelper.str_to_iso_datetime(recorded_on)
+        return document
+
+    @staticmethod
+    def with_sync_key(document: dict) -> dict:
+        document[WorkEmotionService.SYNC_KEY] = HashHelper.hash(
+            json.dumps(document, sort_keys=True, separators=(",", ":"), default=str)
+        )
+        return document
+
+    @staticmethod
+    def get_condition(org_id: str, sub_id: str | list[str] = None, since=None, min_accuracy: float = None,
+                      until=None) -> dict:
+        condition = {"meta.orgId": org_id}
+
+        if isinstance(sub_id, list):
+            condition["meta.subjectId"] = {"$in": sub_id}
+        elif sub_id is not None:
+            condition["meta.subjectId"] = sub_id
+        if since is not None:
+            condition[WorkEmotionService.TIME_FIELD] = {"$gte": since}
+        if until is not None:
+            condition.setdefault(WorkEmotionService.TIME_FIELD, {})["$lt"] = until
+        if min_accuracy is not None:
+            condition["accuracy"] = {"$gte": min_accuracy}
+        return condition
+
+    @staticmethod
+    async def insert_all(db_helper: AsyncDbHelper, documents: list[dict]) -> int:
+        if insertion := await db_helper.insert_all(documents, collection=WorkEmotionService.COLLECTION):
+            return len(insertion.inserted_ids)
+        return 0
+
+    @staticmethod
+    async def retrieve_all(db_helper: AsyncDbHelper, org_id: str, sub_id: str | list[str] = None, since=None,
+                           min_accuracy: float = None, project_vals: dict = None) -> list[dict]:
+        if project_vals is None:
+            project_vals = {"_id": False}
+        cursor = db_helper.find_all(
+            WorkEmotionService.get_condition(org_id, sub_id, since, min_accuracy),
+            project_vals,
+            sort=[(WorkEmotionService.TIME_FIELD, pymongo.ASCENDING)],
+            collection=WorkEmotionService.COLLECTION
+        )
+        return await cursor.to_list(length=None)
+
+    @staticmethod
+    async def retrieve_between(db_helper: AsyncDbHelper, org_id: str, sub_id: str | list[str] = None,
+                               ranges: list[tuple] = None, project_vals: dict = None) -> list[dict]:
+        condition = WorkEmotionService.get_condition(org_id, sub_id)
+        condition["$or"] = [
+            {WorkEmotionService.TIME_FIELD: {"$gte": since, "$lt": until}}
+            for since, until in ranges
+        ]
+        cursor = db_helper.find_all(condition, project_vals or {"_id": False},
+                                    sort=[(WorkEmotionService.TIME_FIELD, pymongo.ASCENDING)],
+                                    collection=WorkEmotionService.COLLECTION)
+        return await cursor.to_list(length=None)
+
+    @staticmethod
+    async def retrieve_sync_keys(db_helper: AsyncDbHelper, org_id: str, documents: list[dict]) -> set[str]:
+        if not documents:
+            return set()
+        recorded_ons = [document[WorkEmotionService.TIME_FIELD] for document in documents]
+        condition = WorkEmotionService.get_condition(
+            org_id,
+            list({document[WorkEmotionService.META_FIELD]["subjectId"] for document in documents}),
+            since=min(recorded_ons) - timedelta(milliseconds=1),
+            until=max(recorded_ons) + timedelta(milliseconds=1)
+        )
+        condition[WorkEmotionService.SYNC_KEY] = {
+            "$in": [document[WorkEmotionService.SYNC_KEY] for document in documents]
+        }
+        cursor = db_helper.find_all(condition, {"_id": False, WorkEmotionService.SYNC_KEY: True},
+                                    collection=WorkEmotionService.COLLECTION)
+        return {document[WorkEmotionService.SYNC_KEY] for document in await cursor.to_list(length=None)}
+
+    @staticmethod
+    async def delete_all(db_helper: AsyncDbHelper, org_id: str, sub_id: str = None) -> int:
+        deletion = await db_helper.delete_all(WorkEmotionService.get_condition(org_id, sub_id),
+                                              collection=WorkEmotionService.COLLECTION)
+        return deletion.deleted_count
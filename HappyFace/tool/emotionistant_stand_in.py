@@ -0,0 +1,57 @@
+import asyncio
+import sys
+
+import uvicorn
+from fastapi import FastAPI, Body, status
+from fastapi.responses import StreamingResponse
+
+app = FastAPI()
+app.chunk_delay = 0.1
+
+
+def compose_reply(query: str, organization_name: str, chat_history: list) -> str:
+    return (f"Thanks for reaching out to {organization_name}'s assistant. You asked: \"{query}\". "
+            f"This is reply number {len(chat_history) // 2 + 1} of our conversation, "
+            f"take a short break and let's talk it through.")
+
+
+@app.post("/happyface/v2/emotionistant/summary", status_code=status.HTTP_200_OK)
+async def summarize_profile(profile: dict = Body(..., embed=True)) -> dict:
+    return {"profileSummary": f"Profile with {len(profile)} section(s)"}
+
+
+@app.post("/happyface/v2/emotionistant/recommendation", status_code=status.HTTP_200_OK)
+async def recommend_profile(bio_data_profile: str = Body(None, alias="bioDataProfile"),
+                            emotion_engagement_profile: str = Body(None, alias="emotionEngagementProfile")) -> dict:
+    return {"profileRecommendation": f"{bio_data_profile}. {emotion_engagement_profile}."}
+
+
+@app.post("/happyface/v2/emotionistant/init-consultancy", status_code=status.HTTP_200_OK)
+async def init_consultancy(bio_data_profile: str = Body(None, alias="bioDataProfile"),
+                           emotion_engagement_profile: str = Body(None, alias="emotionEngagementProfile")) -> dict:
+    return {"emotionistant": "Hi, how are you feeling today?"}
+
+
+@app.post("/happyface/v2/emotionistant/query-consultancy", status_code=status.HTTP_200_OK)
+async def query_consultancy(query: str = Body(...), organization_name: str = Body(..., alias="organizationName"),
+                            chat_history: list = Body(..., alias="chatHistory")) -> dict:
+    return {"emotionistant": compose_reply(query, organization_name, chat_history)}
+
+
+@app.post("/happyface/v2/emotionistant/query-consultancy/stream", status_code=status.HTTP_200_OK)
+async def stream_query_consultancy(query: str = Body(...),
+                                   organization_name: str = Body(..., alias="organizationName"),
+                                   chat_history: list = Body(..., alias="chatHistory")) -> StreamingResponse:
+    async def stream_reply():
+        for index, word in enumerate(compose_reply(query, organization_name, chat_history).split(" ")):
+            await asyncio.sleep(app.chunk_delay)
+            yield f" {word}" if index else word
+
+    return StreamingResponse(stream_reply(), media_type="text/plain; charset=utf-8")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        app.chunk_delay = float(sys.argv[1])
+
+    uvicorn.run(app, port=5003)
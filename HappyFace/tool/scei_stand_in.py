@@ -0,0 +1,42 @@
+import random
+import sys
+
+import uvicorn
+from fastapi import FastAPI, Body, HTTPException, status
+
+app = FastAPI()
+app.sentimental_emotions = {}
+app.failure_rate = 0.0
+
+
+def fail_randomly():
+    if random.random() < app.failure_rate:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="scei stand-in failure")
+
+
+@app.put("/happyface/v2/scei/emotions", status_code=status.HTTP_200_OK)
+async def seed_sentimental_emotions(org_key: str = Body(..., alias="orgKey"),
+                                    entries: list[dict] = Body(...)) -> int:
+    app.sentimental_emotions.setdefault(org_key, []).extend(entries)
+    return len(app.sentimental_emotions[org_key])
+
+
+@app.post("/happyface/v2/scei/emotions", status_code=status.HTTP_200_OK)
+async def fetch_sentimental_emotions(org_key: str = Body(..., alias="orgKey", embed=True)) -> list[dict]:
+    fail_randomly()
+    if entries := app.sentimental_emotions.get(org_key):
+        return entries
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="sentimental emotions not available")
+
+
+@app.delete("/happyface/v2/scei/emotions", status_code=status.HTTP_200_OK)
+async def delete_sentimental_emotions(org_key: str = Body(..., alias="orgKey", embed=True)) -> int:
+    fail_randomly()
+    return len(app.sentimental_emotions.pop(org_key, []))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        app.failure_rate = float(sys.argv[1])
+
+    uvicorn.run(app, port=5004)
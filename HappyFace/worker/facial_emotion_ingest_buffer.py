@@ -0,0 +1,143 @@
+import asyncio
+
+from pymongo.errors import PyMongoError, BulkWriteError
+
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from helper.log.default.log_helper import LogHelper
+from service.emotion_window_service import EmotionWindowService
+from service.organization_service import OrganizationService
+from service.work_emotion_service import WorkEmotionService
+from worker.sentimental_emotion_sync_worker import SentimentalEmotionSyncWorker
+
+
+class FacialEmotionIngestBuffer:
+    MAX_FLUSH_ATTEMPTS = 3
+
+    def __init__(self, db_helper: AsyncDbHelper, emotion_window_service: EmotionWindowService,
+                 sentimental_emotion_sync_worker: SentimentalEmotionSyncWorker, log_helper: LogHelper,
+                 max_batch_size: int, max_delay: float, max_pending: int):
+        self.__db_helper = db_helper
+        self.__emotion_window_service = emotion_window_service
+        self.__sentimental_emotion_sync_worker = sentimental_emotion_sync_worker
+        self.__log_helper = log_helper
+        self.__max_batch_size = max_batch_size
+        self.__max_delay = max_delay
+        self.__max_pending = max_pending
+        self.__batches = {}
+        self.__locks = {}
+        self.__timers = set()
+        self.__pending = 0
+
+    async def submit(self, org_key: str, readings: list[tuple[str, dict]], durable: bool = False) -> dict:
+        size = len(readings)
+        while self.__pending and self.__pending + size > self.__max_pending:
+            await self.flush_all()
+
+        batch = self.get_batch(org_key)
+        batch["readings"].extend(readings)
+        batch["size"] += size
+        self.__pending += size
+        waiter = None
+
+        if durable:
+            waiter = asyncio.get_running_loop().create_future()
+            batch["waiters"].append(waiter)
+        if batch["size"] >= self.__max_batch_size:
+            await self.flush(org_key)
+
+        receipt = {"accepted": size, "buffered": self.__pending, "committed": None}
+        if waiter:
+            receipt["committed"] = await waiter
+        return receipt
+
+    def get_batch(self, org_key: str) -> dict:
+        if (batch := self.__batches.get(org_key)) is None:
+            batch = self.__batches[org_key] = {"readings": [], "size": 0, "waiters": [], "attempts": 0}
+            self.schedule(org_key, batch)
+        return batch
+
+    def requeue(self, org_key: str, batch: dict):
+        current = self.get_batch(org_key)
+        current["readings"][:0] = batch["readings"]
+        current["size"] += batch["size"]
+        current["waiters"].extend(batch["waiters"])
+        current["attempts"] = max(current["attempts"], batch["attempts"] + 1)
+        self.__pending += batch["size"]
+        batch["waiters"] = []
+
+    @staticmethod
+    def settle(batch: dict, outcome: int | BaseException | None):
+        for waiter in batch["waiters"]:
+            if not waiter.done():
+                if isinstance(outcome, BaseException):
+                    waiter.set_exception(outcome)
+                else:
+                    waiter.set_result(outcome)
+
+    def schedule(self, org_key: str, batch: dict):
+        timer = asyncio.create_task(self.flush_later(org_key, batch))
+        self.__timers.add(timer)
+        timer.add_done_callback(self.__timers.discard)
+
+    async def flush_later(self, org_key: str, batch: dict):
+        await asyncio.sleep(self.__max_delay)
+        if self.__batches.get(org_key) is batch:
+            await self.flush(org_key)
+
+    async def flush(self, org_key: str):
+        async with self.__locks.setdefault(org_key, asyncio.Lock()):
+            if (batch := self.__batches.pop(org_key, None)) is None:
+                return
+            self.__pending -= batch["size"]
+            outcome = None
+            retryable = True
+
+            try:
+                facial_documents = await OrganizationService.get_facial_documents(self.__db_helper, org_key,
+                                                                                  batch["readings"])
+                if facial_documents is None:
+                    self.__log_helper.log_error_message(
+                        f"[FacialEmotionIngestBuffer] Dropped {batch['size']} work emotion(s) of unknown organization"
+                    )
+                else:
+                    org_id, documents = facial_documents
+                    retryable = False
+                    try:
+                        await WorkEmotionService.insert_all(self.__db_helper, documents)
+                    except BulkWriteError as e:
+                        retryable = e.details.get("nInserted") == 0
+                        raise
+                    await OrganizationService.record_work_emotions(self.__db_helper, self.__emotion_window_service,
+                                                                   org_id, documents)
+                    outcome = len(documents)
+                    self.__sentimental_emotion_sync_worker.notify(org_key)
+                    self.__log_helper.log_info_message(
+                        f"[FacialEmotionIngestBuffer] Flushed {outcome} of {batch['size']} work emotion(s) successfully"
+                    )
+            except PyMongoError as e:
+                outcome = e
+                self.__log_helper.log_error_message(
+                    f"[FacialEmotionIngestBuffer] Flush failed (attempt {batch['attempts'] + 1}): {e}"
+                )
+                if retryable and batch["attempts"] + 1 < FacialEmotionIngestBuffer.MAX_FLUSH_ATTEMPTS:
+                    self.requeue(org_key, batch)
+                else:
+                    self.__log_helper.log_error_message(
+                        f"[FacialEmotionIngestBuffer] Dropped {batch['size']} work emotion(s) after a failed flush"
+                    )
+            except BaseException as e:
+                outcome = e
+                raise
+            finally:
+                FacialEmotionIngestBuffer.settle(batch, outcome)
+
+    async def flush_all(self):
+        await asyncio.gather(*(self.flush(org_key) for org_key in list(self.__batches)))
+
+    async def stop(self):
+        while self.__batches:
+            await self.flush_all()
+        for timer in list(self.__timers):
+            timer.cancel()
+
+        self.__log_helper.log_info_message("[FacialEmotionIngestBuffer] Stopped successfully")
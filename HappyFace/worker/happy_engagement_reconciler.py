@@ -0,0 +1,45 @@
+import asyncio
+
+from pymongo.errors import PyMongoError
+
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from helper.log.default.log_helper import LogHelper
+from service.happy_engagement_service import HappyEngagementService
+
+
+class HappyEngagementReconciler:
+    def __init__(self, db_helper: AsyncDbHelper, log_helper: LogHelper, interval: int):
+        self.__db_helper = db_helper
+        self.__log_helper = log_helper
+        self.__interval = interval
+        self.__task = None
+
+    def start(self):
+        self.__task = asyncio.create_task(self.run())
+
+        self.__log_helper.log_info_message("[HappyEngagementReconciler] Started successfully")
+
+    async def stop(self):
+        if self.__task:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+
+            self.__log_helper.log_info_message("[HappyEngagementReconciler] Stopped successfully")
+
+    async def run(self):
+        while True:
+            try:
+                reconciled = await HappyEngagementService.reconcile(self.__db_helper)
+
+                self.__log_helper.log_info_message(
+                    f"[HappyEngagementReconciler] Reconciled {reconciled} organization(s) successfully"
+                )
+            except PyMongoError as e:
+                self.__log_helper.log_error_message(f"[HappyEngagementReconciler] Reconciliation failed: {e}")
+            except Exception as e:
+                self.__log_helper.log_error_message(f"[HappyEngagementReconciler] Reconciliation failed: {e!r}")
+            await asyncio.sleep(self.__interval)
@@ -0,0 +1,114 @@
+import asyncio
+from typing import Any, Callable
+
+from pymongo.errors import PyMongoError
+from requests import RequestException
+
+from helper.api.organization_api_helper import OrganizationApiHelper
+from helper.database.mongodb.async_db_helper import AsyncDbHelper
+from helper.log.default.log_helper import LogHelper
+from service.emotion_window_service import EmotionWindowService
+from service.organization_service import OrganizationService
+
+
+class SentimentalEmotionSyncWorker:
+    def __init__(self, db_helper: AsyncDbHelper, emotion_window_service: EmotionWindowService, log_helper: LogHelper,
+                 interval: float, batch_size: int, max_retries: int, retry_delay: float):
+        self.__db_helper = db_helper
+        self.__emotion_window_service = emotion_window_service
+        self.__log_helper = log_helper
+        self.__interval = interval
+        self.__batch_size = batch_size
+        self.__max_retries = max_retries
+        self.__retry_delay = retry_delay
+        self.__org_keys = set()
+        self.__task = None
+
+    def notify(self, org_key: str):
+        self.__org_keys.add(org_key)
+
+    def start(self):
+        self.__task = asyncio.create_task(self.run())
+
+        self.__log_helper.log_info_message("[SentimentalEmotionSyncWorker] Started successfully")
+
+    async def stop(self):
+        if self.__task:
+            self.__task.cancel()
+            try:
+                await self.__task
+            except asyncio.CancelledError:
+                pass
+            self.__task = None
+
+            self.__log_helper.log_info_message("[SentimentalEmotionSyncWorker] Stopped successfully")
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(self.__interval)
+            if self.__org_keys:
+                try:
+                    synced = await self.sync_all()
+
+                    self.__log_helper.log_info_message(
+                        f"[SentimentalEmotionSyncWorker] Synced {synced} sentimental work emotion(s) successfully"
+                    )
+                except Exception as e:
+                    self.__log_helper.log_error_message(f"[SentimentalEmotionSyncWorker] Sync failed: {e!r}")
+
+    async def sync_all(self) -> int:
+        org_keys = list(self.__org_keys)
+        self.__org_keys.clear()
+        synced = 0
+
+        for start in range(0, len(org_keys), self.__batch_size):
+            synced += sum(
+                await asyncio.gather(*(self.sync(org_key) for org_key in org_keys[start:start + self.__batch_size]))
+            )
+        return synced
+
+    async def retry(self, operation: Callable, *args) -> Any:
+        for attempt in range(self.__max_retries + 1):
+            try:
+                return await operation(*args)
+            except (RequestException, PyMongoError) as e:
+                self.__log_helper.log_error_message(
+                    f"[SentimentalEmotionSyncWorker] {operation.__name__} failed (attempt {attempt + 1}): {e}"
+                )
+                if attempt == self.__max_retries:
+                    raise
+                await asyncio.sleep(self.__retry_delay * 2 ** attempt)
+
+    async def sync(self, org_key: str) -> int:
+        try:
+            if not (sentimental_emotions := await self.retry(self.fetch, org_key)):
+                return 0
+            inserted = await self.retry(
+                OrganizationService.insert_sentimental_work_emotion_entries,
+                self.__db_helper,
+                self.__emotion_window_service,
+                org_key,
+                sentimental_emotions
+            )
+        except (RequestException, PyMongoError):
+            self.notify(org_key)
+            return 0
+        except (KeyError, TypeError, ValueError) as e:
+            self.__log_helper.log_error_message(
+                f"[SentimentalEmotionSyncWorker] Skipped malformed sentimental emotions of organization: {e}"
+            )
+            return 0
+
+        try:
+            await self.retry(self.delete, org_key)
+        except RequestException:
+            self.notify(org_key)
+        return inserted or 0
+
+    @staticmethod
+    async def fetch(org_key: str) -> list | None:
+        return await asyncio.to_thread(OrganizationApiHelper.get_organizational_sentimental_emotions, org_key)
+
+    @staticmethod
+    async def delete(org_key: str) -> int | None:
+        return await asyncio.to_thread(OrganizationApiHelper.delete_organizational_sentimental_emotions, org_key)